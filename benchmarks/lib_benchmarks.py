@@ -0,0 +1,323 @@
+'''
+Module Name:'lib_benchmarks'
+Path:'<package_root>/benchmarks/lib_benchmarks.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This script benchmarks every public function and class of psychro.lib and \
+    writes the results as JSON. The scalar functions are timed per call (latency) in \
+    temperature bands, at several relative humidities, pressures and units; every case \
+    cycles over a few states of its band. The construction of Temperature, Pressure and \
+    PsychroState objects is timed for every unit, also together with a function call. \
+    The array functions and PsychroStateArray are timed over arrays of random states \
+    (throughput in states/s). The command compare reads two result files (baseline and \
+    current) and flags the cases slower than the baseline by more than the threshold; \
+    it exits with status 1 on any regression. Every case is timed by the best of \
+    --repeat runs of at least --min-time seconds; all calls run with the error policy \
+    'nan' and the number of invalid results of every case is written.'
+Usage:
+    python benchmarks/lib_benchmarks.py run [-o results.json] [--quick] [-k wetBulb]
+    python benchmarks/lib_benchmarks.py compare baseline.json results.json [--threshold 0.25]
+    python benchmarks/lib_benchmarks.py list
+'''
+import sys, os, time, json, math, platform, argparse, datetime, inspect
+import numpy as np
+# the package root, so that 'python benchmarks/<script>.py' finds psychro without installation
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import psychro.lib as lib
+from psychro.lib import Temperature, Pressure, PsychroState, PsychroStateArray, TemperatureArray, PressureArray
+
+# temperature bands (C), relative humidities (%) and pressures (Pa) of the scalar cases;
+# every case is (band, relative humidity, pressure) and varies one of them from the middle
+temperature_bands={'low':(5.0,20.0),'mid':(20.0,40.0),'high':(40.0,80.0)}
+rh_levels=[10.0,50.0,90.0]
+pressure_levels=[80000.0,101325.0,120000.0]
+# units of the unit cases: (temperature unit, pressure unit)
+unit_pairs=[('C','Pa'),('K','kPa'),('F','psi'),('C','atm'),('C','mmHg')]
+# states per scalar case, states per array case
+scalar_states=8
+batch_states=100000
+
+# arguments of the scalar functions of lib: T temperature, rh relative humidity, P pressure,
+# Pv vapor pressure, Td dew point
+scalar_functions={'satVaporPressure':'T','satTemperature':'Pv','dryAirPressure':'T','humidAirPressure':'T,rh',\
+    'dewPoint':'T,rh','saturatedTemperature':'T,rh','partialPressure':'T,rh','relativeHumidity':'T,Td',\
+    'moleFraction':'T,rh,P','absoluteHumidity':'T,rh,P','moistureContent':'T,rh,P','humidityRatio':'T,rh,P',\
+    'specificHumidity':'T,rh,P','massFraction':'T,rh,P','volumetricHumidity':'T,rh,P','vaporDensity':'T,rh,P',\
+    'humidVolume':'T,rh,P','humidDensity':'T,rh,P','humidMolarMass':'T,rh,P','wetBulbTemperature':'T,rh,P',\
+    'humidSaturationEnthalpy':'T,P','humidAirEnthalpy':'T,rh,P','directEnthalpy':'T,rh,P',\
+    'dryAirEnthalpy':'T,P','waterVaporEnthalpy':'T,rh,P'}
+# array functions of lib and the properties of PsychroStateArray timed over arrays
+array_functions=['satVaporPressureArray','satTemperatureArray','wetBulbTemperatureArray','wetBulbSeries',\
+    'humidSaturationEnthalpyArray','directEnthalpyArray','humidityErrorCodes','solveState']
+state_array_properties=['dewPoint','humidityRatio','humidVolume','wetBulbTemperature','humidAirEnthalpy',\
+    'directEnthalpy','dryAirEnthalpy','waterVaporEnthalpy']
+# setting functions of lib, timed once per call
+setting_functions={'getSaturationBackend':(),'setSaturationBackend':('antoine',),'saturationBackend':('antoine',),\
+    'getErrorPolicy':(),'setErrorPolicy':('nan',),'errorPolicy':('nan',),'enthalpyCacheInfo':(),\
+    'clearEnthalpyCache':()}
+# setting functions which return a context manager
+context_functions=['saturationBackend','errorPolicy']
+# classes of lib timed by the construction cases
+classes=['Temperature','Pressure','PsychroState','TemperatureArray','PressureArray','PsychroStateArray']
+
+
+# bandStates() returns n evenly spaced temperatures (C) of the band
+def bandStates(band, n=scalar_states):
+    (lo,hi)=temperature_bands[band]
+    return [lo+(hi-lo)*(k+0.5)/n for k in range(n)]
+
+
+# toUnit() returns the value (C or Pa) in the unit
+def toUnit(value, unit):
+    factors={'Pa':1.0,'kPa':1000.0,'atm':101325.0,'psi':6894.733261,'mmHg':133.322368421}
+    if unit=='K': return value+273.15
+    elif unit=='F': return value*1.8+32
+    elif unit=='C': return value
+    return value/factors[unit]
+
+
+# scalarArguments() returns the argument tuples of the function at the states of temperatures t
+def scalarArguments(name, t, rh, p, tempUnit='C', pressureUnit='Pa'):
+    args=[]
+    for tc in t:
+        (temperature,pressure)=(Temperature(toUnit(tc,tempUnit),tempUnit),Pressure(toUnit(p,pressureUnit),pressureUnit))
+        values={'T':temperature,'rh':rh,'P':pressure}
+        pattern=scalar_functions[name].split(',')
+        if 'Pv' in pattern: values['Pv']=lib.satVaporPressure(temperature)
+        if 'Td' in pattern: values['Td']=lib.dewPoint(temperature,rh)
+        args.append(tuple(values[k] for k in pattern))
+    return args
+
+
+# invalidCount() returns the number of invalid (None or NaN) results of the calls
+def invalidCount(fn, args):
+    count=0
+    for a in args:
+        r=fn(*a)
+        r=r[0] if isinstance(r,tuple) else r
+        if r is None or (isinstance(r,float) and math.isnan(r)): count+=1
+    return count
+
+
+# timeCall() returns (best, median) seconds of one call of fn() of runs of at least minTime
+# seconds; fn() does `number` calls
+def timeCall(fn, number=1, minTime=0.1, repeat=5):
+    loops=1
+    while True:
+        start=time.perf_counter()
+        for i in range(loops): fn()
+        elapsed=time.perf_counter()-start
+        if elapsed>=minTime or loops>=1<<20: break
+        loops=max(loops*2,int(loops*minTime/max(elapsed,1e-9)*1.1))
+    times=[elapsed/loops]
+    for r in range(repeat-1):
+        start=time.perf_counter()
+        for i in range(loops): fn()
+        times.append((time.perf_counter()-start)/loops)
+    return (min(times)/number,float(np.median(times))/number)
+
+
+# scalarCases() returns the scalar cases {case: (function, argument tuples, parameters)}
+def scalarCases():
+    cases={}
+    for name in scalar_functions:
+        (fn,pattern)=(getattr(lib,name),scalar_functions[name].split(','))
+        # relative humidity and pressure are varied only for the functions which take them
+        pairs=unit_pairs if 'P' in pattern else [pair for pair in unit_pairs if pair[1]=='Pa']+[('K','Pa'),('F','Pa')]
+        grid=[(band,50.0,101325.0,'C','Pa') for band in temperature_bands]
+        grid+=[('mid',rh,101325.0,'C','Pa') for rh in rh_levels if rh!=50.0 and ('rh' in pattern or 'Td' in pattern)]
+        grid+=[('mid',50.0,p,'C','Pa') for p in pressure_levels if p!=101325.0 and 'P' in pattern]
+        grid+=[('mid',50.0,101325.0,tu,pu) for (tu,pu) in dict.fromkeys(pairs) if (tu,pu)!=('C','Pa')]
+        for (band,rh,p,tu,pu) in grid:
+            params={'band':band,'relHumidity':rh,'pressure':p,'tempUnit':tu,'pressureUnit':pu}
+            case='scalar/{0:s}/{1:s}/rh{2:g}/p{3:g}/{4:s}-{5:s}'.format(name,band,rh,p,tu,pu)
+            cases[case]=(fn,scalarArguments(name,bandStates(band),rh,p,tu,pu),params)
+    return cases
+
+
+# constructionCases() returns the cases of the construction of the objects in every unit
+# {case: (function of no arguments, parameters)}
+def constructionCases():
+    cases={}
+    t=bandStates('mid')
+    for unit in ['C','K','F','cC']:
+        values=[toUnit(x,unit[-1]) for x in t]
+        cases['construct/Temperature/'+unit]=(lambda v=values,u=unit: [Temperature(x,u) for x in v],{'tempUnit':unit})
+    for unit in ['Pa','kPa','atm','mmHg','psi','bar','torr']:
+        value=toUnit(101325.0,unit) if unit not in ['bar','torr'] else {'bar':1.01325,'torr':760.0}[unit]
+        cases['construct/Pressure/'+unit]=(lambda v=value,u=unit: [Pressure(v,u) for k in range(scalar_states)],{'pressureUnit':unit})
+    temperatures=[Temperature(x,'C') for x in t]; pressure=Pressure(101325.0,'Pa')
+    cases['construct/PsychroState/C-Pa']=(lambda: [PsychroState(x,50,pressure) for x in temperatures],{})
+    for (tu,pu) in unit_pairs:
+        (values,pv)=([toUnit(x,tu) for x in t],toUnit(101325.0,pu))
+        cases['construct+call/absoluteHumidity/'+tu+'-'+pu]=(lambda v=values,p=pv,tu=tu,pu=pu: \
+            [lib.absoluteHumidity(Temperature(x,tu),50,Pressure(p,pu)) for x in v],{'tempUnit':tu,'pressureUnit':pu})
+    return cases
+
+
+# batchStates() returns the random states (t (C), rh (%), p (Pa)) of the band
+def batchStates(band, n, p=101325.0, seed=0):
+    rng=np.random.default_rng(seed)
+    (lo,hi)=temperature_bands[band]
+    return (rng.uniform(lo,hi,n),rng.uniform(10,100,n),np.full(n,p))
+
+
+# batchCases() returns the array cases {case: (function of no arguments, states, parameters)}
+def batchCases(n=batch_states):
+    cases={}
+    for band in temperature_bands:
+        for p in [101325.0]+([80000.0] if band=='mid' else []):
+            (t,rh,pa)=batchStates(band,n,p)
+            state=PsychroStateArray(t,rh,pa)
+            (twb,h)=(state.wetBulbTemperature()[0],state.humidAirEnthalpy()[0])
+            satp=lib.satVaporPressureArray(t)[0]
+            params={'band':band,'pressure':p,'states':n}
+            key='/{0:s}/p{1:g}'.format(band,p)
+            calls={'satVaporPressureArray':lambda: lib.satVaporPressureArray(t),\
+                'satTemperatureArray':lambda: lib.satTemperatureArray(satp),\
+                'wetBulbTemperatureArray':lambda: lib.wetBulbTemperatureArray(t,rh,pa),\
+                'humidSaturationEnthalpyArray':lambda: lib.humidSaturationEnthalpyArray(t,pa),\
+                'directEnthalpyArray':lambda: lib.directEnthalpyArray(t,rh,pa),\
+                'humidityErrorCodes':lambda: lib.humidityErrorCodes(t,rh,pa),\
+                'solveState':lambda: lib.solveState({'temperature':t,'wetBulbTemperature':twb},pa),\
+                'solveState(h,rh)':lambda: lib.solveState({'humidAirEnthalpy':h,'relHumidity':rh},pa),\
+                'PsychroStateArray':lambda: PsychroStateArray(t,rh,pa)}
+            for name in state_array_properties:
+                calls['PsychroStateArray.'+name]=lambda name=name: getattr(PsychroStateArray(t,rh,pa),name)()
+            for (name,call) in calls.items(): cases['batch/'+name+key]=(call,params)
+    (t,rh,pa)=batchStates('mid',n)
+    (tf,pk)=(t*1.8+32,pa/1000)
+    cases['batch/wetBulbTemperatureArray/mid/F-kPa']=(lambda: lib.wetBulbTemperatureArray(tf,rh,pk,'F','kPa'),\
+        {'band':'mid','pressure':101325.0,'states':n,'tempUnit':'F','pressureUnit':'kPa'})
+    cases['batch/TemperatureArray+PressureArray/mid/F-kPa']=(lambda: lib.directEnthalpyArray(TemperatureArray(tf,'F'),\
+        rh,PressureArray(pk,'kPa')),{'band':'mid','states':n,'tempUnit':'F','pressureUnit':'kPa'})
+    # time series of 100 channels as random walks of the mid band (samples, channels)
+    rng=np.random.default_rng(0); shape=(max(n//100,1),100)
+    ts=np.clip(30+np.cumsum(rng.normal(0,0.5,shape),axis=0),20,40)
+    rhs=np.clip(50+np.cumsum(rng.normal(0,1.5,shape),axis=0),10,100)
+    cases['batch/wetBulbSeries/mid/p101325']=(lambda: lib.wetBulbSeries(ts,rhs,101325.0),\
+        {'band':'mid','pressure':101325.0,'states':ts.size,'channels':shape[1]})
+    return cases
+
+
+# contextCall() returns the function entering and leaving the context of fn(*args)
+def contextCall(fn, args):
+    def call():
+        with fn(*args): pass
+    return call
+
+
+# coverage() returns the public functions and classes of lib and those without a case
+def coverage():
+    public=[name for (name,value) in inspect.getmembers(lib) if not name.startswith('_') and \
+        (inspect.isfunction(value) or inspect.isclass(value))]
+    covered=set(scalar_functions)|set(array_functions)|set(setting_functions)|set(classes)
+    return (public,[name for name in public if name not in covered])
+
+
+# run() runs the selected cases and returns the results as a dict
+def run(minTime=0.1, repeat=5, n=batch_states, keyword=None, echo=True):
+    selected=lambda case: keyword is None or keyword in case
+    results={}
+    def record(case, kind, best, median, number, params, invalid=None):
+        entry={'kind':kind,'best':best,'median':median,'params':params}
+        if kind=='batch': entry['states_per_second']=params['states']/best
+        else: entry['calls_per_second']=1/best
+        if invalid is not None: entry['invalid']=invalid
+        results[case]=entry
+        if echo: print('{0:<64s}{1:>14.3f} us{2:>20s}'.format(case,best*1e6,\
+            '{0:.0f} states/s'.format(entry['states_per_second']) if kind=='batch' else ''))
+    with lib.errorPolicy('nan'):
+        for (case,(fn,args,params)) in scalarCases().items():
+            if not selected(case): continue
+            (best,median)=timeCall(lambda: [fn(*a) for a in args],len(args),minTime,repeat)
+            record(case,'scalar',best,median,len(args),params,invalidCount(fn,args))
+        for (case,(fn,params)) in constructionCases().items():
+            if not selected(case): continue
+            (best,median)=timeCall(fn,scalar_states,minTime,repeat)
+            record(case,'scalar',best,median,scalar_states,params)
+        for (case,(fn,params)) in batchCases(n).items():
+            if not selected(case): continue
+            (best,median)=timeCall(fn,1,minTime,repeat)
+            record(case,'batch',best,median,1,params)
+        for (name,args) in setting_functions.items():
+            case='setting/'+name
+            if not selected(case): continue
+            fn=getattr(lib,name)
+            (best,median)=timeCall(contextCall(fn,args) if name in context_functions else lambda: fn(*args),1,minTime,repeat)
+            record(case,'scalar',best,median,1,{})
+    return results
+
+
+# metadata() returns the description of the machine and the versions
+def metadata(args):
+    return {'date':datetime.datetime.now().isoformat(timespec='seconds'),'python':platform.python_version(),\
+        'implementation':platform.python_implementation(),'numpy':np.__version__,'platform':platform.platform(),\
+        'machine':platform.machine(),'processor':platform.processor(),'psychro':lib.__version__,\
+        'saturation_backend':lib.getSaturationBackend(),'min_time':args.min_time,'repeat':args.repeat,\
+        'batch_states':args.states}
+
+
+# compare() prints the cases of the current results against the baseline and returns the
+# number of regressions: cases whose best time is more than threshold slower
+def compare(baseline, current, threshold=0.25):
+    (old,new)=(baseline['results'],current['results'])
+    regressions=0
+    print('{0:<64s}{1:>14s}{2:>14s}{3:>10s}'.format('case','baseline (us)','current (us)','ratio'))
+    for case in sorted(set(old)&set(new)):
+        ratio=new[case]['best']/old[case]['best']
+        flag=''
+        if ratio>1+threshold: flag='  REGRESSION'; regressions+=1
+        elif ratio<1/(1+threshold): flag='  faster'
+        print('{0:<64s}{1:>14.3f}{2:>14.3f}{3:>10.2f}{4:s}'.format(case,old[case]['best']*1e6,new[case]['best']*1e6,ratio,flag))
+    for case in sorted(set(old)-set(new)): print('{0:<64s} missing in the current results'.format(case))
+    for case in sorted(set(new)-set(old)): print('{0:<64s} new case'.format(case))
+    changed=[case for case in set(old)&set(new) if old[case].get('invalid')!=new[case].get('invalid')]
+    for case in sorted(changed): print('{0:<64s} invalid results {1} -> {2}'.format(case,old[case].get('invalid'),new[case].get('invalid')))
+    print('{0:d} cases, {1:d} regressions (threshold {2:.0%})'.format(len(set(old)&set(new)),regressions,threshold))
+    return regressions
+
+
+# main() parses the command line arguments and runs the command
+def main(argv=None):
+    parser=argparse.ArgumentParser(prog='lib_benchmarks.py',description='Benchmarks of the functions of psychro.lib')
+    commands=parser.add_subparsers(dest='command')
+    parser_run=commands.add_parser('run',help='run the benchmarks and write the results as JSON')
+    parser_run.add_argument('-o','--output',default=None,help='JSON file of the results (default: standard output)')
+    parser_run.add_argument('-k','--keyword',default=None,help='run only the cases with the keyword in the name')
+    parser_run.add_argument('--min-time',type=float,default=0.1,help='minimum seconds of every timed run (default: 0.1)')
+    parser_run.add_argument('--repeat',type=int,default=5,help='timed runs of every case (default: 5)')
+    parser_run.add_argument('--states',type=int,default=batch_states,help='states of the array cases (default: 100000)')
+    parser_run.add_argument('--quick',action='store_true',help='--min-time 0.02 --repeat 3 --states 10000')
+    parser_compare=commands.add_parser('compare',help='compare results with a baseline and flag regressions')
+    parser_compare.add_argument('baseline',help='JSON file of the baseline results')
+    parser_compare.add_argument('current',help='JSON file of the current results')
+    parser_compare.add_argument('--threshold',type=float,default=0.25,help='slow down flagged as regression (default: 0.25)')
+    commands.add_parser('list',help='list the public functions of psychro.lib and the uncovered ones')
+    args=parser.parse_args(argv)
+    if args.command=='run':
+        if args.quick: (args.min_time,args.repeat,args.states)=(0.02,3,10000)
+        (public,uncovered)=coverage()
+        if uncovered: sys.stderr.write('not benchmarked: '+', '.join(uncovered)+'\n')
+        echo=args.output is not None
+        results=run(args.min_time,args.repeat,args.states,args.keyword,echo)
+        report={'meta':metadata(args),'uncovered':uncovered,'results':results}
+        if args.output is None: json.dump(report,sys.stdout,indent=1); sys.stdout.write('\n')
+        else:
+            with open(args.output,'w') as f: json.dump(report,f,indent=1)
+    elif args.command=='compare':
+        with open(args.baseline) as f: baseline=json.load(f)
+        with open(args.current) as f: current=json.load(f)
+        return 1 if compare(baseline,current,args.threshold) else 0
+    elif args.command=='list':
+        (public,uncovered)=coverage()
+        print('public: '+', '.join(public)); print('not benchmarked: '+(', '.join(uncovered) or 'none'))
+    else: parser.print_help()
+    return 0
+
+
+if __name__=='__main__':
+    sys.exit(main())
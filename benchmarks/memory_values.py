@@ -0,0 +1,55 @@
+'''
+Module Name:'memory_values'
+Path:'<package_root>/benchmarks/memory_values.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This script measures the memory (bytes per instance) of Pressure and \
+    Temperature objects held in a list, as in a replay of historical sensor data. \
+    The memory is traced by tracemalloc; the list itself is not counted.'
+Usage:
+    python benchmarks/memory_values.py [number of instances]
+'''
+import sys, os, gc, tracemalloc
+# the package root, so that 'python benchmarks/<script>.py' finds psychro without installation
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from psychro.lib import Pressure, Temperature
+
+
+# bytesPerInstance() returns the traced bytes per instance of n objects made by make(i)
+def bytesPerInstance(make, n=100000):
+    values=[None]*n
+    gc.collect(); tracemalloc.start()
+    before=tracemalloc.get_traced_memory()[0]
+    for i in range(n): values[i]=make(i)
+    after=tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after-before)/n
+
+
+# BaselinePressure keeps the attributes of the baseline Pressure object in its __dict__
+class BaselinePressure:
+    def __init__(self, value, unit='Pa', is_absolute=True):
+        self.__unit_prefix=1; self.__unit=unit; self.__physical_type='PRESSURE'
+        self.__value=value*self.__unit_prefix; self.__isAbsolute=is_absolute
+
+
+# BaselineTemperature keeps the attributes of the baseline Temperature object in its __dict__
+class BaselineTemperature:
+    def __init__(self, value, unit='C'):
+        self.__unit_prefix=1; self.__unit=unit; self.__physical_type='TEMPERATURE'
+        self.__value=value*self.__unit_prefix
+
+
+if __name__=='__main__':
+    n=int(sys.argv[1]) if len(sys.argv)>1 else 100000
+    cases=[("Pressure(float,'Pa')",lambda i: BaselinePressure(101325.0+i,'Pa'),lambda i: Pressure(101325.0+i,'Pa')),
+        ("Pressure(float,'kPa')",lambda i: BaselinePressure(100.0+i*1e-3,'kPa'),lambda i: Pressure(100.0+i*1e-3,'kPa')),
+        ("Temperature(float,'C')",lambda i: BaselineTemperature(25.0+i*1e-5,'C'),lambda i: Temperature(25.0+i*1e-5,'C')),
+        ("Temperature(float,'K')",lambda i: BaselineTemperature(298.15+i*1e-5,'K'),lambda i: Temperature(298.15+i*1e-5,'K'))]
+    print('{0:<26s}{1:>16s}{2:>16s}{3:>10s}'.format('Object','before (bytes)','after (bytes)','saved'))
+    for (name,baseline,make) in cases:
+        (before,after)=(bytesPerInstance(baseline,n),bytesPerInstance(make,n))
+        print('{0:<26s}{1:>16.1f}{2:>16.1f}{3:>9.0f}%'.format(name,before,after,100*(before-after)/before))
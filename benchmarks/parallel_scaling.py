@@ -0,0 +1,48 @@
+'''
+Module Name:'parallel_scaling'
+Path:'<package_root>/benchmarks/parallel_scaling.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This script measures the time of map_states() of psychro.parallel for 1, 2, \
+    4, ... workers up to the number of CPUs and prints the speed up against one worker. \
+    The pool of every number of workers is started (warmed) before it is timed.'
+Usage:
+    python benchmarks/parallel_scaling.py [number of states] [properties]
+'''
+import sys, os, time
+import numpy as np
+# the package root, so that 'python benchmarks/<script>.py' finds psychro without installation
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import psychro.parallel as par
+
+
+# timeStates() returns the best time (s) of map_states() of the rows with the workers
+def timeStates(rows, properties, workers, repeat=3):
+    par.map_states(rows[:2000],properties,workers=workers,chunksize=500) # warm up the pool
+    best=float('inf')
+    for k in range(repeat):
+        start=time.perf_counter(); par.map_states(rows,properties,workers=workers)
+        best=min(best,time.perf_counter()-start)
+    return best
+
+
+if __name__=='__main__':
+    n=int(sys.argv[1]) if len(sys.argv)>1 else 200000
+    properties=sys.argv[2].split(',') if len(sys.argv)>2 else ['dewPoint','wetBulbTemperature','humidAirEnthalpy']
+    rng=np.random.default_rng(0)
+    rows=np.column_stack([rng.uniform(0,60,n),rng.uniform(5,100,n),rng.uniform(90000,105000,n)])
+    cpus=os.cpu_count() or 1
+    counts=[1]
+    while counts[-1]*2<=cpus: counts.append(counts[-1]*2)
+    if counts[-1]!=cpus: counts.append(cpus)
+    print('{0:d} states, {1:s}, {2:d} CPUs'.format(n,','.join(properties),cpus))
+    print('{0:>8s}{1:>12s}{2:>16s}{3:>10s}'.format('workers','time (s)','states/s','speed up'))
+    base=None
+    for workers in counts:
+        seconds=timeStates(rows,properties,workers)
+        if base is None: base=seconds
+        print('{0:>8d}{1:>12.3f}{2:>16.0f}{3:>10.2f}'.format(workers,seconds,n/seconds,base/seconds))
+    par.shutdown()
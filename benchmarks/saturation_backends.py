@@ -0,0 +1,80 @@
+'''
+Module Name:'saturation_backends'
+Path:'<package_root>/benchmarks/saturation_backends.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This script compares the saturation backends of psychro (see \
+    setSaturationBackend()). For every backend it prints the time in nanoseconds per \
+    evaluation of the saturated vapor pressure (C -> mmHg) and of the saturated temperature \
+    (mHg -> C), by the scalar functions (per call) and by the array functions (per element), \
+    and the error against IAPWS-IF97 over 0-150 C: the largest relative error of the vapor \
+    pressure, the largest error (C) of the saturated temperature at the IAPWS-IF97 vapor \
+    pressure and the largest round trip error (C) of the backend itself.'
+Usage:
+    python benchmarks/saturation_backends.py [array size] [grid step in C]
+'''
+import sys, os, time
+import numpy as np
+# the package root, so that 'python benchmarks/<script>.py' finds psychro without installation
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import psychro.src.psychro_functions as psyf
+import psychro.src.psychro_arrays as psya
+import psychro.src.saturation_correlations as correlations
+
+
+# bestTime() returns the best time (s) of one call of fn(argument) in runs of at least minTime seconds
+def bestTime(fn, argument, minTime=0.05, repeat=5):
+    loops=1
+    while True:
+        start=time.perf_counter()
+        for k in range(loops): fn(argument)
+        elapsed=time.perf_counter()-start
+        if elapsed>=minTime: break
+        loops=max(loops*2,int(loops*minTime/max(elapsed,1e-9)*1.1))
+    best=elapsed/loops
+    for r in range(repeat-1):
+        start=time.perf_counter()
+        for k in range(loops): fn(argument)
+        best=min(best,(time.perf_counter()-start)/loops)
+    return best
+
+
+# scalarTime() returns the nanoseconds per call of fn over the values
+def scalarTime(fn, values):
+    def calls(values):
+        for x in values: fn(x)
+    return bestTime(calls,values)/len(values)*1e9
+
+
+# errors() returns (largest relative error of vapor pressure, largest error (C) of saturated
+# temperature, largest round trip error (C)) of the backend against IAPWS-IF97 on the grid t (C)
+def errors(backend, t):
+    p=psya.satPressureValues(t,backend)
+    reference=correlations.iapwsVaporPressureArray(t)
+    ts=psya.satTemperatureValues(reference*0.001,backend)
+    back=psya.satTemperatureValues(p*0.001,backend)
+    return (np.max(np.abs(p/reference-1)),np.max(np.abs(ts-t)),np.max(np.abs(back-t)))
+
+
+if __name__=='__main__':
+    n=int(sys.argv[1]) if len(sys.argv)>1 else 100000
+    step=float(sys.argv[2]) if len(sys.argv)>2 else 0.01
+    grid=np.linspace(0,150,int(round(150/step))+1)
+    rng=np.random.default_rng(0)
+    t=rng.uniform(0,150,n); t_scalar=[float(x) for x in t[:1000]]
+    print('{0:d} array elements, {1:d} scalar values, error grid 0-150 C at {2:g} C'.format(n,len(t_scalar),step))
+    print('{0:<15s}{1:>11s}{2:>11s}{3:>11s}{4:>11s}{5:>13s}{6:>13s}{7:>13s}'.format('backend','P scalar','T scalar',\
+        'P array','T array','P rel error','T error (C)','round trip'))
+    for backend in psyf.saturation_backends:
+        if backend!='antoine': psyf.loadSaturationBackend(backend)
+        p=psya.satPressureValues(t,backend)*0.001; p_scalar=[float(x) for x in p[:1000]]
+        times=(scalarTime(lambda x: psyf.satPressureValue(x,backend),t_scalar),\
+            scalarTime(lambda x: psyf.satTemperatureValue(x,backend),p_scalar),\
+            bestTime(lambda x: psya.satPressureValues(x,backend),t)/n*1e9,\
+            bestTime(lambda x: psya.satTemperatureValues(x,backend),p)/n*1e9)
+        (pError,tError,roundTrip)=errors(backend,grid)
+        print('{0:<15s}{1:>8.0f} ns{2:>8.0f} ns{3:>8.1f} ns{4:>8.1f} ns{5:>13.2e}{6:>13.2e}{7:>13.2e}'.format(backend,\
+            *times,pError,tError,roundTrip))
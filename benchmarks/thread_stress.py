@@ -0,0 +1,78 @@
+'''
+Module Name:'thread_stress'
+Path:'<package_root>/benchmarks/thread_stress.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This script calls the core functions of psychro.lib from many threads at once \
+    on a few shared Temperature and Pressure objects of different units and checks that \
+    every result is the same as the result of the serial calls and that the shared \
+    objects are not changed (value and unit). It exits with status 1 on any mismatch.'
+Usage:
+    python benchmarks/thread_stress.py [number of calls] [threads]
+'''
+import sys, os, time
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+# the package root, so that 'python benchmarks/<script>.py' finds psychro without installation
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import psychro.lib as psy
+from psychro.lib import Temperature, Pressure
+
+
+# functions of (temperature, relative humidity, pressure) and of (temperature, relative humidity)
+functions3=['moleFraction','absoluteHumidity','massFraction','volumetricHumidity','vaporDensity','humidVolume',\
+    'humidDensity','humidMolarMass','wetBulbTemperature','humidAirEnthalpy','waterVaporEnthalpy',\
+    'directEnthalpy']
+functions2=['humidAirPressure','dewPoint','saturatedTemperature','partialPressure']
+
+
+# result() returns a comparable value of the result of a core function
+def result(r):
+    if isinstance(r,(Temperature,Pressure)): return (r.getValue(),r.getUnit())
+    return r
+
+
+# call() returns the result of the task (function name, arguments)
+def call(task):
+    (name,args)=task
+    return result(getattr(psy,name)(*args))
+
+
+# sharedInputs() returns the shared temperatures and pressures in several units
+def sharedInputs():
+    temperatures=[Temperature(25,'C'),Temperature(308.15,'K'),Temperature(50,'F'),Temperature(60,'C'),Temperature(72.5,'C')]
+    pressures=[Pressure(101325,'Pa'),Pressure(1,'atm'),Pressure(0.9,'bar'),Pressure(95,'kPa'),Pressure(14.7,'psi')]
+    return (temperatures,pressures)
+
+
+# makeTasks() returns n tasks cycling over the functions and the shared inputs
+def makeTasks(n, temperatures, pressures):
+    cases=[]
+    for (t,rh) in itertools.product(temperatures,[10,45.5,80,100]):
+        cases+=[(name,(t,rh)) for name in functions2]
+        cases+=[(name,(t,rh,p)) for name in functions3 for p in pressures]
+        cases+=[('humidSaturationEnthalpy',(t,)),('satVaporPressure',(t,))]
+    cases+=[('satTemperature',(p,)) for p in pressures]
+    return [cases[k%len(cases)] for k in range(n)]
+
+
+if __name__=='__main__':
+    n=int(sys.argv[1]) if len(sys.argv)>1 else 20000
+    threads=int(sys.argv[2]) if len(sys.argv)>2 else 16
+    sys.setswitchinterval(1e-6) # switch threads as often as possible
+    (temperatures,pressures)=sharedInputs()
+    before=[(x.getValue(),x.getUnit()) for x in temperatures+pressures]
+    tasks=makeTasks(n,temperatures,pressures)
+    start=time.perf_counter(); serial=[call(task) for task in tasks]; serialTime=time.perf_counter()-start
+    start=time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool: concurrent=list(pool.map(call,tasks))
+    threadTime=time.perf_counter()-start
+    after=[(x.getValue(),x.getUnit()) for x in temperatures+pressures]
+    mismatches=sum(1 for (a,b) in zip(serial,concurrent) if a!=b and not (a!=a and b!=b))
+    changed=sum(1 for (a,b) in zip(before,after) if a!=b)
+    print('{0:d} calls, {1:d} threads: serial {2:.3f} s, threads {3:.3f} s'.format(n,threads,serialTime,threadTime))
+    print('results different from serial: {0:d}, shared inputs changed: {1:d}'.format(mismatches,changed))
+    sys.exit(1 if mismatches or changed else 0)
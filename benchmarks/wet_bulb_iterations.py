@@ -0,0 +1,88 @@
+'''
+Module Name:'wet_bulb_iterations'
+Path:'<package_root>/benchmarks/wet_bulb_iterations.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This script counts the solver iterations of wetBulbTemperature(), \
+    calculateWetBulbTemperature() and wetBulbTemperatureArray() over a grid of dry bulb \
+    temperatures (0-150 C) and relative humidities at 1 atm with the saturation backends \
+    antoine (two branches of Antoine equation) and antoine-blended (the branches blended \
+    over 55-65 C). The iterations of the scalar functions are read from psychro.profile(), \
+    one profile per state. It prints the mean iterations in bands of dry bulb temperature, \
+    the mean and largest iterations of all states and of the states whose wet bulb \
+    temperature is near the branches (55-65 C), and the states which reach the iteration \
+    limit (wet_bulb_max_iterations of calculateWetBulbTemperature(); maxIter=100 of \
+    wetBulbTemperature() and wetBulbTemperatureArray()) or are invalid.'
+Usage:
+    python benchmarks/wet_bulb_iterations.py [temperature step in C] [pressure in Pa]
+'''
+import sys, os
+import numpy as np
+# the package root, so that 'python benchmarks/<script>.py' finds psychro without installation
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import psychro
+import psychro.src.psychro_functions as psyf
+import psychro.src.psychro_arrays as psya
+import psychro.src.error_policy as errp
+from psychro.lib import Temperature, Pressure
+
+backends=['antoine','antoine-blended']
+functions=['wetBulbTemperature','calculateWetBulbTemperature','wetBulbTemperatureArray']
+rh_levels=[5.0,10.0,20.0,35.0,50.0,65.0,80.0,95.0]
+bands=[(0,30),(30,55),(55,65),(65,90),(90,120),(120,150.01)]
+near=(55.0,65.0)
+
+
+# treeIterations() returns the iterations of a profile node and of its callees
+def treeIterations(node):
+    return node.iterations+sum(treeIterations(child) for child in node.children.values())
+
+
+# scalarIterations() returns (iterations, valid) of the scalar function name at every state
+def scalarIterations(name, t, rh, p):
+    fn=getattr(psyf,name); iterations=[]; valid=[]
+    for (ti,rhi) in zip(t,rh):
+        with psychro.profile() as prof: r=fn(Temperature(float(ti),'C'),float(rhi),Pressure(p,'Pa'))
+        iterations.append(treeIterations(prof.root)); valid.append(isinstance(r,Temperature))
+    return (np.array(iterations),np.array(valid))
+
+
+# arrayIterations() returns (iterations, valid) of wetBulbTemperatureArray() at every state
+def arrayIterations(t, rh, p, maxIter=100):
+    (twb,iterations,valid)=psya.wetBulbTemperatureArray(t,rh,p,maxIter=maxIter)
+    return (iterations,valid)
+
+
+if __name__=='__main__':
+    step=float(sys.argv[1]) if len(sys.argv)>1 else 1.0
+    p=float(sys.argv[2]) if len(sys.argv)>2 else 101325.0
+    (t,rh)=[a.ravel() for a in np.meshgrid(np.arange(0,150+step/2,step),rh_levels)]
+    errp.setErrorPolicy('nan')
+    # wet bulb temperature of every state by the current (Antoine) fit
+    twb=psya.wetBulbTemperatureArray(t,rh,p)[0]
+    nearMask=(twb>=near[0])&(twb<=near[1])
+    results={}
+    for backend in backends:
+        with psyf.saturationBackend(backend):
+            for name in functions:
+                results[(name,backend)]=arrayIterations(t,rh,p) if name.endswith('Array') else scalarIterations(name,t,rh,p)
+    print('{0:d} states: dry bulb 0-150 C at {1:g} C, {2:d} relative humidities, {3:g} Pa; most iterations {4:d}'.format(\
+        t.size,step,len(rh_levels),p,psyf.wet_bulb_max_iterations))
+    for name in functions:
+        print('\n'+name)
+        print('{0:<22s}{1:>8s}{2:>18s}{3:>18s}'.format('dry bulb band (C)','states',*backends))
+        for (low,high) in bands:
+            mask=(t>=low)&(t<high)
+            means=['{0:.1f}'.format(results[(name,backend)][0][mask].mean()) for backend in backends]
+            print('{0:<22s}{1:>8d}{2:>18s}{3:>18s}'.format('{0:g} - {1:g}'.format(low,min(high,150)),int(mask.sum()),*means))
+        for (label,mask) in (('all states',np.ones(t.size,bool)),('wet bulb 55-65 C',nearMask)):
+            values=['{0:.1f} / {1:d}'.format(results[(name,backend)][0][mask].mean(),int(results[(name,backend)][0][mask].max())) \
+                for backend in backends]
+            print('{0:<22s}{1:>8d}{2:>18s}{3:>18s}   (mean / largest)'.format(label,int(mask.sum()),*values))
+        limit=psyf.wet_bulb_max_iterations if name=='calculateWetBulbTemperature' else 100
+        stalled=['{0:d} / {1:d}'.format(int(np.sum(results[(name,backend)][0]>=limit)),\
+            int(np.sum(~results[(name,backend)][1]))) for backend in backends]
+        print('{0:<22s}{1:>8s}{2:>18s}{3:>18s}   (iteration limit / invalid)'.format('failed','',*stalled))
@@ -0,0 +1,145 @@
+'''
+Module Name:'wet_bulb_series'
+Path:'<package_root>/benchmarks/wet_bulb_series.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This script compares cold and warm started wet bulb temperature solves of hourly \
+    weather time series. The weather of a year is generated for several climates (channels): \
+    seasonal and daily cycles of dry bulb temperature and dew point with autocorrelated \
+    hourly noise and a slowly varying pressure; a CSV file (columns temperature (C), relative \
+    humidity (%) and optionally pressure (Pa)) may be given instead. It prints the mean and \
+    largest iterations per sample and the time per sample of wetBulbTemperatureArray() (every \
+    sample from 0 C..dry bulb) against wetBulbSeries() (every sample warm started from the \
+    previous one, all channels at once), of psychro.fast.wetBulbTemperature() without and with \
+    start, and the iterations of calculateWetBulbTemperature() and wetBulbTemperature() \
+    without and with start (read from psychro.profile(), first samples only), and the largest \
+    difference of the warm started results.'
+Usage:
+    python benchmarks/wet_bulb_series.py [days] [scalar samples] [csv file]
+'''
+import sys, os, csv, time
+import numpy as np
+# the package root, so that 'python benchmarks/<script>.py' finds psychro without installation
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import psychro
+import psychro.fast as fast
+import psychro.src.psychro_functions as psyf
+import psychro.src.psychro_arrays as psya
+import psychro.src.error_policy as errp
+from psychro.lib import Temperature, Pressure
+
+# climates: (name, mean dry bulb (C), seasonal and daily amplitude (C), mean dew point
+# depression (C), mean pressure (Pa))
+climates=[('tropical',27.0,1.5,4.0,4.0,101000.0),('desert',28.0,9.0,8.0,22.0,100500.0),\
+    ('temperate',14.0,8.0,5.0,6.0,101325.0),('humid subtropical',21.0,7.0,5.0,4.0,101500.0),\
+    ('highland',18.0,3.0,7.0,8.0,80000.0),('dryer exhaust',60.0,2.0,3.0,12.0,101325.0)]
+
+
+# autoRegressive() returns n values of AR(1) noise with the lag 1 correlation phi and the
+# standard deviation sigma
+def autoRegressive(rng, n, phi, sigma):
+    e=rng.normal(0,sigma*np.sqrt(1-phi*phi),n); x=np.empty(n); x[0]=rng.normal(0,sigma)
+    for k in range(1,n): x[k]=phi*x[k-1]+e[k]
+    return x
+
+
+# magnusPressure() returns the saturated vapor pressure (Pa) at t (C) by Magnus equation;
+# used only to turn the generated dew points into relative humidity
+def magnusPressure(t):
+    return 610.94*np.exp(17.625*t/(t+243.04))
+
+
+# hourlyWeather() returns (temperature, relative humidity, pressure) arrays (hours, climates)
+# of the generated weather
+def hourlyWeather(days, seed=0):
+    rng=np.random.default_rng(seed); hours=np.arange(days*24)
+    season=np.cos(2*np.pi*(hours/24.0-200)/365.0); day=np.cos(2*np.pi*(hours%24-15)/24.0)
+    columns=[]
+    for (name,mean,seasonal,daily,depression,pressure) in climates:
+        t=mean+seasonal*season+daily*day+autoRegressive(rng,hours.size,0.95,1.0)
+        # the dew point follows the daily mean temperature; the depression grows in the afternoon
+        dew=t-np.maximum(depression+0.6*daily*(day+1)/2+autoRegressive(rng,hours.size,0.98,2.0),0.2)
+        rh=np.clip(100*magnusPressure(dew)/magnusPressure(t),1.0,100.0)
+        p=pressure+autoRegressive(rng,hours.size,0.995,600.0)
+        columns.append((np.maximum(t,0.5),np.round(rh,2),p))
+    return tuple(np.stack([c[k] for c in columns],axis=1) for k in range(3))
+
+
+# readWeather() returns (temperature, relative humidity, pressure) arrays (hours, 1) of the CSV file
+def readWeather(path):
+    with open(path,newline='') as f:
+        rows=[r for r in csv.reader(f) if r and r[0].strip() and r[0].lstrip()[0] in '+-.0123456789']
+    t=[float(r[0]) for r in rows]; rh=[float(r[1]) for r in rows]
+    p=[float(r[2]) if len(r)>2 and r[2].strip() else 101325.0 for r in rows]
+    return tuple(np.array(a).reshape(-1,1) for a in (t,rh,p))
+
+
+# bestTime() returns the best time (s) of fn() in repeat runs
+def bestTime(fn, repeat=3):
+    best=np.inf
+    for r in range(repeat):
+        start=time.perf_counter(); fn(); best=min(best,time.perf_counter()-start)
+    return best
+
+
+# treeIterations() returns the iterations of a profile node and of its callees
+def treeIterations(node):
+    return node.iterations+sum(treeIterations(child) for child in node.children.values())
+
+
+# scalarIterations() returns the iterations per sample of the scalar function name of
+# psychro_functions over the series of one channel, cold or warm started
+def scalarIterations(name, t, rh, p, warm):
+    fn=getattr(psyf,name); iterations=[]; previous=None
+    for (ti,rhi,pi) in zip(t,rh,p):
+        with psychro.profile() as prof: r=fn(Temperature(float(ti),'C'),float(rhi),Pressure(float(pi),'Pa'),previous if warm else None)
+        iterations.append(treeIterations(prof.root)); previous=r if isinstance(r,Temperature) else None
+    return np.array(iterations)
+
+
+# fastSeries() returns the wet bulb temperatures of psychro.fast over the series of one channel
+def fastSeries(t, rh, p, warm):
+    twb=[]; previous=None
+    for (ti,rhi,pi) in zip(t,rh,p):
+        previous=fast.wetBulbTemperature(ti,rhi,pi,start=previous if warm else None); twb.append(previous)
+    return twb
+
+
+if __name__=='__main__':
+    days=int(sys.argv[1]) if len(sys.argv)>1 else 365
+    samples=int(sys.argv[2]) if len(sys.argv)>2 else 200
+    if len(sys.argv)>3: (t,rh,p)=readWeather(sys.argv[3]); names=[sys.argv[3]]
+    else: (t,rh,p)=hourlyWeather(days); names=[c[0] for c in climates]
+    errp.setErrorPolicy('nan')
+    (hours,channels)=t.shape
+    print('{0:d} hourly samples x {1:d} channels ({2:s})'.format(hours,channels,', '.join(names)))
+    (cold,coldIterations,coldValid)=psya.wetBulbTemperatureArray(t,rh,p)
+    (warm,warmIterations,warmValid)=psya.wetBulbSeries(t,rh,p)
+    coldTime=bestTime(lambda: [psya.wetBulbTemperatureArray(t[k],rh[k],p[k]) for k in range(hours)])
+    warmTime=bestTime(lambda: psya.wetBulbSeries(t,rh,p))
+    print('\nmean / largest iterations per sample')
+    print('{0:<20s}{1:>8s}{2:>14s}{3:>14s}{4:>12s}'.format('channel','invalid','cold','warm','difference'))
+    for c in range(channels):
+        both=coldValid[:,c]&warmValid[:,c]
+        print('{0:<20s}{1:>8d}{2:>14s}{3:>14s}{4:>12.1e}'.format(names[c],int(np.sum(~coldValid[:,c])),\
+            '{0:.2f} / {1:d}'.format(coldIterations[:,c].mean(),int(coldIterations[:,c].max())),\
+            '{0:.2f} / {1:d}'.format(warmIterations[:,c].mean(),int(warmIterations[:,c].max())),\
+            float(np.max(np.abs(cold[both,c]-warm[both,c]),initial=0))))
+    print('{0:<20s}{1:>8d}{2:>14.2f}{3:>14.2f}'.format('all',int(np.sum(~coldValid)),coldIterations.mean(),warmIterations.mean()))
+    print('\ntime per sample of all channels: wetBulbTemperatureArray() {0:.1f} us, wetBulbSeries() {1:.1f} us'.format(\
+        coldTime/hours*1e6,warmTime/hours*1e6))
+    series=[(list(map(float,t[:,c])),list(map(float,rh[:,c])),list(map(float,p[:,c]))) for c in range(channels)]
+    coldFast=bestTime(lambda: [fastSeries(*s,False) for s in series]); warmFast=bestTime(lambda: [fastSeries(*s,True) for s in series])
+    print('psychro.fast.wetBulbTemperature() per sample: cold {0:.2f} us, warm {1:.2f} us'.format(\
+        coldFast/t.size*1e6,warmFast/t.size*1e6))
+    n=min(samples,hours)
+    print('\nscalar functions, first {0:d} samples of every channel: mean iterations per sample (cold / warm)'.format(n))
+    print('{0:<20s}{1:>30s}{2:>30s}'.format('channel','calculateWetBulbTemperature','wetBulbTemperature'))
+    for c in range(channels):
+        values=['{0:.2f} / {1:.2f}'.format(scalarIterations(name,t[:n,c],rh[:n,c],p[:n,c],False).mean(),\
+            scalarIterations(name,t[:n,c],rh[:n,c],p[:n,c],True).mean()) \
+            for name in ('calculateWetBulbTemperature','wetBulbTemperature')]
+        print('{0:<20s}{1:>30s}{2:>30s}'.format(names[c],*values))
@@ -15,6 +15,12 @@ Limitation:
 '''
 
 
+# profile() is the context manager which records the calls of the psychrometric functions
+# made inside it as a nested call tree (calls, cumulative and self time, solver iterations)
+# with psychro.profile() as p: ...; print(p.report()); p.toJSON('profile.json')
+# see psychro.src.profiler
+from psychro.src.profiler import profile
+
 __version__='1.0.0'
 version='1.0.0'
 def getVersion():
@@ -0,0 +1,63 @@
+'''
+Module Name:'__main__'
+Path:'<package_root>/__main__.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd'
+Last Update:2026/10/18
+Description:"This module, __main__.py is the command line interface of the package \
+    'psychro'. "
+Usage:
+    python -m psychro batch sensor_log.csv result.csv -p dewPoint,wetBulbTemperature \
+        -t tdb -r rh --pressure-value 101325
+    python -m psychro batch - - < sensor_log.csv > result.csv
+'''
+# import necessary modules
+from __future__ import division
+import sys, argparse
+from psychro.src.batch_csv import processCSV, batch_properties
+
+
+# batch() runs the 'batch' command; '-' is the standard input or output
+def batch(args):
+    inputFile=sys.stdin if args.input=='-' else open(args.input,newline='')
+    outputFile=sys.stdout if args.output=='-' else open(args.output,'w',newline='')
+    try:
+        (count,invalid)=processCSV(inputFile,outputFile,args.properties.split(','),args.temperature,\
+            args.rh,args.pressure,args.temp_unit,args.pressure_unit,args.pressure_value,\
+            args.chunk_size,args.delimiter,args.error_codes)
+    finally:
+        if inputFile is not sys.stdin: inputFile.close()
+        if outputFile is not sys.stdout: outputFile.close()
+    if not args.quiet: sys.stderr.write('{0:d} rows, {1:d} invalid rows\n'.format(count,invalid))
+
+
+# main() parses the command line arguments and runs the command
+def main(argv=None):
+    parser=argparse.ArgumentParser(prog='python -m psychro',description='Psychrometric data of pure air-water system')
+    commands=parser.add_subparsers(dest='command')
+    parser_batch=commands.add_parser('batch',help='calculate properties of the rows of a CSV file in chunks')
+    parser_batch.add_argument('input',help="input CSV file with header; '-' for standard input")
+    parser_batch.add_argument('output',help="output CSV file; '-' for standard output")
+    parser_batch.add_argument('-p','--properties',default='dewPoint,wetBulbTemperature,humidAirEnthalpy,humidVolume',\
+        help='comma separated properties: '+', '.join(batch_properties))
+    parser_batch.add_argument('-t','--temperature',default='temperature',help='dry bulb temperature column')
+    parser_batch.add_argument('-r','--rh',default='relHumidity',help='relative humidity(%%) column')
+    parser_batch.add_argument('--pressure',default='pressure',help='pressure column')
+    parser_batch.add_argument('--pressure-value',type=float,default=None,help='pressure of every row instead of the pressure column')
+    parser_batch.add_argument('--temp-unit',default='C',help='temperature unit (default: C)')
+    parser_batch.add_argument('--pressure-unit',default='Pa',help='pressure unit (default: Pa)')
+    parser_batch.add_argument('--chunk-size',type=int,default=10000,help='rows per chunk (default: 10000)')
+    parser_batch.add_argument('--delimiter',default=',',help='CSV delimiter (default: ,)')
+    parser_batch.add_argument('-e','--error-codes',action='store_true',help="add the column 'error' with the error code of every row")
+    parser_batch.add_argument('-q','--quiet',action='store_true',help='do not print the row counts')
+    args=parser.parse_args(argv)
+    if args.command=='batch':
+        try: batch(args)
+        except (ValueError,OSError) as e: parser.exit(1,'error: '+str(e)+'\n')
+    else: parser.print_help()
+
+
+if __name__=='__main__':
+    main()
@@ -0,0 +1,53 @@
+'''
+Module Name:'chart'
+Path:'<package_root>/chart.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd'
+Last Update:2026/10/18
+Description:"This module, chart.py is the gateway module of the psychrometric chart of \
+    the package 'psychro'. It returns the curves of the chart as NumPy arrays of humidity \
+    ratio (kgV/kgDA) against dry bulb temperature (C); the curves are cached per pressure \
+    and resolution, so the chart is drawn again without calculation. "
+Usage:
+    >>> import psychro.chart as chart
+    >>> c=chart.chartCurves(101325, 0.1)
+    >>> (rh, w)=c['relHumidity']   # w[i] is the curve of rh[i] % against c['temperature']
+'''
+# import necessary modules
+from __future__ import division
+import psychro.src.chart_curves as chc
+
+# Module version
+__version__='1.0.0.2026.10.18'
+version='1.0.0.2026.10.18'
+
+
+# toTuple() returns the tuple of curve values (hashable cache key); None stays None
+def toTuple(values=None):
+    if values is None: return None
+    return tuple(float(v) for v in values)
+
+
+# chartCurves() returns the dict of the psychrometric chart curves at pressure(Pa) between
+# tmin and tmax (C) with the temperature step resolution (C); the curve values are given by
+# relHumidity(%), wetBulb(C), enthalpy(kJ/kgDA) and volume(m3/kgDA) (None: default values)
+# keys: 'pressure', 'temperature', 'saturation'(humidity ratio of saturated air) and
+#     (curve values, humidity ratio array (curve, temperature)) of 'relHumidity', 'wetBulb',
+#     'enthalpy' (the third item is the wet bulb temperature of each line) and 'volume'
+# Points outside the chart are NaN; the arrays are read only
+def chartCurves(pressure=101325, resolution=0.1, tmin=0, tmax=50, relHumidity=None, wetBulb=None, \
+    enthalpy=None, volume=None):
+    return dict(chc.chartCurves(float(pressure),float(resolution),float(tmin),float(tmax),toTuple(relHumidity),\
+        toTuple(wetBulb),toTuple(enthalpy),toTuple(volume)))
+
+
+# chartCacheInfo() returns the hit/miss counters of the chart cache
+def chartCacheInfo():
+    return chc.chartCurves.cache_info()
+
+
+# clearChartCache() empties the chart cache
+def clearChartCache():
+    chc.chartCurves.cache_clear()
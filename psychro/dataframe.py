@@ -0,0 +1,36 @@
+'''
+Module Name:'dataframe'
+Path:'<package_root>/dataframe.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd'
+Last Update:2026/10/18
+Description:"This module, dataframe.py is the gateway module of the pandas support of the \
+    package 'psychro'. Importing it registers the accessor df.psychro of pandas DataFrames, \
+    which calculates psychrometric properties of the columns of dry bulb temperature, \
+    relative humidity and pressure by the array functions, all rows at once. "
+Usage:
+    >>> import pandas as pd
+    >>> import psychro.dataframe
+    >>> df.psychro.add(['dewPoint','humidAirEnthalpy'], T='tdb', rh='rh', p='p', units={'T':'F','p':'kPa'})
+    >>> props=df.psychro.calculate(['wetBulbTemperature'], T='tdb', rh='rh', p=101325)
+'''
+# import necessary modules
+from __future__ import division
+try: import pandas as pd
+except ImportError: raise ImportError("psychro.dataframe needs pandas (pip install pandas)")
+import psychro.src.dataframe_accessor as dfa
+
+# Module version
+__version__='1.0.0.2026.10.18'
+version='1.0.0.2026.10.18'
+
+# properties which can be calculated by df.psychro (methods of PsychroStateArray)
+dataframe_properties=dfa.dataframe_properties
+
+# PsychroAccessor is registered as df.psychro:
+# df.psychro.add(properties, T, rh, p, units, errorColumn) adds the property columns to df
+# df.psychro.calculate(properties, T, rh, p, units, errorColumn) returns them as a new DataFrame
+# df.psychro.state(T, rh, p, units) returns the PsychroStateArray of the rows
+PsychroAccessor=pd.api.extensions.register_dataframe_accessor('psychro')(dfa.PsychroAccessor)
@@ -0,0 +1,93 @@
+'''
+Module Name:'fast'
+Path:'<package_root>/fast.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd'
+Last Update:2026/10/18
+Description:"This module, fast.py is the gateway module of the plain float functions \
+    of the package 'psychro'. The functions have the names of the 'lib' functions, \
+    but take plain numbers (temperature in C, relative humidity in %, pressure in Pa) \
+    and return plain floats; invalid arguments give NaN. No Temperature or Pressure \
+    object is created, so a call costs a few microseconds. "
+'''
+# import necessary modules
+from __future__ import division
+import psychro.src.fast_functions as fastf
+
+# Module version
+__version__='1.0.0.2026.10.18'
+version='1.0.0.2026.10.18'
+
+
+# satVaporPressure(t) returns saturated vapor pressure in Pa at t(C) between 0 to 150 C
+satVaporPressure=fastf.satVaporPressure
+
+# satTemperature(p) returns saturated temperature in C at the vapor pressure p(Pa)
+satTemperature=fastf.satTemperature
+
+# dryAirPressure(t) returns the pressure of dry air in Pa at t(C)
+dryAirPressure=fastf.dryAirPressure
+
+# humidAirPressure(t, rh) returns the total pressure in Pa of water vapor and dry air
+# in a closed system
+humidAirPressure=fastf.humidAirPressure
+
+# dewPoint(t, rh) returns the dew point in C; saturatedTemperature() is the same
+dewPoint=fastf.dewPoint
+saturatedTemperature=fastf.saturatedTemperature
+
+# partialPressure(t, rh) returns partial pressure of water vapor in Pa
+partialPressure=fastf.partialPressure
+
+# relativeHumidity(t, td) returns relative humidity(%) at dry bulb t(C) and dew point td(C)
+relativeHumidity=fastf.relativeHumidity
+
+# moleFraction(t, rh, p) returns moles of vapor/moles of wet air
+moleFraction=fastf.moleFraction
+
+# absoluteHumidity(t, rh, p) returns mass of vapor / mass of dry air (kgV/kgDA);
+# moistureContent(), humidityRatio() and specificHumidity() are the same
+absoluteHumidity=fastf.absoluteHumidity
+moistureContent=fastf.moistureContent
+humidityRatio=fastf.humidityRatio
+specificHumidity=fastf.specificHumidity
+
+# massFraction(t, rh, p) returns mass of vapor / mass of humid air (kgV/kgHA)
+massFraction=fastf.massFraction
+
+# volumetricHumidity(t, rh, p) returns the mass of water vapor per unit volume of
+# humid air (kgV/m3); vaporDensity() is the same
+volumetricHumidity=fastf.volumetricHumidity
+vaporDensity=fastf.vaporDensity
+
+# humidVolume(t, rh, p) returns the volume of humid air per unit mass of dry air (m3/kgDA)
+humidVolume=fastf.humidVolume
+
+# humidDensity(t, rh, p) returns the mass of humid air per unit volume (kgHA/m3)
+humidDensity=fastf.humidDensity
+
+# humidMolarMass(t, rh, p) returns the molar mass of humid air (g/mol)
+humidMolarMass=fastf.humidMolarMass
+
+# wetBulbTemperature(t, rh, p, tol=1e-6, maxIter=100, start=None, step=1.0) returns the wet bulb
+# temperature in C; start (C) warm starts the solve from a close wet bulb temperature
+wetBulbTemperature=fastf.wetBulbTemperature
+
+# humidSaturationEnthalpy(t, p=101325) returns saturation enthalpy of humid air in kJ/kgDA
+humidSaturationEnthalpy=fastf.humidSaturationEnthalpy
+
+# humidAirEnthalpy(t, rh, p) returns enthalpy of humid air in kJ/kgDA (Ref. Temp. = 0 C)
+humidAirEnthalpy=fastf.humidAirEnthalpy
+
+# dryAirEnthalpy(t, p) returns enthalpy of dry air in kJ/kgDA (Ref. Temp. = 0 C)
+dryAirEnthalpy=fastf.dryAirEnthalpy
+
+# waterVaporEnthalpy(t, rh, p) returns enthalpy change of water vapor in kJ/kgDA
+waterVaporEnthalpy=fastf.waterVaporEnthalpy
+
+# directEnthalpy(t, rh, p) returns enthalpy of humid air in kJ/kgDA from the humidity ratio
+# without the wet bulb iteration: h=cp_a*t+W*(h_fg+cp_v*t) (Ref. Temp. = 0 C)
+directEnthalpy=fastf.directEnthalpy
+
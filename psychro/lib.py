@@ -14,7 +14,13 @@ Description:"This module, lib.py is used as the gateway module of the package \
 from __future__ import division
 from psychro.src.Pressure import Pressure
 from psychro.src.Temperature import Temperature
+from psychro.src.PressureArray import PressureArray
+from psychro.src.TemperatureArray import TemperatureArray
+from psychro.src.PsychroState import PsychroState, PsychroStateArray
 import psychro.src.psychro_functions as psyf
+import psychro.src.psychro_arrays as psya
+import psychro.src.error_policy as errp
+import psychro.src.inverse_state as psyi
 
 # Module version
 __version__='1.0.0.2023.02.10'
@@ -24,14 +30,16 @@ version='1.0.0.2023.02.10'
 
 # satVaporPressure() returns saturated vapor pressure in mHg 
 # at the given temperature between 0 to 150 C
-def satVaporPressure(temperature=None):
-    return psyf.satVaporPressure(temperature)
+# backend: saturation backend of this call (None: the current backend)
+def satVaporPressure(temperature=None, backend=None):
+    return psyf.satVaporPressure(temperature, backend)
 
 
 # satTemperature() returns saturated temperature in Celcius 
 # at the given vapor pressure in mHg unit
-def satTemperature(vaporPressure=None):
-    return psyf.satTemperature(vaporPressure)
+# backend: saturation backend of this call (None: the current backend)
+def satTemperature(vaporPressure=None, backend=None):
+    return psyf.satTemperature(vaporPressure, backend)
 
 
 # dryAirPressure(T) calculates the pressure of dry air in Pa at the given temperature
@@ -132,15 +140,16 @@ def humidMolarMass(temperature=None, relHumidity=None, pressure=None):
 
 
 # wetBulbTemperature() calculates wet bulb temperature when dry bulb temperature(C), 
-# atmospheric pressure(Pa) and relative humidity(%) are given 
-def wetBulbTemperature(temperature=None, relHumidity=None, pressure=None):
-    return psyf.wetBulbTemperature(temperature, relHumidity, pressure)
+# atmospheric pressure(Pa) and relative humidity(%) are given; start (Temperature) warm
+# starts the solve, e.g. from the wet bulb temperature of the previous sample of a time series
+def wetBulbTemperature(temperature=None, relHumidity=None, pressure=None, start=None):
+    return psyf.wetBulbTemperature(temperature, relHumidity, pressure, start)
 
 
 # humidSaturationEnthalpy() calculates saturation enthalpy of humid air in kJ/kgDA 
 # at the given saturated temperature at which relative humidity is 100% 
 # (Ref. Temp. = 298.15K = 25C) 
-def humidSaturationEnthalpy(temperature=None,pressure=Pressure(1,'atm')):
+def humidSaturationEnthalpy(temperature=None,pressure=psyf.standard_pressure):
     return psyf.humidSaturationEnthalpy(temperature,pressure)
 
 
@@ -151,6 +160,12 @@ def humidAirEnthalpy(temperature=None, relHumidity=None, pressure=None):
     return psyf.humidAirEnthalpy(temperature, relHumidity, pressure)
 
 
+# directEnthalpy() calculates enthalpy of humid air in kJ/kgDA directly from the humidity
+# ratio without the wet bulb iteration: h=cp_a*t+W*(h_fg+cp_v*t) (Ref. Temp. = 0 C)
+def directEnthalpy(temperature=None, relHumidity=None, pressure=None):
+    return psyf.directEnthalpy(temperature, relHumidity, pressure)
+
+
 # dryAirEnthalpy() calculates enthalpy change of dry air in kJ/kgDA 
 # at the given temperature with respect to the standard temperature (273.15 K) 
 def dryAirEnthalpy(temperature=None,pressure=None):
@@ -161,3 +176,112 @@ def dryAirEnthalpy(temperature=None,pressure=None):
 # at the given temperature with respect to the standard temperature (298.15 K) 
 def waterVaporEnthalpy(temperature=None,relHumidity=None,pressure=None):
     return psyf.waterVaporEnthalpy(temperature,relHumidity,pressure)
+
+
+# satVaporPressureArray() returns (saturated vapor pressure array in Pa, validity mask)
+# at the given array of temperatures between 0 to 150 C
+def satVaporPressureArray(temperature=None, unit='C', backend=None):
+    return psya.satVaporPressureArray(temperature, unit, backend)
+
+
+# satTemperatureArray() returns (saturated temperature array in C, validity mask)
+# at the given array of vapor pressures
+def satTemperatureArray(vapPressure=None, unit='Pa', backend=None):
+    return psya.satTemperatureArray(vapPressure, unit, backend)
+
+
+# wetBulbTemperatureArray() returns (wet bulb temperature array in C, iteration count
+# array, validity mask) at the given arrays of dry bulb temperature, relative humidity(%)
+# and pressure; all elements are solved at once to the bracket width tol (C); start (array
+# in C) warm starts the elements in the bracket start-step..start+step
+def wetBulbTemperatureArray(temperature=None, relHumidity=None, pressure=None, tempUnit='C', \
+    pressureUnit='Pa', tol=1e-6, maxIter=100, start=None, step=1.0):
+    return psya.wetBulbTemperatureArray(temperature, relHumidity, pressure, tempUnit, pressureUnit, tol, maxIter, \
+        start, step)
+
+
+# wetBulbSeries() returns (wet bulb temperature array in C, iteration count array, validity
+# mask) of time series (axis 0 = samples, other axes = channels) of dry bulb temperature,
+# relative humidity(%) and pressure; every sample is warm started from the previous one
+def wetBulbSeries(temperature=None, relHumidity=None, pressure=None, tempUnit='C', pressureUnit='Pa', \
+    tol=1e-6, maxIter=100, start=None, step=1.0):
+    return psya.wetBulbSeries(temperature, relHumidity, pressure, tempUnit, pressureUnit, tol, maxIter, start, step)
+
+
+# solveState() returns the PsychroStateArray of the states given by a pair of properties
+# (dict of arrays) and the pressure; the pairs are in state_pairs, e.g.
+#     lib.solveState({'temperature':[25,30],'wetBulbTemperature':[18,20]}, 101325)
+# temperatures are in tempUnit, humidityRatio in kgV/kgDA and humidAirEnthalpy in kJ/kgDA
+def solveState(properties=None, pressure=None, tempUnit='C', pressureUnit='Pa', tol=1e-9, maxIter=50):
+    return psyi.solveState(properties, pressure, tempUnit, pressureUnit, tol, maxIter)
+
+state_pairs=psyi.state_pairs
+
+
+# humidSaturationEnthalpyArray() returns (saturation enthalpy array in kJ/kgDA, validity mask)
+# of arrays of temperature and pressure; equal to humidSaturationEnthalpy() bit for bit
+def humidSaturationEnthalpyArray(temperature=None, pressure=None, tempUnit='C', pressureUnit='Pa'):
+    return psya.humidSaturationEnthalpyArray(temperature, pressure, tempUnit, pressureUnit)
+
+
+# directEnthalpyArray() returns (enthalpy array in kJ/kgDA, validity mask) of arrays of
+# dry bulb temperature, relative humidity(%) and pressure from the humidity ratio
+def directEnthalpyArray(temperature=None, relHumidity=None, pressure=None, tempUnit='C', pressureUnit='Pa'):
+    return psya.directEnthalpyArray(temperature, relHumidity, pressure, tempUnit, pressureUnit)
+
+
+# setSaturationBackend() selects the saturation backend of all psychrometric functions in all threads
+# 'antoine': Antoine equation (default); 'table': interpolation of the dense saturation table;
+# 'magnus', 'hyland-wexler', 'iapws': Magnus, Hyland-Wexler (ASHRAE) and IAPWS-IF97 correlations;
+# 'antoine-blended': Antoine equation blended over 55-65 C (continuous slope at 60 C)
+def setSaturationBackend(backend='antoine'):
+    return psyf.setSaturationBackend(backend)
+
+
+# getSaturationBackend() returns the name of the current saturation backend
+def getSaturationBackend():
+    return psyf.getSaturationBackend()
+
+
+# saturationBackend() selects the saturation backend inside a with statement, only in the
+# current thread or asyncio task
+#     with lib.saturationBackend('table'): ...
+def saturationBackend(backend='antoine'):
+    return psyf.saturationBackend(backend)
+
+
+# enthalpyCacheInfo() returns the hit/miss counters of the component enthalpy cache
+# and of the reference (298.15 K) residual enthalpy cache
+def enthalpyCacheInfo():
+    return psyf.enthalpyCacheInfo()
+
+
+# clearEnthalpyCache() empties the enthalpy caches and resets their counters
+def clearEnthalpyCache():
+    return psyf.clearEnthalpyCache()
+
+
+# setErrorPolicy() selects what the functions do with an error: 'print' (default; print
+# and return None), 'raise', 'nan' (return NaN) or 'mask' (return None without printing);
+# in all threads
+def setErrorPolicy(policy='print'):
+    errp.setErrorPolicy(policy)
+
+
+# getErrorPolicy() returns the current error policy
+def getErrorPolicy():
+    return errp.getErrorPolicy()
+
+
+# errorPolicy() selects the error policy inside a with statement, only in the current
+# thread or asyncio task
+def errorPolicy(policy='print'):
+    return errp.errorPolicy(policy)
+
+
+# humidityErrorCodes() returns the error code array of arrays of temperature, relative
+# humidity(%) and pressure; 0 is valid; error_codes has the messages of the codes
+def humidityErrorCodes(temperature=None, relHumidity=None, pressure=None, tempUnit='C', pressureUnit='Pa'):
+    return psya.humidityErrorCodes(temperature, relHumidity, pressure, tempUnit, pressureUnit)
+
+error_codes=errp.error_codes
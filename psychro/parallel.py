@@ -0,0 +1,38 @@
+'''
+Module Name:'parallel'
+Path:'<package_root>/parallel.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd'
+Last Update:2026/10/18
+Description:"This module, parallel.py is the gateway module of the parallel (multi \
+    process) calculation of the package 'psychro'. Large arrays of humid air states \
+    are split into chunks and calculated by a pool of worker processes. "
+Usage:
+    >>> import psychro.parallel as par
+    >>> result=par.map_states(rows, ['dewPoint','humidAirEnthalpy'], workers=4)
+    >>> (h, valid)=result['humidAirEnthalpy']
+'''
+# import necessary modules
+from __future__ import division
+import psychro.src.parallel_states as pars
+
+# Module version
+__version__='1.0.0.2026.10.18'
+version='1.0.0.2026.10.18'
+
+
+# map_states(inputs, properties, workers=None, chunksize=None, tempUnit='C', pressureUnit='Pa')
+# calculates the properties of the states given as rows of (temperature, relHumidity, pressure)
+# or as a tuple of three arrays in worker processes; returns {property: (array, mask)} in
+# the order of the inputs; mapStates() is the same
+def map_states(inputs=None, properties=None, workers=None, chunksize=None, tempUnit='C', pressureUnit='Pa'):
+    return pars.mapStates(inputs, properties, workers, chunksize, tempUnit, pressureUnit)
+
+mapStates=map_states
+
+
+# shutdown() closes the worker processes kept open by map_states()
+def shutdown():
+    pars.shutdown()
@@ -10,8 +10,9 @@ Description: 'This module contains Prefix class to store and suply SI prefixes u
 Usage:
     >>> p=Prefix('m')
     >>> p.getName(); p.getValue(); p.getSymbol()
-Dependency:''
+Dependency:'psychro.src.error_policy'
 '''
+from psychro.src.error_policy import reportError
 
 version:'1.0.0.2023.02.09'
 __version__:'1.0.0.2023.02.09'
@@ -29,6 +30,9 @@ class Prefix:
 
     __symbol_list=['y','z','a','f','p','n','u','m','c','d','da','h','k','M','G','T','P','E','Z','Y']
 
+    # prefix symbols of the prefix names; e.g. 'kilo':'k'
+    __prefix_symbols=dict((name,symbol) for (symbol,name) in __prefix_names.items())
+
     def __init__(self,prefix='k'):
         self.__prefix_symbol=''; self.__prefix_name=''; self.__prefix_value=-1
         try:
@@ -37,16 +41,14 @@ class Prefix:
                 else: raise ValueError('Invalid Prefix')
             elif prefix=='da': self.__prefix_symbol='da';
             else:
-                for key in Prefix.__prefix_names.keys():
-                    if prefix == Prefix.__prefix_names[key]:
-                        self.__prefix_symbol=key; break 
-                if self.__prefix_symbol=='': raise ValueError('Invalid Prefix')
+                if prefix not in Prefix.__prefix_symbols: raise ValueError('Invalid Prefix')
+                self.__prefix_symbol=Prefix.__prefix_symbols[prefix]
             self.__prefix_name=Prefix.__prefix_names[self.__prefix_symbol]
             self.__prefix_value=Prefix.__prefix_values[self.__prefix_symbol]
 
         except ValueError as e: 
             self.__prefix_symbol=None; self.__prefix_name=None; self.__prefix_value=None; self=None;
-            del(self); print(e);
+            del(self); reportError(e);
 
     def getName(self): return self.__prefix_name
 
@@ -69,7 +71,12 @@ class Prefix:
 prefix_values={'y':1e-24,'z':1e-21,'a':1e-18, 'f':1e-15, 'p':1e-12, 'n':1e-9, 'u':1e-6, 'm':1e-3,\
     'c':1e-2, 'd':1e-1, 'da':1e+1, 'h':1e+2, 'k':1e+3, 'M':1e+6, 'G':1e+9, 'T':1e+12, 'P':1e+15, \
     'E':1e+18, 'Z':1e+21, 'Y':1e+24}
-	
+
+# prefix names required for the unit registry of Unit module
+prefix_names={'y':'yocto','z':'zepto','a':'atto', 'f':'femto', 'p':'pico', 'n':'nano', 'u':'micro',\
+    'm':'milli', 'c':'centi', 'da':'deca', 'h':'hecto', 'k':'kilo', 'M':'mega', 'G':'giga', 'T':'tera',\
+    'P':'peta', 'E':'exa', 'Z':'zetta', 'Y':'yotta'}
+
 # getPrefix(value) returns a prefix object equal to the given value
 def getPrefix(value=1000):
     value_found=False
@@ -5,12 +5,14 @@ Module Version:'1.1.0.2023.02.08'
 Author;'A K M Aminul Islam'
 author_Email:'aminul71bd@gmail.com'
 Company:'Newtonia Ltd.'
-Last Update:2023/02/15
-Description: 'This module defines a pressure object by using pressure class'
-Dependency: psychro.src.Unit, __future__ 
+Last Update:2026/10/18
+Description: 'This module defines a pressure object by using pressure class. The pressure \
+    is kept in pascal and converted to the unit when its value is asked.'
+Dependency: psychro.src.Unit.resolveUnit, psychro.src.error_policy, __future__ 
 '''
 from __future__ import division
-from psychro.src.Unit import Unit
+from psychro.src.Unit import resolveUnit
+from psychro.src.error_policy import reportError
 
 
 __version__='1.0.0.2023.02.08'
@@ -22,158 +24,184 @@ def dataType(data=None):
     s=str(type(data)).split(' ')[1]
     return s.split("'")[1]
 
+# pascal value of one unit (same factors as the array functions) and the unit keys of the unit
+# names returned by resolveUnit(); the factors of a unit name are found once in unit_keys
+# (other pressure units are pascal)
+pascal_factors={'Pa':1,'bar':100000,'atm':101325,'mHg':133322.368421,'psi':6894.733261,'torr':101325/760}
+unit_keys={'Pa':'Pa','pa':'Pa','bar':'bar','Bar':'bar','atm':'atm','Atm':'atm','mHg':'mHg','mhg':'mHg',\
+    'psi':'psi','Psi':'psi','torr':'torr','Torr':'torr'}
+# value of one pascal in the units (bar is divided by 100000)
+unit_factors={'Pa':1,'atm':9.869232667e-6,'mHg':7.500616827e-6,'psi':1.450382e-4,'torr':7.5006375541921e-3}
+
 # This Pressure class creates pressure object with value and unit
 # Type of pressure value can be either 'abs' (absolute) and 'rel ('relative )
 # Absolute Pressure = Atmospheric Pressure +/- Relative pressure
 # is_absolute=False means relative pressure
 class Pressure: 
 
+    # the pressure is kept as one float in pascal (__pascal); __unit only selects the unit of
+    # getValue() and str(), which convert from pascal when asked, so toPa(), toatm(), ...
+    # change the unit and not the value
+    # the slots (no __dict__ per object) save memory
+    __slots__=('__pascal','__unit','__isAbsolute')
+
     def __init__ (self,value=100,unit='Pa',is_absolute=True):
-        self.__unit_prefix=1; self.__unit= ''; self.__physical_type=''; self.__value=0;
+        unit_prefix=1; self.__unit= ''; physical_type=''; self.__pascal=0
+        self.__isAbsolute=is_absolute
         try:
             if value==None or unit==None: raise ValueError("Pressure value or unit not set.")
             if dataType(unit)!='str': raise ValueError("Pressure unit must be string.")
             if dataType(value) not in ['int','float']: raise ValueError("Invalid DataType of Pressure Value")
             if is_absolute not in [True, False]: raise ValueError("Invalid Argument: is_absolute")
             # resolving unit
-            if unit=='Pa': self.__unit_prefix=1; self.__unit='Pa'; self.__physical_type='PRESSURE'
+            if unit=='Pa': unit_prefix=1; self.__unit='Pa'; physical_type='PRESSURE'
             else:
-                (self.__unit_prefix,self.__unit,self.__physical_type) = self.__resolve_unit(unit)
-                if self.__physical_type == None: raise ValueError('Invalid Unit: Not Pressure Unit')
-            self.__value=value*self.__unit_prefix; self.__unit_prefix=1; self.__isAbsolute=is_absolute
+                (unit_prefix,self.__unit,physical_type) = self.__resolve_unit(unit)
+                if physical_type == None: raise ValueError('Invalid Unit: Not Pressure Unit')
+            value=value*unit_prefix; self.__set(value)
             # testing Pressure values
-            if not self.validatePressureValue(self.__value): 
+            if not self.validatePressureValue(value): 
                 raise ValueError('Invalid Pressure Value')
-        except ValueError as e:print(e) # in release version: return None
+        except ValueError as e:reportError(e) # in release version: return None
+
+
+    # private function
+    # __set() sets the pascal value of the value in the current unit
+    def __set(self,value):
+        key=unit_keys.get(self.__unit,'Pa')
+        if key=='Pa': self.__pascal=value
+        elif key=='torr': self.__pascal=101325*value/760
+        else: self.__pascal=pascal_factors[key]*value
+
+    # private function
+    # __valueIn() returns the value in the unit key
+    def __valueIn(self,key):
+        if key=='Pa': return self.__pascal
+        if key=='bar': return self.__pascal/100000
+        return self.__pascal*unit_factors[key]
 
 
     def changeValue(self,value=100,is_absolute=True):
-        current_value=self.__value; current_isAbsolute=self.__isAbsolute
+        current_isAbsolute=self.__isAbsolute
         try:
             if not self.validatePressureValue(self,value): 
                 raise ValueError('Invalid Pressure Value')
         except ValueError as e:
-            self.__value=current_value; self.__isAbsolute=current_isAbsolute 
+            self.__isAbsolute=current_isAbsolute 
         else:			
-            self.__value=value; self.__isAbsolute=is_absolute
+            self.__set(value); self.__isAbsolute=is_absolute
  
 
     def getValue(self):
-        return self.__value 
+        return self.__valueIn(unit_keys.get(self.__unit,'Pa')) 
  
     def getUnit(self):
         return self.__unit 
 
     def getUnitPrefix(self):
-        return self.__unit_prefix 
+        if self.__unit==None: return None # invalid unit
+        return 1
 
     def getQuantity(self):
-        return self.__physical_type
+        if self.__unit==None: return None # invalid unit
+        return 'PRESSURE'
 
     def isAbsolute(self):
         return self.__isAbsolute
 
     # __repr__(self) returns always pascal pressure
     def __repr__ (self): 
-        copy_temp=self.copy();copy_temp.toPa(); return str(copy_temp.__value)+' Pa'
+        return str(self.getPascal())+' Pa'
 
     # __str__(self) returns the string version of pressure; 
 	# print(pressure) and str(pressure) calls this method
     def __str__(self): 
-        if self.__isAbsolute: return "PRESSURE: {0:.3g} {1} absolute".format(self.__value,self.__unit)
-        return "PRESSURE: {0:.6g} {1} relative".format(self.__value,self.__unit)
+        if self.__isAbsolute: return "PRESSURE: {0:.3g} {1} absolute".format(self.getValue(),self.__unit)
+        return "PRESSURE: {0:.6g} {1} relative".format(self.getValue(),self.__unit)
 	
 	
 	# private function
 	# __resolve_unit(self) verifies unit and resolves unit into a tuple (prefix,unit,quantity)
     def __resolve_unit(self,unit='Pa',quantity='Pressure'):
         try:
-            unit_obj=Unit(unit,quantity)
-            if unit_obj == None: raise ValueError('Invalid Unit of Pressure')
-            physical_type = unit_obj.getQuantity()
+            (unit_prefix,unit,physical_type)=resolveUnit(unit,quantity)
             if physical_type != 'PRESSURE':raise ValueError('Invalid Unit of Pressure')
-            unit_prefix = unit_obj.getPrefix()
-            unit = unit_obj.getUnit()
             return (unit_prefix,unit,physical_type)
         except ValueError: return (None,None,None)
 
-    # deepcopy() of energy object
+    # copy() of pressure object; the slots are copied without resolving the unit again
     def copy(self):
-        return Pressure(self.__value,self.__unit,self.__isAbsolute)
+        pressure=Pressure.__new__(Pressure)
+        (pressure.__pascal,pressure.__unit,pressure.__isAbsolute)=(self.__pascal,self.__unit,self.__isAbsolute)
+        return pressure
 
-    # validates the pressure value with the real world limitation
+    # validates the pressure value in the current unit with the real world limitation
     def validatePressureValue(self,value=1):
         try:
-            if self.__isAbsolute == True and self.__value < 0: raise ValueError("Absolute Pressure Value cannot be negative")
+            if self.__isAbsolute == True and value < 0: raise ValueError("Absolute Pressure Value cannot be negative")
             elif self.__isAbsolute == False:
-                if self.__unit in ['atm','Atm'] and self.__value < -1.0: raise ValueError("Invalid Pressure Value")
-                elif self.__unit in ['pa','Pa'] and self.__value < -101500: raise ValueError("Invalid Pressure Value")
-                elif self.__unit in ['mHg','mhg'] and self.__value < -0.76: raise ValueError("Invalid Pressure Value")
-                elif self.__unit in ['bar','Bar'] and self.__value < -1.015: raise ValueError("Invalid Pressure Value")
-                elif self.__unit in ['psi','Psi'] and self.__value < -14.7: raise ValueError("Invalid Pressure Value")
+                if self.__unit in ['atm','Atm'] and value < -1.0: raise ValueError("Invalid Pressure Value")
+                elif self.__unit in ['pa','Pa'] and value < -101500: raise ValueError("Invalid Pressure Value")
+                elif self.__unit in ['mHg','mhg'] and value < -0.76: raise ValueError("Invalid Pressure Value")
+                elif self.__unit in ['bar','Bar'] and value < -1.015: raise ValueError("Invalid Pressure Value")
+                elif self.__unit in ['psi','Psi'] and value < -14.7: raise ValueError("Invalid Pressure Value")
         except ValueError: return False
         else: return True
 
+    # getPascal(), getBar(), getmHg(), getAtm(), getPsi() and getTorr() return the value in
+    # the unit without changing the pressure
+    def getPascal(self):
+        return self.__valueIn('Pa')
+
+    def getBar(self):
+        return self.__valueIn('bar')
+
+    def getmHg(self):
+        return self.__valueIn('mHg')
+
+    def getAtm(self):
+        return self.__valueIn('atm')
+
+    def getPsi(self):
+        return self.__valueIn('psi')
+
+    def getTorr(self):
+        return self.__valueIn('torr')
+
+    # private function
+    # __inUnit() changes the unit of getValue() and str(); the pascal value is not changed
+    def __inUnit(self,unit):
+        if self.__unit!=None: self.__unit=unit
+
+    # changing unit; only the unit is changed, not the pascal value
     # convert to Pa from atm, bar, Hg pressure unit
-    def toPa(self):
-        if self.__unit in ['Pa','pa']:return
-        elif self.__unit in ['bar','Bar']: 
-            self.__value = 100000*self.__value; # 100kPa=1bar
-        elif self.__unit in ['atm','Atm']: 
-            self.__value = 101325*self.__value; # 1atm=101325Pa
-        elif self.__unit in ['mHg','mhg']: 
-            self.__value = 133322.368421*self.__value; # 101325Pa=0.76mHg
-        elif self.__unit in ['psi','Psi']: 
-            self.__value = 6894.733261*self.__value; # 101325Pa=14.696psi;
-        elif self.__unit in ['torr','Torr']: 
-            self.__value = 101325*self.__value/760; # 1 torr = 133.322 Pa; 
-        self.__unit='Pa'
-
-    def topa(self): return self.toPa()
-
-    # convert to bar pressure
-    def tobar(self):
-        if self.__unit in ['bar','Bar']:return
-        self.toPa(); self.__value=self.__value/100000
-        self.__unit='bar'
-
-    def toBar(self):
-        self.tobar()
-
-    # convert to psi pressure 
-    def topsi(self):
-        if self.__unit in ['psi','Psi']:return
-        self.toPa(); self.__value=self.__value*1.450382e-4
-        self.__unit='psi'
-
-    def toPsi(self):
-        self.topsi()
-
-    # convert to mHg pressure
-    def tomHg(self):
-        if self.__unit in ['mHg','mhg']:return
-        self.toPa(); self.__value=self.__value*7.500616827e-6
-        self.__unit='mHg'
-
-    def tomhg(self):
-        self.tomHg()
-
-
-    # convert to atm pressure
-    def toatm(self):
-        if self.__unit in ['atm','Atm']:return
-        self.toPa(); self.__value=self.__value*9.869232667e-6
-        self.__unit='atm'
-
-    def toAtm(self):
-        self.toatm()
-
-
-    # convert to torr pressure
-    def totorr(self):
-        if self.__unit in ['torr','Torr']:return
-        self.toPa(); self.__value=self.__value*7.5006375541921e-3
-        self.__unit='torr'
-
-    def toTorr(self):
-        self.totorr()
\ No newline at end of file
+    def toPa(self): self.__inUnit('Pa')
+
+    def topa(self): self.toPa()
+
+    # convert to bar pressure (1 bar = 100 kPa)
+    def tobar(self): self.__inUnit('bar')
+
+    def toBar(self): self.tobar()
+
+    # convert to psi pressure (14.696 psi = 1 atm)
+    def topsi(self): self.__inUnit('psi')
+
+    def toPsi(self): self.topsi()
+
+    # convert to mHg pressure (101325 Pa = 0.76 mHg)
+    def tomHg(self): self.__inUnit('mHg')
+
+    def tomhg(self): self.tomHg()
+
+
+    # convert to atm pressure (1 atm = 101325 Pa)
+    def toatm(self): self.__inUnit('atm')
+
+    def toAtm(self): self.toatm()
+
+
+    # convert to torr pressure (1 torr = 1 atm/760)
+    def totorr(self): self.__inUnit('torr')
+
+    def toTorr(self): self.totorr()
@@ -0,0 +1,119 @@
+'''
+Module Name:'PressureArray'
+Path:'<package_root>/src/PressureArray.py'
+Module Version:'1.0.0.2026.10.18'
+Author;'A K M Aminul Islam'
+author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description: 'This module creates a column of absolute pressures with one unit by \
+    using PressureArray class. The values are kept in a contiguous float64 numpy array \
+    and toPa(), tobar(), toatm(), tomHg(), topsi() and totorr() convert them in place \
+    without Pressure objects.'
+Dependency: numpy, psychro.src.Unit.resolveUnit, psychro.src.Pressure
+'''
+from __future__ import division
+import numpy as np
+from psychro.src.Unit import resolveUnit
+from psychro.src.Pressure import Pressure
+
+
+__version__='1.0.0.2026.10.18'
+version='1.0.0.2026.10.18'
+
+# Unit names returned by resolveUnit() and the unit they stand for
+pressure_units={'Pa':'Pa','Pascal':'Pa','Pascals':'Pa','pa':'Pa','pascal':'Pa','pascals':'Pa',\
+    'bar':'bar','bars':'bar','Bar':'bar','Bars':'bar','atm':'atm','ATM':'atm','Atm':'atm',\
+    'mHg':'mHg','mhg':'mHg','psi':'psi','Psi':'psi','PSI':'psi','torr':'torr','torrs':'torr',\
+    'Torr':'torr','Torrs':'torr'}
+
+# Pascal value of one unit and the unit value of one pascal; same factors as Pressure class
+pascal_factors={'bar':100000,'atm':101325,'mHg':133322.368421,'psi':6894.733261}
+unit_factors={'atm':9.869232667e-6,'mHg':7.500616827e-6,'psi':1.450382e-4,'torr':7.5006375541921e-3}
+
+
+# This PressureArray class creates an array of absolute pressure values with one unit
+# (Pa, bar, atm, mHg, psi or torr)
+class PressureArray:
+
+    __slots__=('__values','__unit')
+
+    def __init__(self,values=None,unit='Pa'):
+        if values is None or unit is None: raise ValueError("Pressure values or unit not set.")
+        self.__values=np.array(values,dtype=np.float64)
+        if unit in ['Pa','bar','atm','mHg','psi','torr']: self.__unit=unit; return
+        (prefix,name,quantity)=resolveUnit(unit,'Pressure')
+        if name not in pressure_units: raise ValueError(str(unit)+' is not a valid unit of PRESSURE')
+        if prefix!=1: self.__values*=prefix
+        self.__unit=pressure_units[name]
+
+    # getValues() returns the numpy array of the values (not a copy)
+    def getValues(self):
+        return self.__values
+
+    def getUnit(self):
+        return self.__unit
+
+    def getQuantity(self):
+        return 'PRESSURE'
+
+    def getShape(self):
+        return self.__values.shape
+
+    def __len__(self):
+        return len(self.__values)
+
+    # pressureArray[i] returns Pressure object; a slice returns PressureArray
+    def __getitem__(self,index):
+        value=self.__values[index]
+        if np.ndim(value)==0: return Pressure(float(value),self.__unit)
+        return PressureArray(value,self.__unit)
+
+    # __str__(self) returns the string version of pressure array
+    def __str__(self):
+        return "PRESSURE: {0} {1:s} absolute".format(self.__values,self.__unit)
+
+    def __repr__(self):
+        return "PressureArray({0!r}, '{1:s}')".format(self.__values.tolist(),self.__unit)
+
+    # copy() returns a PressureArray with a copy of the values
+    def copy(self):
+        return PressureArray(self.__values,self.__unit)
+
+    # convert to Pa in place from atm, bar, mHg, psi and torr
+    def toPa(self):
+        if self.__unit=='Pa': return
+        elif self.__unit=='torr':
+            self.__values*=101325; self.__values/=760 # 1 torr = 133.322 Pa
+        else: self.__values*=pascal_factors[self.__unit]
+        self.__unit='Pa'
+
+    def topa(self): self.toPa()
+
+    # __toUnit() converts the values in place to the unit through pascal
+    def __toUnit(self,unit):
+        if self.__unit==unit: return
+        self.toPa()
+        if unit=='bar': self.__values/=100000
+        else: self.__values*=unit_factors[unit]
+        self.__unit=unit
+
+    def tobar(self): self.__toUnit('bar')
+
+    def toBar(self): self.tobar()
+
+    def topsi(self): self.__toUnit('psi')
+
+    def toPsi(self): self.topsi()
+
+    def tomHg(self): self.__toUnit('mHg')
+
+    def tomhg(self): self.tomHg()
+
+    def toatm(self): self.__toUnit('atm')
+
+    def toAtm(self): self.toatm()
+
+    def totorr(self): self.__toUnit('torr')
+
+    def toTorr(self): self.totorr()
@@ -0,0 +1,349 @@
+'''
+Module Name:'PsychroState'
+Path:'<package_root>/src/PsychroState.py'
+Module Version:'1.0.0.2026.10.18'
+Author;'A K M Aminul Islam'
+author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description: 'This module defines the state of humid air by PsychroState class. \
+    The saturated vapor pressure, mole fraction and humidity ratio of the state are \
+    calculated once; every other property is derived from them when it is asked \
+    for the first time and then kept in the cache of the state. PsychroStateArray \
+    class does the same for arrays of states.'
+Dependency: numpy, psychro.src.Pressure, psychro.src.Temperature,
+    psychro.src.psychro_functions, psychro.src.psychro_arrays, psychro.src.error_policy,
+    psychro.src.profiler, __future__
+'''
+from __future__ import division
+import numpy as np
+from psychro.src.Pressure import Pressure
+from psychro.src.Temperature import Temperature
+import psychro.src.psychro_functions as psyf
+import psychro.src.psychro_arrays as psya
+from psychro.src.error_policy import reportError
+import psychro.src.profiler as prof
+
+__version__='1.0.0.2026.10.18'
+version='1.0.0.2026.10.18'
+
+
+# saturationEnthalpy() returns saturation enthalpy of humid air in kJ/kgDA at the
+# celcius temperature t, saturated vapor pressure satp(Pa) and pressure p(Pa);
+# same steps as humidSaturationEnthalpy() without calling satVaporPressure() again
+def saturationEnthalpy(t, satp, p):
+    y=100*satp/(100*p)                   # moleFraction() at 100% RH
+    molarmassha=(1-y)*28.947+y*18        # humidMolarMass()
+    x=0.6218*y/(1-y); x=x/(1+x)          # massFraction()
+    T=t+273.15; P=p/100000
+    delH=(1-y)*psyf.delHDryAirValue(T,P) + y*psyf.delHH2OValue(T,P)
+    zero_correction=26.35339042
+    return zero_correction + delH/(molarmassha*(1-x))
+
+
+# This PsychroState class creates the state of humid air with dry bulb temperature,
+# relative humidity(%) and pressure; the arguments are not changed
+class PsychroState:
+
+    def __init__(self,temperature=None,relHumidity=None,pressure=None):
+        self.__valid=False; self.__cache={}
+        try:
+            if temperature==None: raise ValueError("Temperature is not set in the argument of PsychroState()")
+            elif relHumidity==None: raise ValueError("Relative humidity is not set in the argument of PsychroState()")
+            elif pressure==None: raise ValueError("Air pressure is not set in the argument of PsychroState()")
+            elif relHumidity < 0 or relHumidity > 100: raise ValueError("Relative humidity is out of range")
+            self.__celcius=temperature.getCelcius(); self.__relHumidity=relHumidity; self.__pascal=pressure.getPascal()
+            if self.__celcius<0: raise ValueError("Temperature is out of valid range (0-150C)")
+            satp=psyf.satPressureValue(self.__celcius)
+            if satp==None: raise ValueError("Invalid Temperature Value for Antoine equation.")
+            # shared intermediates: saturated vapor pressure(Pa), mole fraction, humidity ratio
+            self.__satp=133322.368421*(satp*0.001)
+            self.__y=relHumidity*self.__satp/(100*self.__pascal)
+            self.__x=0.6218*self.__y/(1-self.__y)
+            self.__valid=True
+        except Exception as e: reportError(e)
+
+    # __cached() returns the cached value of the named property; function fn
+    # calculates the value when it is asked for the first time
+    def __cached(self,name,fn):
+        if not self.__valid: return None
+        if name not in self.__cache: self.__cache[name]=fn()
+        return self.__cache[name]
+
+    def isValid(self): return self.__valid
+
+    def getTemperature(self): return Temperature(self.__celcius,'C')
+
+    def getRelHumidity(self): return self.__relHumidity
+
+    def getPressure(self): return Pressure(self.__pascal,'Pa')
+
+    def __str__(self):
+        if not self.__valid: return 'PSYCHRO STATE: invalid'
+        return "PSYCHRO STATE: {0:.6g} degree C, {1:.6g}% RH, {2:.6g} Pa".format(self.__celcius,\
+            self.__relHumidity,self.__pascal)
+
+    def __repr__(self): return str(self)
+
+    # satVaporPressure() returns saturated vapor pressure at the dry bulb temperature
+    def satVaporPressure(self):
+        if not self.__valid: return None
+        return Pressure(self.__satp,'Pa')
+
+    # partialPressure() returns partial pressure of water vapor in the humid air
+    def partialPressure(self):
+        if not self.__valid: return None
+        return Pressure(self.__relHumidity*self.__satp/100,'Pa')
+
+    # dewPoint() returns dew point of the humid air
+    def dewPoint(self):
+        if not self.__valid or self.__relHumidity==0: return None
+        if self.__relHumidity==100: return Temperature(self.__celcius,'C')
+        t=self.__cached('dewPoint',lambda: psyf.satTemperatureValue(\
+            (self.__relHumidity*self.__satp/100)*7.500616827e-6))
+        if t==None: return None
+        return Temperature(t,'C')
+
+    def saturatedTemperature(self): return self.dewPoint()
+
+    # moleFraction() returns moles of vapor/moles of wet air
+    def moleFraction(self):
+        if not self.__valid: return None
+        return self.__y
+
+    # absoluteHumidity() returns mass of vapor / mass of dry air (kgV/kgDA)
+    def absoluteHumidity(self):
+        if not self.__valid: return None
+        return (self.__x,'kg/kgDA')
+
+    def moistureContent(self): return self.absoluteHumidity()
+
+    def humidityRatio(self): return self.absoluteHumidity()
+
+    def specificHumidity(self): return self.absoluteHumidity()
+
+    # massFraction() returns mass of vapor / mass of humid air (kgV/kgHA)
+    def massFraction(self):
+        value=self.__cached('massFraction',lambda: self.__x/(1+self.__x))
+        if value==None: return None
+        return (value,'kg/kgHA')
+
+    # volumetricHumidity() returns mass of water vapor per unit volume of humid air (kgV/m3)
+    def volumetricHumidity(self):
+        value=self.__cached('volumetricHumidity',lambda: \
+            0.002165*(self.__relHumidity*self.__satp/100)/(self.__celcius+273.15))
+        if value==None: return None
+        return (value,'kg/m3')
+
+    def vaporDensity(self): return self.volumetricHumidity()
+
+    # humidVolume() returns volume of humid air per unit mass of dry air (m3/kgDA)
+    def humidVolume(self):
+        value=self.__cached('humidVolume',lambda: \
+            287.2*(self.__celcius+273.15)/(self.__pascal*(1-self.__y)))
+        if value==None: return None
+        return (value,'m3/kgDA')
+
+    # humidDensity() returns mass of humid air per unit volume of humid air (kgHA/m3)
+    def humidDensity(self):
+        value=self.__cached('humidDensity',lambda: \
+            (1-0.37817*self.__y)*0.0034817*self.__pascal/(self.__celcius+273.15))
+        if value==None: return None
+        return (value,'kgHA/m3')
+
+    # humidMolarMass() returns molar mass of humid air (g/mol)
+    def humidMolarMass(self):
+        value=self.__cached('humidMolarMass',lambda: (1-self.__y)*28.947+self.__y*18)
+        if value==None: return None
+        return (value,'g/mol')
+
+    # wetBulbTemperature() returns wet bulb temperature of the humid air; solved from the
+    # mass fraction of the state by wetBulbValue(), the solver of wetBulbTemperature() whose
+    # steps wetBulbSolve() of PsychroStateArray does over arrays
+    def wetBulbTemperature(self):
+        def wetbulb():
+            if self.__relHumidity==100: return self.__celcius
+            (t,iterations)=psyf.wetBulbValue(self.__celcius,self.__x/(1+self.__x),self.__pascal)
+            prof.addIterations(iterations)
+            if t!=t:
+                reportError(ValueError("Wet bulb temperature is below 0 C or does not converge"))
+                return None
+            return t
+        t=self.__cached('wetBulbTemperature',wetbulb)
+        if t==None: return None
+        return Temperature(t,'C')
+
+    # humidSaturationEnthalpy() returns saturation enthalpy (kJ/kgDA) at the dry bulb temperature
+    def humidSaturationEnthalpy(self):
+        value=self.__cached('humidSaturationEnthalpy',lambda: \
+            saturationEnthalpy(self.__celcius,self.__satp,self.__pascal))
+        if value==None: return None
+        return (value,'kJ/kgDA')
+
+    # humidAirEnthalpy() returns enthalpy of humid air (kJ/kgDA) which is the
+    # saturation enthalpy at the wet bulb temperature
+    def humidAirEnthalpy(self):
+        def enthalpy():
+            twb=self.wetBulbTemperature()
+            if twb==None: return None
+            twb=twb.getValue()
+            satp=133322.368421*(psyf.satPressureValue(twb)*0.001)
+            return saturationEnthalpy(twb,satp,self.__pascal)
+        value=self.__cached('humidAirEnthalpy',enthalpy)
+        if value==None: return None
+        return (value,'kJ/kgDA')
+
+    # directEnthalpy() returns enthalpy of humid air (kJ/kgDA) from the humidity ratio
+    # without the wet bulb iteration: h=cp_a*t+W*(h_fg+cp_v*t)
+    def directEnthalpy(self):
+        value=self.__cached('directEnthalpy',lambda: psya.directEnthalpyValues(self.__celcius,self.__x))
+        if value==None: return None
+        return (value,'kJ/kgDA')
+
+    # dryAirEnthalpy() returns enthalpy of dry air (kJ/kgDA)
+    def dryAirEnthalpy(self):
+        value=self.__cached('dryAirEnthalpy',lambda: psyf.dryAirEnthalpy(\
+            Temperature(self.__celcius+273.15,'K'),Pressure(self.__pascal,'Pa'))[0])
+        if value==None: return None
+        return (value,'kJ/kgDA')
+
+    # waterVaporEnthalpy() returns enthalpy change of water vapor (kJ/kgDA)
+    def waterVaporEnthalpy(self):
+        value=self.__cached('waterVaporEnthalpy',lambda: self.__x*psyf.delHH2O(\
+            Temperature(self.__celcius+273.15,'K'),Pressure(self.__pascal,'Pa'))[0]/18)
+        if value==None: return None
+        return (value,'kJ/kgDA')
+
+
+
+# This PsychroStateArray class creates the states of humid air from arrays of dry
+# bulb temperature, relative humidity(%) and pressure (struct of arrays); every
+# property is returned as (float array, validity mask) as the array functions
+class PsychroStateArray:
+
+    def __init__(self,temperature=None,relHumidity=None,pressure=None,tempUnit='C',pressureUnit='Pa'):
+        (t,rh,p,valid)=psya.humidityArrays(temperature,relHumidity,pressure,tempUnit,pressureUnit)
+        self.__celcius=t; self.__relHumidity=rh; self.__pascal=p; self.__cache={}
+        # shared intermediates: saturated vapor pressure(Pa), mole fraction, humidity ratio
+        self.__satp=133322.368421*(psya.satPressureValues(t)*0.001)
+        self.__y=np.where(valid,rh*self.__satp/(100*p),np.nan)
+        self.__x=0.6218*self.__y/(1-self.__y)
+        self.__valid=valid
+
+    # __cached() returns the cached (array, mask) of the named property
+    def __cached(self,name,fn):
+        if name not in self.__cache:
+            value=fn()
+            if not isinstance(value,tuple): value=(value,self.__valid)
+            self.__cache[name]=value
+        return self.__cache[name]
+
+    # __kelvinBar() returns the arrays of temperature(K) and pressure(bar); NaN for invalid elements
+    def __kelvinBar(self):
+        return (np.where(self.__valid,self.__celcius+273.15,np.nan),np.where(self.__valid,self.__pascal/100000,np.nan))
+
+    def __len__(self): return self.__celcius.size
+
+    def getShape(self): return self.__celcius.shape
+
+    def getValidMask(self): return self.__valid
+
+    # errorCodes() returns the error code array of the inputs (see error_codes of error_policy);
+    # with a property name, the elements for which the property has no solution are added
+    def errorCodes(self,name=None):
+        codes=psya.errorCodes(self.__celcius,self.__relHumidity,self.__pascal)
+        if name is not None:
+            failed=(codes==0)&~getattr(self,name)()[1]
+            codes[failed]=5 if name in ['dewPoint','saturatedTemperature'] else 6
+        return codes
+
+    def getTemperature(self): return (self.__celcius,self.__valid)
+
+    def getRelHumidity(self): return (self.__relHumidity,self.__valid)
+
+    def getPressure(self): return (self.__pascal,self.__valid)
+
+    def satVaporPressure(self): return (self.__satp,self.__valid)
+
+    def partialPressure(self):
+        return self.__cached('partialPressure',lambda: np.where(self.__valid,\
+            self.__relHumidity*self.__satp/100,np.nan))
+
+    def dewPoint(self):
+        def dewpoint():
+            t=psya.satTemperatureValues(self.partialPressure()[0]*7.500616827e-6)
+            t=np.where(self.__relHumidity==100,self.__celcius,t)
+            return (t,self.__valid&~np.isnan(t))
+        return self.__cached('dewPoint',dewpoint)
+
+    def saturatedTemperature(self): return self.dewPoint()
+
+    def moleFraction(self): return (self.__y,self.__valid)
+
+    def absoluteHumidity(self): return (self.__x,self.__valid)
+
+    def moistureContent(self): return self.absoluteHumidity()
+
+    def humidityRatio(self): return self.absoluteHumidity()
+
+    def specificHumidity(self): return self.absoluteHumidity()
+
+    def massFraction(self): return self.__cached('massFraction',lambda: self.__x/(1+self.__x))
+
+    def volumetricHumidity(self):
+        return self.__cached('volumetricHumidity',lambda: \
+            0.002165*self.partialPressure()[0]/(self.__celcius+273.15))
+
+    def vaporDensity(self): return self.volumetricHumidity()
+
+    def humidVolume(self):
+        return self.__cached('humidVolume',lambda: \
+            np.where(self.__valid,287.2*(self.__celcius+273.15)/(self.__pascal*(1-self.__y)),np.nan))
+
+    def humidDensity(self):
+        return self.__cached('humidDensity',lambda: \
+            np.where(self.__valid,(1-0.37817*self.__y)*0.0034817*self.__pascal/(self.__celcius+273.15),np.nan))
+
+    def humidMolarMass(self):
+        return self.__cached('humidMolarMass',lambda: (1-self.__y)*28.947+self.__y*18)
+
+    # wetBulbTemperature() returns (wet bulb temperature array, validity mask);
+    # the iteration counts are given by wetBulbIterations()
+    def wetBulbTemperature(self):
+        def wetbulb():
+            (twb,iterations,valid)=psya.wetBulbSolve(self.__celcius,self.__relHumidity,self.__pascal,\
+                self.massFraction()[0],self.__valid)
+            self.__cache['wetBulbIterations']=(iterations,valid)
+            return (twb,valid)
+        return self.__cached('wetBulbTemperature',wetbulb)
+
+    def wetBulbIterations(self):
+        self.wetBulbTemperature(); return self.__cache['wetBulbIterations']
+
+    # the enthalpies are evaluated over the valid elements by the fused kernel of psychro_arrays
+    def humidSaturationEnthalpy(self):
+        return self.__cached('humidSaturationEnthalpy',lambda: psya.saturationEnthalpyValues(\
+            np.where(self.__valid,self.__celcius,np.nan),self.__satp,self.__pascal))
+
+    def humidAirEnthalpy(self):
+        def enthalpy():
+            (twb,valid)=self.wetBulbTemperature()
+            satp=133322.368421*(psya.satPressureValues(twb)*0.001)
+            return (psya.saturationEnthalpyValues(twb,satp,self.__pascal),valid)
+        return self.__cached('humidAirEnthalpy',enthalpy)
+
+    def directEnthalpy(self):
+        return self.__cached('directEnthalpy',lambda: psya.directEnthalpyValues(self.__celcius,self.__x))
+
+    def dryAirEnthalpy(self):
+        def enthalpy():
+            (T,P)=self.__kelvinBar()
+            values=psya.componentEnthalpies(T,P,('O2','N2','Ar','CO2'))
+            return 26.273618984842212 + psya.dryAirEnthalpyValues(values)/28.947
+        return self.__cached('dryAirEnthalpy',enthalpy)
+
+    def waterVaporEnthalpy(self):
+        def enthalpy():
+            (T,P)=self.__kelvinBar()
+            return self.__x*psya.componentEnthalpies(T,P,('H2O',))['H2O']/18
+        return self.__cached('waterVaporEnthalpy',enthalpy)
@@ -5,13 +5,15 @@ Module Version:'1.1.0.2023.02.08'
 Author;'A K M Aminul Islam'
 author_Email:'aminul71bd@gmail.com'
 Company:'Newtonia Ltd.'
-Last Update:2023/02/15
+Last Update:2026/10/18
 Description: 'This module creates Temperature object using Temperature class. \
-    It supports three units: celcius, kelvin and Fahrenheit.'
-Dependency: psychro.src.Unit, __future__ 
+    It supports three units: celcius, kelvin and Fahrenheit. The temperature is kept in \
+    celcius and converted to the unit when its value is asked.'
+Dependency: psychro.src.Unit.resolveUnit, psychro.src.error_policy, __future__ 
 '''
 from __future__ import division
-from psychro.src.Unit import Unit
+from psychro.src.Unit import resolveUnit
+from psychro.src.error_policy import reportError
 
 
 __version__='1.0.0.2023.02.08'
@@ -23,102 +25,124 @@ def dataType(data=None):
     s=str(type(data)).split(' ')[1]
     return s.split("'")[1]
 
+# offset and scale of the temperature units; value=celcius*scale+offset; the factors of a
+# unit name are found once in unit_keys (other temperature units are celcius)
+unit_factors={'C':(0,1),'F':(32,1.8),'K':(273.15,1)}
+unit_keys={'C':'C','Celcius':'C','F':'F','Fahrenheit':'F','Fahrenheits':'F','K':'K','Kelvin':'K','Kelvins':'K'}
+
 # This Temperature class creates temperature object with value and unit
 class Temperature: 
 
+    # the temperature is kept as one float in celcius (__celcius), the unit of every
+    # calculation; __unit only selects the unit of getValue() and str(), which convert from
+    # celcius when asked, so toC(), toK() and toF() change the unit and not the value
+    # the slots (no __dict__ per object) save memory
+    __slots__=('__celcius','__unit')
+
     #F=1.8'C+32; K=C+273.15
 
     def __init__ (self,value=25,unit='C'):
-        self.__unit_prefix=1; self.__unit= ''; self.__physical_type=''; self.__value=0
+        unit_prefix=1; self.__unit= ''; physical_type=''; self.__celcius=0
         try:
             if value==None or unit==None: raise ValueError("Temperature value or unit not set.")
             if dataType(unit)!='str': raise ValueError("Temperature unit must be string.")
             if dataType(value) not in ['int','float']: raise ValueError("Invalid DataType of Temperature Value")
             # resolving unit
-            if unit=='C': self.__unit_prefix=1; self.__unit='C'; self.__physical_type='TEMPERATURE'
+            if unit=='C': unit_prefix=1; self.__unit='C'; physical_type='TEMPERATURE'
             else:
-                (self.__unit_prefix,self.__unit,self.__physical_type) = self.__resolve_unit(unit)
-                if self.__physical_type == None:raise ValueError('Invalid Unit: Not Temperature Unit')
-            self.__value=value*self.__unit_prefix; self.__unit_prefix=1;
+                (unit_prefix,self.__unit,physical_type) = self.__resolve_unit(unit)
+                if physical_type == None:raise ValueError('Invalid Unit: Not Temperature Unit')
+            value=value*unit_prefix; self.__set(value)
             # testing temperature values
-            if self.__unit == 'K' and self.__value < 0: raise ValueError("Invalid Temperature Value")
-            elif self.__unit == 'C' and self.__value < -273.15: raise ValueError("Invalid Temperature Value")
-            elif self.__unit == 'F' and self.__value < -169.53: raise ValueError("Invalid Temperature Value")
+            if self.__unit == 'K' and value < 0: raise ValueError("Invalid Temperature Value")
+            elif self.__unit == 'C' and value < -273.15: raise ValueError("Invalid Temperature Value")
+            elif self.__unit == 'F' and value < -169.53: raise ValueError("Invalid Temperature Value")
 		
-        except ValueError as e:print(e) # in release version: return None
+        except ValueError as e:reportError(e) # in release version: return None
+
+
+    # private function
+    # __set() sets the celcius value of the value in the current unit
+    def __set(self,value):
+        (offset,scale)=unit_factors[unit_keys.get(self.__unit,'C')]
+        if scale==1: self.__celcius=value - offset
+        else: self.__celcius=(value - offset)/scale
+
+    # private function
+    # __valueIn() returns the value in the unit key (C, K or F)
+    def __valueIn(self,key):
+        (offset,scale)=unit_factors[key]
+        if scale==1: return self.__celcius + offset
+        return self.__celcius*scale + offset
 
 
     def changeValue(self,value=25):
-        current_value=self.__value
         try:
             if value==None or dataType(value) not in ['int','float']:                 
                 raise ValueError("Invalid Temperature Value")
             if self.__unit in ['K','Kelvin'] and value < 0: raise ValueError("Invalid Temperature Value")
             elif self.__unit in ['C','Celcius'] and value < -273.15: raise ValueError("Invalid Temperature Value")
             elif self.__unit in ['F','Fahrenheit'] and value < -169.53: raise ValueError("Invalid Temperature Value")
-        except ValueError as e:
-            self.__value=current_value
+        except ValueError as e: return
         else:			
-            self.__value=value
+            self.__set(value)
  
     def getValue(self):
-        return self.__value 
+        return self.__valueIn(unit_keys.get(self.__unit,'C')) 
  
     def getUnit(self):
         return self.__unit 
 
     def getUnitPrefix(self):
-        return self.__unit_prefix 
+        if self.__unit==None: return None # invalid unit
+        return 1
 
     def getQuantity(self):
-        return self.__physical_type
+        if self.__unit==None: return None # invalid unit
+        return 'TEMPERATURE'
 
     # __repr__(self) returns always celcius temperature
     def __repr__ (self): 
-        copy_temp=self.copy();copy_temp.toC();
-        return str(copy_temp.__value)+' C'
+        return str(self.getCelcius())+' C'
 
     # __str__(self) returns the string version of temperature; 
 	# print(temperature) and str(temperature) calls this method
     def __str__(self): 
-        return "{0:s}: {1:.6g} degree {2:s}".format(self.__physical_type,self.__value,self.__unit)
+        return "{0:s}: {1:.6g} degree {2:s}".format(self.getQuantity(),self.getValue(),self.__unit)
 	
 	
 	# private function
 	# __resolve_unit(self) verifies unit and resolves unit into a tuple (prefix,unit,quantity)
     def __resolve_unit(self,unit='C',quantity='Temperature'):
         try:
-            unit_obj=Unit(unit,quantity)
-            if unit_obj == None: raise ValueError('Invalid Unit of Temperature')
-            physical_type = unit_obj.getQuantity()
+            (unit_prefix,unit,physical_type)=resolveUnit(unit,quantity)
             if physical_type != 'TEMPERATURE':raise ValueError('')
-            unit_prefix = unit_obj.getPrefix()
-            unit = unit_obj.getUnit()
             return (unit_prefix,unit,physical_type)
         except ValueError: return (None,None,None)
 
-    # deepcopy() of temperatue object
+    # copy() of temperatue object; the slots are copied without resolving the unit again
     def copy(self):
-        return Temperature(self.__value,self.__unit)
-
-    # changing unit
-    def toC(self):
-        if self.__unit in ['C','Celcius']: return
-        elif self.__unit in ['F','Fahrenheit','Fahrenheits']:
-            self.__value = (self.__value - 32)/1.8; self.__unit='C'
-        elif self.__unit in ['K','Kelvin','Kelvins']:
-            self.__value = self.__value - 273.15; self.__unit='C'
-
-    def toF(self):
-        self.toC(); self.__value=self.__value*1.8 + 32; self.__unit='F'
-
-    def toK(self):
-        self.toC(); self.__value=self.__value + 273.15; self.__unit='K'
-
+        temperature=Temperature.__new__(Temperature)
+        (temperature.__celcius,temperature.__unit)=(self.__celcius,self.__unit)
+        return temperature
 
+    # getCelcius(), getKelvin() and getFahrenheit() return the value in the unit without
+    # changing the temperature
+    def getCelcius(self):
+        return self.__celcius
 
+    def getKelvin(self):
+        return self.__celcius + 273.15
 
+    def getFahrenheit(self):
+        return self.__celcius*1.8 + 32
 
+    # changing unit; only the unit of getValue() and str() is changed, not the celcius value
+    def toC(self):
+        if self.__unit!=None: self.__unit='C'
 
+    def toF(self):
+        if self.__unit!=None: self.__unit='F'
 
-			
\ No newline at end of file
+    def toK(self):
+        if self.__unit!=None: self.__unit='K'
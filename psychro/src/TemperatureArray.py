@@ -0,0 +1,91 @@
+'''
+Module Name:'TemperatureArray'
+Path:'<package_root>/src/TemperatureArray.py'
+Module Version:'1.0.0.2026.10.18'
+Author;'A K M Aminul Islam'
+author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description: 'This module creates a column of temperatures with one unit by using \
+    TemperatureArray class. The values are kept in a contiguous float64 numpy array \
+    and toC(), toF() and toK() convert them in place without Temperature objects.'
+Dependency: numpy, psychro.src.Unit.resolveUnit, psychro.src.Temperature
+'''
+from __future__ import division
+import numpy as np
+from psychro.src.Unit import resolveUnit
+from psychro.src.Temperature import Temperature
+
+
+__version__='1.0.0.2026.10.18'
+version='1.0.0.2026.10.18'
+
+# Unit names returned by resolveUnit() and the unit they stand for
+temperature_units={'C':'C','Celcius':'C','F':'F','Fahrenheit':'F','Fahrenheits':'F',\
+    'K':'K','Kelvin':'K','Kelvins':'K'}
+
+
+# This TemperatureArray class creates an array of temperature values with one unit
+# (C, F or K); F=1.8'C+32; K=C+273.15 as Temperature class
+class TemperatureArray:
+
+    __slots__=('__values','__unit')
+
+    def __init__(self,values=None,unit='C'):
+        if values is None or unit is None: raise ValueError("Temperature values or unit not set.")
+        self.__values=np.array(values,dtype=np.float64)
+        if unit in ['C','F','K']: self.__unit=unit; return
+        (prefix,name,quantity)=resolveUnit(unit,'Temperature')
+        if name not in temperature_units: raise ValueError(str(unit)+' is not a valid unit of TEMPERATURE')
+        if prefix!=1: self.__values*=prefix
+        self.__unit=temperature_units[name]
+
+    # getValues() returns the numpy array of the values (not a copy)
+    def getValues(self):
+        return self.__values
+
+    def getUnit(self):
+        return self.__unit
+
+    def getQuantity(self):
+        return 'TEMPERATURE'
+
+    def getShape(self):
+        return self.__values.shape
+
+    def __len__(self):
+        return len(self.__values)
+
+    # temperatureArray[i] returns Temperature object; a slice returns TemperatureArray
+    def __getitem__(self,index):
+        value=self.__values[index]
+        if np.ndim(value)==0: return Temperature(float(value),self.__unit)
+        return TemperatureArray(value,self.__unit)
+
+    # __str__(self) returns the string version of temperature array
+    def __str__(self):
+        return "TEMPERATURE: {0} degree {1:s}".format(self.__values,self.__unit)
+
+    def __repr__(self):
+        return "TemperatureArray({0!r}, '{1:s}')".format(self.__values.tolist(),self.__unit)
+
+    # copy() returns a TemperatureArray with a copy of the values
+    def copy(self):
+        return TemperatureArray(self.__values,self.__unit)
+
+    # changing unit in place
+    def toC(self):
+        if self.__unit=='C': return
+        elif self.__unit=='F':
+            self.__values-=32; self.__values/=1.8
+        elif self.__unit=='K':
+            self.__values-=273.15
+        self.__unit='C'
+
+    def toF(self):
+        if self.__unit=='F': return
+        self.toC(); self.__values*=1.8; self.__values+=32; self.__unit='F'
+
+    def toK(self):
+        if self.__unit=='K': return
+        self.toC(); self.__values+=273.15; self.__unit='K'
@@ -7,10 +7,12 @@ author_Email:'aminul71bd@gmail.com'
 Company:'Newtonia Ltd.'
 Last Update:2023/02/15
 Description: 'This module contains Unit class that holds necessary physical units.'
-Dependency: psychro.src.Prefix
+Dependency: psychro.src.Prefix, psychro.src.error_policy, io, contextlib
 '''
 
-from psychro.src.Prefix import Prefix
+import io, contextlib
+from psychro.src.Prefix import Prefix, prefix_values, prefix_names
+from psychro.src.error_policy import reportError
 
 __version__='1.1.0.2023.02.09'
 version='1.1.0.2023.02.09'
@@ -24,10 +26,8 @@ def dataType(data=None):
 
 
 
-# resolveUnit(unit='mm') returns a tuple of unit, it's prefix, it's quantity; (prefix,unit,quantity)
-def resolveUnit(unit='mm',quantity=''):
-
-    unit_names={'C':['C','Celcius'],'F':['F','Fahrenheit','Fahrenheits'],'K':['K','Kelvin','Kelvins'],\
+# unit names of the unit keys and unit keys of the physical quantities
+unit_names={'C':['C','Celcius'],'F':['F','Fahrenheit','Fahrenheits'],'K':['K','Kelvin','Kelvins'],\
     'Bar':['Bar','Bars'], 'bar':['bar','bars'],'atm':['atm'],'Atm':['ATM','Atm'],'Pa':['Pa','Pascal','Pascals'],\
     'pa':['pa','pascal','pascals'], 'psi':['psi'],'Psi':['Psi','PSI'], 'mHg':['mHg'], 'mhg':['mhg'],\
     'torr':['torr','torrs'],'Torr':['Torr','Torrs'],'J':['J','Joule','Joules'], 'j':['j','joule','joules'],\
@@ -39,9 +39,14 @@ def resolveUnit(unit='mm',quantity=''):
     'm':['m','meter','meters','metre','metres'], 'inch':['inch','inches'], 'ft':['ft','foot','feet'], \
     'yd':['yd','yard','yards'],'mile':['mile','miles']}
 
-    unit_quantities={'TEMPERATURE':['C','K','F'],'PRESSURE':['Pa','pa','mHg','mhg','Atm','atm','bar','Bar','psi','Psi','torr','Torr'],\
+unit_quantities={'TEMPERATURE':['C','K','F'],'PRESSURE':['Pa','pa','mHg','mhg','Atm','atm','bar','Bar','psi','Psi','torr','Torr'],\
     'ENERGY':['J','j','Cal','cal','Btu','btu','wh','Wh','eV','ev'],'POWER':['W','w','hp','ton'],\
-	'LENGTH':['m','inch','ft','yd','mile']}	
+    'LENGTH':['m','inch','ft','yd','mile']}
+
+
+# scanUnit(unit='mm') returns a tuple of unit, it's prefix, it's quantity; (prefix,unit,quantity)
+# by scanning the unit names in the unit string; see resolveUnit()
+def scanUnit(unit='mm',quantity=''):
 
     prefix_value=1; unit_found=''; unit_key=''; physical_quantity=''; match_index=-1; confirm_index=-1;
     unit_keys=[];short_prefix='';prefix=None
@@ -96,11 +101,41 @@ def resolveUnit(unit='mm',quantity=''):
                 prefix_value=prefix.getValue()
  
     except ValueError as e:
-        print(e); return (None,None,None)
+        reportError(e); return (None,None,None)
     else:        
         return (prefix_value,unit_found,physical_quantity)
 
 
+# buildUnitRegistry() returns the dict {(unit spelling, QUANTITY): (prefix,unit,quantity)} of
+# every unit name of scanUnit() with and without a prefix symbol or prefix name;
+# e.g. 'kPa', 'kiloPa', 'megapascals', 'mmHg'; the entries are resolved by scanUnit()
+def buildUnitRegistry():
+    registry={}
+    with contextlib.redirect_stdout(io.StringIO()):
+        for (quantity,unit_keys) in unit_quantities.items():
+            for u in unit_keys:
+                for name in unit_names[u]:
+                    for prefix in ['']+list(prefix_values.keys())+list(prefix_names.values()):
+                        try: resolved=scanUnit(prefix+name,quantity)
+                        except KeyError: continue # prefix 'd' has no name in Prefix
+                        if resolved[0]!=None: registry[(prefix+name,quantity)]=resolved
+    return registry
+
+unit_registry=buildUnitRegistry()
+
+
+# resolveUnit(unit='mm') returns a tuple of unit, it's prefix, it's quantity; (prefix,unit,quantity)
+# by one look up in unit_registry; other spellings are resolved by scanUnit() and the valid 
+# ones are added to the registry
+def resolveUnit(unit='mm',quantity=''):
+    key=(unit,quantity.upper())
+    resolved=unit_registry.get(key)
+    if resolved==None:
+        resolved=scanUnit(unit,quantity)
+        if resolved[0]!=None: unit_registry[key]=resolved
+    return resolved
+
+
 # Unit('unit') creates physical unit object
 class Unit:
     # unit constructor
@@ -0,0 +1,95 @@
+'''
+Module Name:'batch_csv'
+Path:'<package_root>/src/batch_csv.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, batch_csv.py calculates psychrometric properties of the rows \
+    of a CSV file (sensor logs of dry bulb temperature, relative humidity and pressure). \
+    The rows are read in chunks of fixed size; every chunk is calculated at once by \
+    PsychroStateArray and written to the output before the next chunk is read. \
+    Therefore the memory use does not depend on the size of the file.'
+Dependency: csv, numpy, psychro.src.PsychroState
+'''
+from __future__ import division
+import csv
+import numpy as np
+from psychro.src.PsychroState import PsychroStateArray
+
+__version__='1.0.0.2026.10.18'
+version='1.0.0.2026.10.18'
+
+# properties which can be calculated; methods of PsychroStateArray
+batch_properties=['satVaporPressure','partialPressure','dewPoint','moleFraction','absoluteHumidity',\
+    'humidityRatio','massFraction','volumetricHumidity','humidVolume','humidDensity','humidMolarMass',\
+    'wetBulbTemperature','humidSaturationEnthalpy','humidAirEnthalpy','directEnthalpy','dryAirEnthalpy','waterVaporEnthalpy']
+
+
+# readChunks() yields lists of at most chunkSize rows of a csv reader
+def readChunks(reader, chunkSize=10000):
+    chunk=[]
+    for row in reader:
+        chunk.append(row)
+        if len(chunk)==chunkSize: yield chunk; chunk=[]
+    if chunk: yield chunk
+
+
+# toFloat() returns float value of a string; NaN if it is not a number
+def toFloat(value=''):
+    try: return float(value)
+    except ValueError: return float('nan')
+
+
+# columnValues() returns the float array of the column i of the rows; NaN for the
+# missing fields and the fields which are not numbers
+def columnValues(rows, i):
+    column=[row[i] if i<len(row) else '' for row in rows]
+    try: return np.array(column,dtype=np.float64)
+    except ValueError: return np.array([toFloat(v) for v in column],dtype=np.float64)
+
+
+# columnIndex() returns the index of a column name in the header
+def columnIndex(header, name):
+    if name not in header: raise ValueError("Column '"+str(name)+"' is not in the CSV header")
+    return header.index(name)
+
+
+# rowErrorCodes() returns the error code of every state of a PsychroStateArray; the code
+# of the inputs or else the code of the first property without solution
+def rowErrorCodes(state, properties):
+    codes=state.errorCodes()
+    for name in properties: codes=np.where(codes==0,state.errorCodes(name),codes)
+    return codes
+
+
+# processCSV() reads the rows of the input file object (with header), calculates the
+# properties of every row and writes the rows with the property columns to the output
+# file object; the pressure is taken from the column 'pressure' or given as pressureValue
+# Invalid rows get 'nan' in the property columns; with errorColumn=True the column 'error'
+# has the error code of every row (see error_codes of error_policy); nothing is printed
+# returns (number of rows, number of invalid rows)
+def processCSV(inputFile, outputFile, properties=None, temperature='temperature', \
+    relHumidity='relHumidity', pressure='pressure', tempUnit='C', pressureUnit='Pa', \
+    pressureValue=None, chunkSize=10000, delimiter=',', errorColumn=False):
+    if properties is None: properties=['dewPoint','wetBulbTemperature','humidAirEnthalpy','humidVolume']
+    for name in properties:
+        if name not in batch_properties: raise ValueError(str(name)+' is not a batch property')
+    if chunkSize<1: raise ValueError('Invalid chunk size')
+    reader=csv.reader(inputFile,delimiter=delimiter)
+    writer=csv.writer(outputFile,delimiter=delimiter,lineterminator='\n')
+    header=next(reader,None)
+    if header is None: raise ValueError('CSV file has no header')
+    (ti,ri)=(columnIndex(header,temperature),columnIndex(header,relHumidity))
+    pi=columnIndex(header,pressure) if pressureValue is None else None
+    writer.writerow(header+list(properties)+(['error'] if errorColumn else []))
+    (count,invalid)=(0,0)
+    for rows in readChunks(reader,chunkSize):
+        p=pressureValue if pi is None else columnValues(rows,pi)
+        state=PsychroStateArray(columnValues(rows,ti),columnValues(rows,ri),p,tempUnit,pressureUnit)
+        columns=[getattr(state,name)()[0].tolist() for name in properties]
+        if errorColumn: columns.append(rowErrorCodes(state,properties).tolist())
+        writer.writerows(row+list(values) for (row,values) in zip(rows,zip(*columns)))
+        count+=len(rows); invalid+=int(np.count_nonzero(~state.getValidMask()))
+    return (count,invalid)
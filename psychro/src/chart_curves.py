@@ -0,0 +1,109 @@
+'''
+Module Name:'chart_curves'
+Path:'<package_root>/src/chart_curves.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, chart_curves.py generates the curves of the psychrometric chart \
+    (humidity ratio against dry bulb temperature) at a given pressure: saturation, \
+    constant relative humidity, constant wet bulb temperature, constant enthalpy and \
+    constant specific volume. Every family of curves is one 2D array (curve, temperature) \
+    calculated at once; points outside the chart are NaN. The curves are kept in a \
+    cache keyed on the pressure, the resolution and the curve values.'
+Equations: (same as the scalar functions; y=mole fraction, W=humidity ratio)
+    relative humidity: y=rh*Psat(t)/(100*P); W=0.6218*y/(1-y)
+    wet bulb temperature: x=x0-0.00041667*(twb-t) with x0=mass fraction at t as
+        wetBulbTemperature(); x at twb is the saturated 0.6218*Psat/(P-Psat); W=x0/(1-x0)
+    enthalpy: humidAirEnthalpy() is the saturation enthalpy at the wet bulb temperature,
+        so a constant enthalpy line is the wet bulb line of twb with hsat(twb)=h
+    specific volume: v=287.2*(t+273.15)/(P*(1-y)) as humidVolume()
+Dependency: functools, numpy, psychro.src.psychro_arrays, psychro.src.PsychroState, \
+    psychro.src.profiler
+'''
+from __future__ import division
+import functools
+import numpy as np
+import psychro.src.psychro_arrays as psya
+from psychro.src.PsychroState import saturationEnthalpy
+import psychro.src.profiler as prof
+
+__version__='1.0.0.2026.10.18'
+version='1.0.0.2026.10.18'
+
+chart_cache_size=32
+
+
+# satPascal() returns saturated vapor pressures in Pa of celcius values
+def satPascal(t):
+    return 133322.368421*(psya.satPressureValues(np.asarray(t,dtype=np.float64))*0.001)
+
+
+# wetBulbLines() returns the humidity ratios (curve, temperature) of the constant wet bulb
+# temperature lines of twb at the temperatures t and pressure p; NaN for t < twb
+def wetBulbLines(twb, t, p):
+    satp=satPascal(twb)
+    xsat=0.6218*satp/(p-satp)
+    x0=xsat[:,None]+0.00041667*(twb[:,None]-t[None,:])
+    w=x0/(1-x0)
+    return np.where((t[None,:]>=twb[:,None])&(x0>=0),w,np.nan)
+
+
+# enthalpyWetBulb() returns the wet bulb temperatures (C) whose saturation enthalpy is h
+# (kJ/kgDA) at pressure p; interpolated on the table (t, hsat) and refined by secant steps
+def enthalpyWetBulb(h, t, hsat, p):
+    twb=np.interp(h,hsat,t,left=np.nan,right=np.nan)
+    hs=lambda x: saturationEnthalpy(x,float(satPascal(x)),p); iterations=0
+    for i in np.flatnonzero(~np.isnan(twb)):
+        a=float(twb[i]); fa=hs(a)-h[i]
+        b=a-1e-3 if a-1e-3>=t[0] else a+1e-3; fb=hs(b)-h[i]
+        for k in range(20):
+            if fa==0 or fa==fb: break
+            (a,b,fb)=(a-fa*(a-b)/(fa-fb),a,fa); fa=hs(a)-h[i]; iterations+=1
+            if abs(a-b)<1e-10: break
+        twb[i]=a
+    prof.addIterations(iterations)
+    return twb
+
+
+# chartCurves() returns the dict of the chart curves at pressure p(Pa) between tmin and tmax
+# (C) at resolution (C); the curve values are tuples (None: default values)
+# keys: 'pressure', 'temperature', 'saturation' and (values, humidity ratio array) of
+#     'relHumidity', 'wetBulb', 'enthalpy' (with the wet bulb of each line) and 'volume'
+# The arrays are read only since they are shared by the cache
+@functools.lru_cache(maxsize=chart_cache_size)
+def chartCurves(pressure=101325.0, resolution=0.1, tmin=0.0, tmax=50.0, relHumidity=None, \
+    wetBulb=None, enthalpy=None, volume=None):
+    p=float(pressure)
+    if not p>0: raise ValueError('Pressure is not positive')
+    if not (resolution>0 and tmin>=0 and tmax<=150 and tmin<tmax): raise ValueError('Invalid temperature range of the chart')
+    n=int(round((tmax-tmin)/resolution))+1
+    t=tmin+resolution*np.arange(n); t[-1]=tmax
+    satp=satPascal(t)
+    wsat=0.6218*(100*satp/(100*p))/(1-100*satp/(100*p))
+    # constant relative humidity
+    rh=np.array(relHumidity if relHumidity is not None else range(10,101,10),dtype=np.float64)
+    y=rh[:,None]*satp[None,:]/(100*p)
+    w_rh=0.6218*y/(1-y)
+    # constant wet bulb temperature
+    twb=np.array(wetBulb if wetBulb is not None else np.arange(np.ceil(tmin/5)*5,tmax+1e-9,5),dtype=np.float64)
+    w_wb=wetBulbLines(twb,t,p)
+    # constant enthalpy
+    hsat=psya.saturationEnthalpyValues(t,satp,p)
+    h=np.array(enthalpy if enthalpy is not None else np.arange(np.ceil(hsat[0]/10)*10,hsat[-1],10),dtype=np.float64)
+    twb_h=enthalpyWetBulb(h,t,hsat,p)
+    w_h=wetBulbLines(twb_h,t,p)
+    # constant specific volume
+    if volume is not None: v=np.array(volume,dtype=np.float64)
+    else:
+        (vmin,vmax)=(287.2*(tmin+273.15)/p,287.2*(tmax+273.15)/(p*(1-satp[-1]/p)))
+        v=np.arange(np.ceil(vmin*100)/100,vmax,0.01)
+    yv=1-287.2*(t[None,:]+273.15)/(p*v[:,None])
+    w_v=np.where((yv>=0)&(yv<=satp[None,:]/p),0.6218*yv/(1-yv),np.nan)
+    curves={'pressure':p,'temperature':t,'saturation':wsat,'relHumidity':(rh,w_rh),'wetBulb':(twb,w_wb),\
+        'enthalpy':(h,w_h,twb_h),'volume':(v,w_v)}
+    for value in curves.values():
+        for a in (value if isinstance(value,tuple) else (value,)):
+            if isinstance(a,np.ndarray): a.setflags(write=False)
+    return curves
@@ -0,0 +1,97 @@
+'''
+Module Name:'dataframe_accessor'
+Path:'<package_root>/src/dataframe_accessor.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, dataframe_accessor.py has the class PsychroAccessor which is \
+    registered as the accessor df.psychro of pandas DataFrames by psychro.dataframe. \
+    The columns of dry bulb temperature, relative humidity and pressure are read as \
+    float64 NumPy arrays (without copy when they are float64 already) and calculated at \
+    once by PsychroStateArray; no object is created per row. The properties are \
+    returned as a new DataFrame with the index of the frame or added to the frame as \
+    new columns; the other columns of the frame are not copied.'
+Dependency: numpy, pandas, psychro.src.PsychroState, psychro.src.batch_csv
+'''
+from __future__ import division
+import numpy as np
+import pandas as pd
+from psychro.src.PsychroState import PsychroStateArray
+from psychro.src.batch_csv import batch_properties, rowErrorCodes
+
+__version__='1.0.0.2026.10.18'
+version='1.0.0.2026.10.18'
+
+# properties which can be calculated; methods of PsychroStateArray (see batch_csv)
+dataframe_properties=batch_properties
+default_properties=['dewPoint','wetBulbTemperature','humidAirEnthalpy','humidVolume']
+
+
+# columnValues() returns the float64 array of the column of the frame; missing values
+# (NaN, None, pd.NA) are NaN. A value which is not a column name (e.g. the pressure of
+# the site) is returned as it is
+def columnValues(frame, column):
+    if not isinstance(column,str): return column
+    if column not in frame.columns: raise ValueError("Column '"+column+"' is not in the DataFrame")
+    series=frame[column]
+    if not isinstance(series,pd.Series): raise ValueError("Column '"+column+"' is not unique in the DataFrame")
+    if series.dtype==np.float64: return series.to_numpy(copy=False)
+    try: return series.to_numpy(dtype=np.float64,na_value=np.nan)
+    except (TypeError,ValueError): raise ValueError("Column '"+column+"' is not numeric")
+
+
+# unitStrings() returns (tempUnit, pressureUnit) of the units dict {'T':unit, 'p':unit}
+def unitStrings(units=None):
+    units={} if units is None else dict(units)
+    for key in units:
+        if key not in ('T','p'): raise ValueError(str(key)+" is not a unit key ('T' or 'p')")
+    return (units.get('T','C'),units.get('p','Pa'))
+
+
+# columnNames() returns {property: column name} of a list of properties or of a dict
+# {property: column name}
+def columnNames(properties=None):
+    if properties is None: properties=default_properties
+    elif isinstance(properties,str): properties=[properties]
+    names=dict(properties) if isinstance(properties,dict) else {name:name for name in properties}
+    for name in names:
+        if name not in dataframe_properties: raise ValueError(str(name)+' is not a dataframe property')
+    return names
+
+
+# PsychroAccessor is the accessor df.psychro of pandas DataFrames (registered by psychro.dataframe)
+# T, rh and p are column names; p (and T, rh) may be a number or an array instead
+# units={'T':'F', 'p':'kPa'} gives the units of the temperature and pressure columns (default C, Pa)
+class PsychroAccessor:
+
+    def __init__(self, frame):
+        self._frame=frame
+
+    # state() returns the PsychroStateArray of the rows
+    def state(self, T='temperature', rh='relHumidity', p='pressure', units=None):
+        (tempUnit,pressureUnit)=unitStrings(units)
+        frame=self._frame
+        return PsychroStateArray(columnValues(frame,T),columnValues(frame,rh),columnValues(frame,p),tempUnit,pressureUnit)
+
+    # calculate() returns a new DataFrame (index of the frame) of the property columns;
+    # properties is a list of property names or a dict {property: column name}
+    # invalid rows are NaN; with errorColumn=True the column 'error' has the error code
+    # of every row (see error_codes of error_policy)
+    def calculate(self, properties=None, T='temperature', rh='relHumidity', p='pressure', units=None, \
+        errorColumn=False):
+        names=columnNames(properties)
+        state=self.state(T,rh,p,units)
+        columns={column:getattr(state,name)()[0] for (name,column) in names.items()}
+        if errorColumn: columns['error']=rowErrorCodes(state,list(names))
+        return pd.DataFrame(columns,index=self._frame.index,copy=False)
+
+    # add() adds the property columns to the frame in place (an existing column of the same
+    # name is replaced) and returns the frame; arguments as calculate()
+    def add(self, properties=None, T='temperature', rh='relHumidity', p='pressure', units=None, \
+        errorColumn=False):
+        frame=self._frame
+        result=self.calculate(properties,T,rh,p,units,errorColumn)
+        for column in result.columns: frame[column]=result[column].to_numpy(copy=False)
+        return frame
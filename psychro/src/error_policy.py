@@ -0,0 +1,85 @@
+'''
+Module Name:'error_policy'
+Path:'<package_root>/src/error_policy.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, error_policy.py holds the error policy of the package. The \
+    psychrometric functions and the Pressure, Temperature, Unit and Prefix classes \
+    report their errors by reportError() and the array functions check their invalid \
+    elements by checkErrorCodes(); what happens is selected by setErrorPolicy() for all \
+    threads or by the with statement errorPolicy() for the current thread or asyncio task \
+    only (a context variable).'
+Error Policies:
+    'print': print the error and return None (default; as before)
+    'raise': raise the error (array functions raise ValueError for invalid elements)
+    'nan': return NaN without printing
+    'mask': return None without printing
+    The array functions never print; except 'raise', they return NaN and the validity mask.
+Dependency: contextlib, contextvars, numpy
+'''
+from __future__ import division
+import contextlib
+import contextvars
+import numpy as np
+
+__version__='1.0.0.2026.10.18'
+version='1.0.0.2026.10.18'
+
+error_policies=['print','raise','nan','mask']
+# error_policy is the policy of all threads (setErrorPolicy()); the policy of a with statement
+# (errorPolicy()) is held by the context variable of the thread or task
+error_policy='print'
+policy_context=contextvars.ContextVar('error_policy',default=None)
+
+# Error codes of the array elements (see errorCodes() of psychro_arrays)
+error_codes={0:'valid',1:'value is not a number',2:'temperature is out of valid range (0-150C)',\
+    3:'relative humidity is out of range (0-100%)',4:'pressure is not positive',\
+    5:'vapor pressure is out of range of saturated temperature',\
+    6:'no solution (wet bulb temperature below 0 C or not converged)'}
+
+
+# setErrorPolicy() selects the error policy of all psychrometric functions in all threads;
+# a with statement of errorPolicy() still overrides it in its context
+def setErrorPolicy(policy='print'):
+    global error_policy
+    if policy not in error_policies: raise ValueError("Unknown error policy: "+str(policy))
+    error_policy=policy
+
+
+# getErrorPolicy() returns the current error policy of the caller
+def getErrorPolicy():
+    policy=policy_context.get()
+    return error_policy if policy is None else policy
+
+
+# errorPolicy() selects the error policy inside a with statement; only the current thread
+# (or asyncio task) uses it, the other threads keep their policy
+#     with errorPolicy('nan'): ...
+@contextlib.contextmanager
+def errorPolicy(policy='print'):
+    if policy not in error_policies: raise ValueError("Unknown error policy: "+str(policy))
+    token=policy_context.set(policy)
+    try: yield policy
+    finally: policy_context.reset(token)
+
+
+# reportError() reports an error by the current error policy; returns the value of
+# the function in error (None or NaN) or raises the error
+def reportError(error):
+    policy=getErrorPolicy()
+    if policy=='print': print(error)
+    elif policy=='raise': raise error
+    elif policy=='nan': return float('nan')
+    return None
+
+
+# checkErrorCodes() raises ValueError for the first invalid element of an error code
+# array when the error policy is 'raise'
+def checkErrorCodes(codes):
+    if getErrorPolicy()=='raise' and np.any(codes):
+        invalid=np.flatnonzero(codes)
+        raise ValueError('{0:d} invalid elements; element {1:d}: {2:s}'.format(invalid.size,\
+            int(invalid[0]),error_codes[int(codes.flat[invalid[0]])]))
@@ -0,0 +1,209 @@
+'''
+Module Name:'fast_functions'
+Path:'<package_root>/src/fast_functions.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, fast_functions.py creates the plain float versions of the \
+    psychrometric functions. Arguments are plain numbers in fixed units: temperature \
+    in C, relative humidity in %, pressure in Pa. The results are plain floats in the \
+    units of psychro_functions; no Temperature or Pressure object is created. \
+    Invalid arguments give NaN instead of printing an error. The correlations, the \
+    saturation backend and the enthalpy cache are shared with psychro_functions.'
+Dependency: math, psychro.src.psychro_functions
+'''
+from __future__ import division
+import math
+import psychro.src.psychro_functions as psyf
+
+__version__='1.0.0.2026.10.18'
+version='1.0.0.2026.10.18'
+
+nan=float('nan')
+
+
+# satVaporPressure() returns saturated water vapor pressure in Pa at t(C); 0 <= t <= 150
+# backend selects the saturation backend of this call (None: the current backend)
+# Fast Function No:01
+def satVaporPressure(t, backend=None):
+    p=psyf.satPressureValue(t,backend)
+    if p is None: return nan
+    return 133322.368421*(p*0.001) # mmHg -> mHg -> Pa as Pressure class
+
+
+# satTemperature() returns saturated water vapor temperature in C at vapor pressure p(Pa)
+# Fast Function No:02
+def satTemperature(p, backend=None):
+    p=p*7.500616827e-6
+    if not p>0: return nan
+    t=psyf.satTemperatureValue(p,backend)
+    if t is None: return nan
+    return t
+
+
+# dryAirPressure() returns pressure of dry air in Pa at t(C) in a closed system
+# Fast Function No:03
+def dryAirPressure(t):
+    if not t>=0: return nan
+    return (101325-satVaporPressure(15))*(t+273.15)/288.15
+
+
+# humidAirPressure() returns total pressure in Pa of water vapor and dry air at t(C)
+# in a closed system
+# Fast Function No:04
+def humidAirPressure(t, rh):
+    if not (rh>=0 and rh<=100): return nan
+    return satVaporPressure(t)+dryAirPressure(t)
+
+
+# dewPoint() returns dew point in C at t(C) and relative humidity rh(%)
+# Fast Function No:05
+def dewPoint(t, rh):
+    if not (rh>0 and rh<=100): return nan
+    if rh==100: return t
+    return satTemperature(rh*satVaporPressure(t)/100)
+
+saturatedTemperature=dewPoint
+
+
+# partialPressure() returns partial pressure of water vapor in Pa at t(C) and rh(%)
+# Fast Function No:06
+def partialPressure(t, rh):
+    if not (rh>=0 and rh<=100): return nan
+    return rh*satVaporPressure(t)/100
+
+
+# relativeHumidity() returns relative humidity(%) at t(C) and dew point td(C)
+# Fast Function No:07
+def relativeHumidity(t, td):
+    if not (t>=0 and t>=td): return nan
+    if abs(t-td)<10:
+        satpDewPoint=satVaporPressure(td)
+        y=satpDewPoint/(dryAirPressure(td)+satpDewPoint)
+        return 100*(dryAirPressure(t)*y/(1-y))/satVaporPressure(t)
+    return 100*satVaporPressure(td)/satVaporPressure(t)
+
+
+# moleFraction() returns moles of vapor/moles of humid air at t(C), rh(%) and p(Pa)
+# Fast Function No:08
+def moleFraction(t, rh, p):
+    if not (rh>=0 and rh<=100 and p>0): return nan
+    return rh*satVaporPressure(t)/(100*p)
+
+
+# absoluteHumidity() returns mass of vapor / mass of dry air (kg/kgDA)
+# Fast Function No:09
+def absoluteHumidity(t, rh, p):
+    y=moleFraction(t,rh,p)
+    return 0.6218*y/(1-y) # 0.6218=18/28.947
+
+moistureContent=absoluteHumidity
+humidityRatio=absoluteHumidity
+specificHumidity=absoluteHumidity
+
+
+# massFraction() returns mass of vapor / mass of humid air (kg/kgHA)
+# Fast Function No:10
+def massFraction(t, rh, p):
+    x=absoluteHumidity(t,rh,p)
+    return x/(1+x)
+
+
+# volumetricHumidity() returns mass of water vapor per unit volume of humid air (kg/m3)
+# Fast Function No:11
+def volumetricHumidity(t, rh, p):
+    return 0.002165*partialPressure(t,rh)/(t+273.15) #0.002165=18/(8.314*1000)
+
+vaporDensity=volumetricHumidity
+
+
+# humidVolume() returns volume of humid air per unit mass of dry air (m3/kgDA)
+# Fast Function No:12
+def humidVolume(t, rh, p):
+    y=moleFraction(t,rh,p)
+    return 287.2*(t+273.15)/(p*(1-y)) #287.2=8.314*1000/28.947
+
+
+# humidDensity() returns mass of humid air per unit volume of humid air (kgHA/m3)
+# Fast Function No:13
+def humidDensity(t, rh, p):
+    y=moleFraction(t,rh,p)
+    return (1-0.37817*y)*0.0034817*p/(t+273.15)
+
+
+# humidMolarMass() returns molar mass of humid air (g/mol)
+# Fast Function No:14
+def humidMolarMass(t, rh, p):
+    y=moleFraction(t,rh,p)
+    return (1-y)*28.947+y*18
+
+
+# wetBulbResidual() returns partial pressure on the constant wet bulb temperature line
+# minus the saturated vapor pressure at twb (Pa); see wetBulbTemperatureArray()
+wetBulbResidual=psyf.wetBulbResidualValue
+
+
+# wetBulbTemperature() returns wet bulb temperature in C at t(C), rh(%) and p(Pa)
+# Method: Illinois (bracketed secant) iteration on the constant wet bulb temperature line
+#     between 0 C and t by wetBulbValue() of psychro_functions; the same solver and result
+#     as wetBulbTemperature() of lib and wetBulbTemperatureArray()
+# tol is the final bracket width in C; NaN when the wet bulb temperature is below 0 C
+# start (C, optional) warm starts from a close wet bulb temperature (e.g. of the previous
+# sample of a time series) with the bracket start-step..start+step as wetBulbTemperatureArray()
+# Fast Function No:15
+def wetBulbTemperature(t, rh, p, tol=1e-6, maxIter=100, start=None, step=1.0):
+    x0=massFraction(t,rh,p)
+    if x0!=x0: return nan
+    if rh==100: return t
+    return psyf.wetBulbValue(t,x0,p,tol,maxIter,start,step)[0]
+
+
+# humidSaturationEnthalpy() returns saturation enthalpy of humid air in kJ/kgDA at t(C)
+# and p(Pa); (Ref. Temp.=273.15K)
+# Fast Function No:16
+def humidSaturationEnthalpy(t, p=101325):
+    satp=satVaporPressure(t)
+    if not p>0 or satp!=satp: return nan
+    y=100*satp/(100*p)
+    molarmassha=(1-y)*28.947+y*18
+    x=0.6218*y/(1-y); x=x/(1+x)
+    T=t+273.15; P=p/100000
+    delH=(1-y)*psyf.delHDryAirValue(T,P) + y*psyf.delHH2OValue(T,P)
+    return 26.35339042 + delH/(molarmassha*(1-x))
+
+
+# humidAirEnthalpy() returns enthalpy of humid air in kJ/kgDA at t(C), rh(%) and p(Pa);
+# saturation enthalpy at the wet bulb temperature (Ref. Temp.=273.15K)
+# Fast Function No:17
+def humidAirEnthalpy(t, rh, p):
+    twb=wetBulbTemperature(t,rh,p)
+    if twb!=twb: return nan
+    return humidSaturationEnthalpy(twb,p)
+
+
+# dryAirEnthalpy() returns enthalpy of dry air in kJ/kgDA at t(C) and p(Pa)
+# Fast Function No:18
+def dryAirEnthalpy(t, p):
+    if not (t>=0 and p>0): return nan
+    return 26.273618984842212 + psyf.delHDryAirValue(t+273.15,p/100000)/28.947
+
+
+# waterVaporEnthalpy() returns enthalpy change of water vapor in kJ/kgDA at t(C), rh(%)
+# and p(Pa)
+# Fast Function No:19
+def waterVaporEnthalpy(t, rh, p):
+    x=absoluteHumidity(t,rh,p)
+    if x!=x: return nan
+    return x*psyf.delHH2OValue(t+273.15,p/100000)/18
+
+
+# directEnthalpy() returns enthalpy of humid air in kJ/kgDA at t(C), rh(%) and p(Pa)
+# directly from the humidity ratio: h=cp_a*t+W*(h_fg+cp_v*t) (Ref. Temp.=273.15K)
+# Fast Function No:20
+def directEnthalpy(t, rh, p):
+    x=absoluteHumidity(t,rh,p)
+    if x!=x: return nan
+    return psyf.cp_dry_air*t+x*(psyf.h_evaporation+psyf.cp_water_vapor*t)
+
@@ -0,0 +1,166 @@
+'''
+Module Name:'inverse_state'
+Path:'<package_root>/src/inverse_state.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, inverse_state.py finds the state of humid air (dry bulb \
+    temperature, relative humidity) from two other properties and the pressure, for \
+    arrays of states at once. The inverses are taken from the equations of the forward \
+    functions, so the found state gives back the given properties:'
+    dew point: rh=100*Psat(td)/Psat(t) as dewPoint(); Psat(td) below 0 C is solved from the
+        inverse function of the saturation backend, which dewPoint() uses
+    humidity ratio: y=W/(0.6218+W), rh=100*y*P/Psat(t) as absoluteHumidity()
+    wet bulb temperature: mass fraction x0=xsat(twb)+0.00041667*(twb-t) on the constant
+        wet bulb temperature line of wetBulbTemperature()
+    enthalpy: humidAirEnthalpy() is the saturation enthalpy at the wet bulb temperature,
+        so twb is solved from hsat(twb)=h by safeguarded Newton iteration
+    relative humidity with wet bulb temperature or enthalpy: the dry bulb temperature on
+        the wet bulb line is solved by safeguarded Newton iteration
+Dependency: numpy, psychro.src.psychro_arrays, psychro.src.PsychroState, psychro.src.profiler
+'''
+from __future__ import division
+import numpy as np
+import psychro.src.psychro_arrays as psya
+from psychro.src.PsychroState import PsychroStateArray
+import psychro.src.profiler as prof
+
+__version__='1.0.0.2026.10.18'
+version='1.0.0.2026.10.18'
+
+# property pairs which can be solved; the names are the names of the lib functions
+state_pairs=[('temperature','relHumidity'),('temperature','wetBulbTemperature'),('temperature','dewPoint'),\
+    ('temperature','humidityRatio'),('temperature','humidAirEnthalpy'),('humidAirEnthalpy','relHumidity'),\
+    ('wetBulbTemperature','relHumidity')]
+
+
+# satPascal() returns saturated vapor pressures in Pa of celcius values
+def satPascal(t):
+    return 133322.368421*(psya.satPressureValues(t)*0.001)
+
+
+# dewPointPascal() returns the partial pressures in Pa of dew points (C) by the current
+# saturation backend; below 0 C, where the forward functions are not valid, the pressure is
+# solved from the inverse function of the backend as dewPoint() of low vapor pressures does
+def dewPointPascal(td):
+    p=satPascal(td)
+    below=td<0
+    if below.any(): p[below]=133322.368421*(belowZeroPressure(td[below])*0.001)
+    return p
+
+
+# belowZeroPressure() returns the vapor pressures in mmHg of which the inverse function of
+# the current saturation backend gives the dew points td below 0 C; Newton iteration on
+# ln(p) with the numerical derivative, started from the lower branch of Antoine equation
+def belowZeroPressure(td, tol=1e-12, maxIter=20):
+    y=np.log(10**(8.10765-(1750.286/(td+235)))*0.001); delta=1e-6
+    for k in range(maxIter):
+        t=psya.satTemperatureValues(np.exp(y))
+        step=(t-td)*delta/(psya.satTemperatureValues(np.exp(y+delta))-t)
+        y=y-step
+        if not np.nanmax(np.abs(step),initial=0)>=tol: break
+    return np.exp(y)*1000
+
+
+# satPascalSlope() returns the derivative (Pa/C) of the saturated vapor pressure satp at t
+# by the numerical derivative of the current saturation backend (backward at 150 C)
+def satPascalSlope(t, satp):
+    delta=1e-6
+    forward=(satPascal(t+delta)-satp)/delta
+    return np.where(np.isnan(forward),(satp-satPascal(t-delta))/delta,forward)
+
+
+# wetBulbHumidity() returns the relative humidity(%) and its derivative with the dry bulb
+# temperature on the constant wet bulb temperature lines of twb (C) at t (C) and p (Pa)
+def wetBulbHumidity(t, twb, p):
+    satwb=satPascal(twb)
+    x0=0.6218*satwb/(p-satwb)+0.00041667*(twb-t)
+    y=x0/(0.6218+0.3782*x0) # mole fraction of humidity ratio x0/(1-x0)
+    dy=-0.00041667*0.6218/(0.6218+0.3782*x0)**2
+    satp=satPascal(t)
+    rh=100*y*p/satp
+    return (rh,100*p*(dy*satp-y*satPascalSlope(t,satp))/satp**2)
+
+
+# newtonSolve() solves fn(x, idx)=0 of every element between lo and hi by Newton iteration;
+# fn returns (value, derivative) of the elements idx; the root is kept bracketed and a step
+# outside the bracket is replaced by bisection; returns (root array, validity mask)
+def newtonSolve(fn, lo, hi, x, tol=1e-9, maxIter=50):
+    (lo,hi,x)=(lo.copy(),hi.copy(),x.copy()); n=x.size
+    (flo,_)=fn(lo,np.arange(n)); (fhi,_)=fn(hi,np.arange(n))
+    bracketed=(flo*fhi<=0)
+    done=~bracketed; x[~bracketed]=np.nan; iterations=0
+    for k in range(maxIter):
+        act=np.flatnonzero(~done)
+        if act.size==0: break
+        iterations+=act.size
+        (f,df)=fn(x[act],act)
+        below=np.sign(f)==np.sign(flo[act])
+        lo[act]=np.where(below,x[act],lo[act]); hi[act]=np.where(below,hi[act],x[act])
+        step=f/df; xn=np.where(f==0,x[act],x[act]-step)
+        # a converged step is kept even on the bracket end (x itself is the end after the update)
+        converged=(f==0)|(np.abs(step)<=tol)
+        outside=~((xn>np.minimum(lo[act],hi[act]))&(xn<np.maximum(lo[act],hi[act])))
+        xn=np.where((outside|~np.isfinite(xn))&~converged,(lo[act]+hi[act])/2,xn)
+        done[act]=converged|(np.abs(xn-x[act])<=tol)
+        x[act]=xn
+    valid=bracketed&done
+    prof.addIterations(iterations)
+    return (np.where(valid,x,np.nan),valid)
+
+
+# enthalpyWetBulb() returns (wet bulb temperature array, mask) of enthalpies h (kJ/kgDA)
+# at pressures p (Pa): hsat(twb)=h between 0 C and 150 C or the boiling point at p
+def enthalpyWetBulb(h, p, tol=1e-9, maxIter=50):
+    def fn(twb, idx):
+        delta=1e-6
+        hs=psya.saturationEnthalpyValues(twb,satPascal(twb),p[idx])
+        hd=psya.saturationEnthalpyValues(twb+delta,satPascal(twb+delta),p[idx])
+        return (hs-h[idx],(hd-hs)/delta)
+    lo=np.zeros(h.size); hi=np.fmin(150,psya.satTemperatureValues(0.999*p*7.500616827e-6))
+    return newtonSolve(fn,lo,hi,np.fmin(25,hi),tol,maxIter)
+
+
+# wetBulbDryBulb() returns (dry bulb temperature array, mask) of the states of relative
+# humidity rh(%) on the wet bulb temperature lines of twb (C) at pressures p (Pa)
+def wetBulbDryBulb(twb, rh, p, tol=1e-9, maxIter=50):
+    def fn(t, idx):
+        (r,dr)=wetBulbHumidity(t,twb[idx],p[idx])
+        return (r-rh[idx],dr)
+    lo=np.where(np.isnan(twb),0,twb); hi=np.full(twb.size,150.0)
+    return newtonSolve(fn,lo,hi,np.minimum(lo+5,150),tol,maxIter)
+
+
+# solveState() returns the PsychroStateArray of the states given by two properties and the
+# pressure; properties is a dict of two arrays (see state_pairs) named as the lib functions:
+# temperature, wetBulbTemperature, dewPoint (in tempUnit), relHumidity(%),
+# humidityRatio (kgV/kgDA), humidAirEnthalpy (kJ/kgDA)
+# States without solution are invalid in the validity mask of the returned state
+def solveState(properties=None, pressure=None, tempUnit='C', pressureUnit='Pa', tol=1e-9, maxIter=50):
+    if properties is None or pressure is None: raise ValueError("Properties or pressure are not set")
+    pairs=[pair for pair in state_pairs if set(pair)==set(properties)]
+    if len(pairs)!=1: raise ValueError('Cannot solve the state from '+', '.join(str(k) for k in properties))
+    names=pairs[0]
+    arrays=[]
+    for name in names:
+        if name in ['temperature','wetBulbTemperature','dewPoint']: arrays.append(psya.celciusArray(properties[name],tempUnit))
+        else: arrays.append(psya.toArray(properties[name]))
+    p=psya.pascalArray(pressure,pressureUnit)
+    (a,b,p)=[x.astype(np.float64).ravel() for x in np.broadcast_arrays(arrays[0],arrays[1],p)]
+    shape=np.broadcast(*arrays,psya.pascalArray(pressure,pressureUnit)).shape
+    if names[0]=='temperature':
+        t=a
+        if names[1]=='relHumidity': rh=b
+        elif names[1]=='dewPoint': rh=100*dewPointPascal(b)/satPascal(t)
+        elif names[1]=='humidityRatio': y=b/(0.6218+b); rh=100*y*p/satPascal(t)
+        elif names[1]=='wetBulbTemperature': rh=wetBulbHumidity(t,b,p)[0]
+        else: rh=wetBulbHumidity(t,enthalpyWetBulb(b,p,tol,maxIter)[0],p)[0]
+        rh=np.where(t==b,100,rh) if names[1] in ['dewPoint','wetBulbTemperature'] else rh
+    else:
+        twb=enthalpyWetBulb(a,p,tol,maxIter)[0] if names[0]=='humidAirEnthalpy' else a
+        rh=b
+        t=wetBulbDryBulb(twb,rh,p,tol,maxIter)[0]
+        t=np.where(rh==100,twb,t)
+    return PsychroStateArray(t.reshape(shape),rh.reshape(shape),p.reshape(shape))
@@ -0,0 +1,98 @@
+'''
+Module Name:'parallel_states'
+Path:'<package_root>/src/parallel_states.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, parallel_states.py calculates the properties of large arrays \
+    of humid air states in worker processes. The states are split into chunks, every \
+    chunk is calculated by PsychroStateArray in a worker of a ProcessPoolExecutor and \
+    the results are put together in the order of the states. The pool is kept open \
+    between the calls, so the enthalpy caches of the workers stay warm; shutdown() \
+    closes it.'
+Dependency: os, atexit, concurrent.futures, numpy, psychro.src.PsychroState, \
+    psychro.src.psychro_functions, psychro.src.psychro_arrays, psychro.src.error_policy, psychro.src.batch_csv
+'''
+from __future__ import division
+import os, atexit
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from psychro.src.PsychroState import PsychroStateArray
+from psychro.src.batch_csv import batch_properties
+import psychro.src.psychro_functions as psyf
+import psychro.src.psychro_arrays as psya
+import psychro.src.error_policy as errp
+
+__version__='1.0.0.2026.10.18'
+version='1.0.0.2026.10.18'
+
+# the open pool and its (workers, saturation backend, error policy)
+pool=None
+pool_key=None
+
+
+# initWorker() sets the saturation backend and the error policy of a worker process as
+# the parent process
+def initWorker(backend='antoine', policy='print'):
+    psyf.setSaturationBackend(backend); errp.setErrorPolicy(policy)
+
+
+# stateChunk() returns the [(values, mask), ...] of the properties of a chunk of states
+def stateChunk(t, rh, p, properties):
+    state=PsychroStateArray(t,rh,p)
+    return [getattr(state,name)() for name in properties]
+
+
+# getPool() returns the open pool of the given number of workers; a new pool is created
+# when the number of workers, the saturation backend or the error policy has changed
+def getPool(workers):
+    global pool, pool_key
+    key=(workers,psyf.getSaturationBackend(),errp.getErrorPolicy())
+    if pool is None or pool_key!=key:
+        shutdown()
+        pool=ProcessPoolExecutor(max_workers=workers,initializer=initWorker,initargs=key[1:])
+        pool_key=key
+    return pool
+
+
+# shutdown() closes the open pool of the worker processes
+def shutdown():
+    global pool, pool_key
+    if pool is not None: pool.shutdown(); pool=None; pool_key=None
+
+atexit.register(shutdown)
+
+
+# mapStates() calculates the properties of humid air states; inputs are rows of
+# (temperature, relative humidity(%), pressure) or the three arrays in (tempUnit, pressureUnit)
+# workers: number of worker processes (default: number of CPUs); chunksize: states per task
+# returns {property: (float array, validity mask)} in the order of the inputs
+def mapStates(inputs=None, properties=None, workers=None, chunksize=None, tempUnit='C', pressureUnit='Pa'):
+    if inputs is None: raise ValueError("States are not set")
+    if properties is None: properties=['dewPoint','wetBulbTemperature','humidAirEnthalpy','humidVolume']
+    for name in properties:
+        if name not in batch_properties: raise ValueError(str(name)+' is not a state property')
+    if isinstance(inputs,tuple) and len(inputs)==3: (t,rh,p)=inputs
+    else:
+        rows=np.asarray(inputs,dtype=np.float64)
+        if rows.ndim!=2 or rows.shape[1]!=3: raise ValueError("States must be rows of (temperature, relHumidity, pressure)")
+        (t,rh,p)=rows.T
+    # units are converted once here; the workers get celcius and pascal arrays
+    (t,rh,p,_)=psya.humidityArrays(t,rh,p,tempUnit,pressureUnit)
+    (t,rh,p)=(t.ravel(),rh.ravel(),p.ravel())
+    n=t.size
+    if workers is None: workers=os.cpu_count() or 1
+    if chunksize is None: chunksize=max(1000,-(-n//(4*workers)))
+    if workers<1 or chunksize<1: raise ValueError('Invalid number of workers or chunk size')
+    if workers==1 or n<=chunksize: parts=[stateChunk(t,rh,p,properties)]
+    else:
+        starts=range(0,n,chunksize)
+        futures=[getPool(workers).submit(stateChunk,t[i:i+chunksize],rh[i:i+chunksize],p[i:i+chunksize],\
+            properties) for i in starts]
+        parts=[future.result() for future in futures]
+    results={}
+    for (k,name) in enumerate(properties):
+        results[name]=(np.concatenate([part[k][0] for part in parts]),np.concatenate([part[k][1] for part in parts]))
+    return results
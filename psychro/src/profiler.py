@@ -0,0 +1,160 @@
+'''
+Module Name:'profiler'
+Path:'<package_root>/src/profiler.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, profiler.py records the calls of the psychrometric functions \
+    as a nested call tree: calls, cumulative and self time and the solver iterations of \
+    every function under every caller. While a profile runs, the module functions of \
+    psychro_functions, psychro_arrays, inverse_state and chart_curves and the methods of \
+    PsychroState and PsychroStateArray are replaced by timing wrappers; the functions call each other \
+    by their module names, so the nested calls are recorded as well. The originals are \
+    put back when the profile stops, so nothing is added to the calls when no profile \
+    runs except one check per solver run (addIterations()). Only the calls of the thread \
+    which started the profile are recorded.'
+Dependency: time, json, threading, functools, contextlib, importlib, inspect
+'''
+from __future__ import division
+import time, json, threading, functools, contextlib, importlib, inspect
+
+__version__='1.0.0.2026.10.18'
+version='1.0.0.2026.10.18'
+
+# modules and classes whose functions are recorded; the setting functions are not recorded
+profiled_modules=['psychro.src.psychro_functions','psychro.src.psychro_arrays','psychro.src.inverse_state',\
+    'psychro.src.chart_curves']
+profiled_classes=[('psychro.src.PsychroState','PsychroState'),('psychro.src.PsychroState','PsychroStateArray')]
+unprofiled_functions=['setSaturationBackend','loadSaturationBackend','getSaturationBackend','saturationBackend','enthalpyCacheInfo',\
+    'clearEnthalpyCache','kelvinValue']
+
+# the running profile (None: no profile) and the replaced functions [(owner, name, original)]
+active=None
+replaced=[]
+
+
+# This ProfileNode class holds the record of one function under one caller
+class ProfileNode:
+
+    __slots__=('name','module','calls','cumulative','iterations','children')
+
+    def __init__(self,name='',module=''):
+        self.name=name; self.module=module; self.calls=0; self.cumulative=0.0; self.iterations=0
+        self.children={}
+
+    # selfTime() returns the time (s) in the function itself without the recorded callees
+    def selfTime(self):
+        return self.cumulative-sum(child.cumulative for child in self.children.values())
+
+    # toDict() returns the node and its callees as a dict; the callees by cumulative time
+    def toDict(self):
+        children=sorted(self.children.values(),key=lambda child: -child.cumulative)
+        return {'name':self.name,'module':self.module,'calls':self.calls,'cumulative':self.cumulative,\
+            'self':self.selfTime(),'iterations':self.iterations,'children':[child.toDict() for child in children]}
+
+
+# This Profile class holds the call tree of a profile; root is the profile itself
+class Profile:
+
+    def __init__(self):
+        self.root=ProfileNode('<profile>',''); self.root.calls=1
+        self.thread=threading.get_ident(); self.stack=[self.root]; self.__start=None
+
+    # enter() returns the node of the function under the running function
+    def enter(self,name,module):
+        parent=self.stack[-1]
+        node=parent.children.get((module,name))
+        if node is None: node=parent.children[(module,name)]=ProfileNode(name,module)
+        self.stack.append(node)
+        return node
+
+    # leave() records a call of the node which took the time (s) since start
+    def leave(self,node,start):
+        node.calls+=1; node.cumulative+=time.perf_counter()-start
+        self.stack.pop()
+
+    def start(self):
+        self.__start=time.perf_counter()
+
+    def stop(self):
+        self.root.cumulative+=time.perf_counter()-self.__start
+
+    # toDict() returns the call tree as nested dicts
+    def toDict(self):
+        return self.root.toDict()
+
+    # toJSON() returns the call tree as JSON text and writes it to the file path if given
+    def toJSON(self,path=None,indent=1):
+        text=json.dumps(self.toDict(),indent=indent)
+        if path is not None:
+            with open(path,'w') as f: f.write(text)
+        return text
+
+    # report() returns the call tree as text lines (calls, cumulative and self time in ms,
+    # solver iterations) down to the depth (None: every level)
+    def report(self,depth=None):
+        lines=['{0:<56s}{1:>9s}{2:>13s}{3:>13s}{4:>11s}'.format('function','calls','cumulative','self','iterations')]
+        def add(node,level):
+            name='  '*level+node.name+('' if node.module in ['','psychro_functions'] else ' ('+node.module+')')
+            lines.append('{0:<56s}{1:>9d}{2:>10.3f} ms{3:>10.3f} ms{4:>11s}'.format(name,node.calls,node.cumulative*1e3,\
+                node.selfTime()*1e3,str(node.iterations) if node.iterations else ''))
+            if depth is None or level<depth:
+                for child in sorted(node.children.values(),key=lambda child: -child.cumulative): add(child,level+1)
+        add(self.root,0)
+        return '\n'.join(lines)
+
+
+# addIterations() adds the iterations of a solver run to the running function of the profile;
+# it is called once per solver run and does nothing when no profile runs
+def addIterations(count):
+    profile=active
+    if profile is not None and profile.thread==threading.get_ident(): profile.stack[-1].iterations+=int(count)
+
+
+# profiled() returns the timing wrapper of the function fn of the module
+def profiled(fn, name, module):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        profile=active
+        if profile is None or profile.thread!=threading.get_ident(): return fn(*args,**kwargs)
+        node=profile.enter(name,module); start=time.perf_counter()
+        try: return fn(*args,**kwargs)
+        finally: profile.leave(node,start)
+    return wrapper
+
+
+# replaceFunctions() replaces the functions of the profiled modules and classes by their wrappers
+def replaceFunctions():
+    for moduleName in profiled_modules:
+        module=importlib.import_module(moduleName); short=moduleName.split('.')[-1]
+        for (name,value) in list(vars(module).items()):
+            if inspect.isfunction(value) and value.__module__==moduleName and not name.startswith('_') \
+                and name not in unprofiled_functions:
+                setattr(module,name,profiled(value,name,short)); replaced.append((module,name,value))
+    for (moduleName,className) in profiled_classes:
+        cls=getattr(importlib.import_module(moduleName),className)
+        for (name,value) in list(vars(cls).items()):
+            if inspect.isfunction(value) and not name.startswith('_'):
+                setattr(cls,name,profiled(value,className+'.'+name,moduleName.split('.')[-1])); replaced.append((cls,name,value))
+
+
+# restoreFunctions() puts the original functions back
+def restoreFunctions():
+    while replaced:
+        (owner,name,value)=replaced.pop(); setattr(owner,name,value)
+
+
+# profile() is the context manager which records the calls of the psychrometric functions
+# made inside it and yields the Profile; profiles cannot be nested
+# with psychro.profile() as p: ...; print(p.report()); p.toJSON('profile.json')
+@contextlib.contextmanager
+def profile():
+    global active
+    if active is not None: raise ValueError('A profile is already running')
+    current=Profile()
+    replaceFunctions(); active=current; current.start()
+    try: yield current
+    finally:
+        current.stop(); active=None; restoreFunctions()
@@ -0,0 +1,410 @@
+'''
+Module Name:'psychro_arrays'
+Path:'<package_root>/src/psychro_arrays.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, psychro_arrays.py creates the array versions of the \
+    psychrometric functions. Every function takes NumPy arrays (or lists) of plain \
+    float values with a unit string, or TemperatureArray/PressureArray objects which \
+    carry their own unit, and returns a float array together with a boolean validity \
+    mask. Invalid elements are returned as NaN; nothing is printed. With the error \
+    policy 'raise' (see error_policy) invalid elements raise ValueError.'
+Dependency: math, itertools, numpy, psychro.src.Unit, psychro.src.TemperatureArray, psychro.src.PressureArray, \
+    psychro.src.psychro_functions, psychro.src.error_policy, psychro.src.profiler
+'''
+from __future__ import division
+import math, itertools
+import numpy as np
+from psychro.src.Unit import resolveUnit
+from psychro.src.TemperatureArray import TemperatureArray, temperature_units as _temperature_units
+from psychro.src.PressureArray import PressureArray, pressure_units as _pressure_units
+import psychro.src.psychro_functions as psyf
+import psychro.src.error_policy as errp
+import psychro.src.profiler as prof
+
+__version__='1.0.0.2026.10.18'
+version='1.0.0.2026.10.18'
+
+
+# Pascal value of one unit; same factors as Pressure.toPa()
+_pascal_factors={'Pa':1,'bar':100000,'atm':101325,'mHg':133322.368421,'psi':6894.733261,\
+    'torr':101325/760}
+
+
+# toArray() returns a float64 copy of the given values as numpy array
+def toArray(values=None):
+    if values is None: raise ValueError("Array values are not set")
+    return np.array(values,dtype=np.float64)
+
+
+# celciusArray() returns celcius values of the given temperature values and unit;
+# a TemperatureArray is converted with its own unit and is not changed
+def celciusArray(temperature=None, unit='C'):
+    if isinstance(temperature,TemperatureArray):
+        temperature=temperature.copy(); temperature.toC(); return temperature.getValues()
+    t=toArray(temperature)
+    if unit=='C': return t
+    (prefix,name,quantity)=resolveUnit(unit,'Temperature')
+    if name not in _temperature_units: raise ValueError(str(unit)+' is not a valid unit of TEMPERATURE')
+    if prefix!=1: t=t*prefix
+    name=_temperature_units[name]
+    if name=='K': t=t-273.15
+    elif name=='F': t=(t-32)/1.8
+    return t
+
+
+# pascalArray() returns pascal values of the given pressure values and unit;
+# a PressureArray is converted with its own unit and is not changed
+def pascalArray(pressure=None, unit='Pa'):
+    if isinstance(pressure,PressureArray):
+        pressure=pressure.copy(); pressure.toPa(); return pressure.getValues()
+    p=toArray(pressure)
+    if unit=='Pa': return p
+    (prefix,name,quantity)=resolveUnit(unit,'Pressure')
+    if name not in _pressure_units: raise ValueError(str(unit)+' is not a valid unit of PRESSURE')
+    if prefix!=1: p=p*prefix
+    factor=_pascal_factors[_pressure_units[name]]
+    if factor!=1: p=factor*p
+    return p
+
+
+# antoineVaporPressureArray() returns saturated vapor pressure in mmHg of celcius
+# values by both branches of Antoine equation; values outside 0-150 C are NaN
+def antoineVaporPressureArray(t):
+    p=np.full(t.shape,np.nan)
+    lower=(t>=0)&(t<60); upper=(t>=60)&(t<=150)
+    p[lower]=10**(8.10765-(1750.286/(t[lower]+235)))
+    p[upper]=10**(7.96681-(1668.21/(t[upper]+228.0)))
+    return p
+
+
+# antoineTemperatureArray() returns saturated temperature in C of vapor pressure
+# values in mHg by both branches of Antoine equation; values out of range are NaN
+def antoineTemperatureArray(p):
+    t=np.full(p.shape,np.nan)
+    lower=(p>0)&(p<0.149444); upper=(p>=0.149444)&(p<=3.577306)
+    t[lower]=(1750.286/(8.10765-np.log10(p[lower]*1000)))-235.0
+    t[upper]=(1668.21/(7.96681-np.log10(p[upper]*1000)))-228.0
+    return t
+
+
+# satPressureValues() returns saturated vapor pressures in mmHg of celcius values
+# by the given saturation backend (None: the current backend, see setSaturationBackend());
+# NaN outside 0-150 C
+def satPressureValues(t, backend=None):
+    if backend is None: backend=psyf.getSaturationBackend()
+    if backend=='antoine': return antoineVaporPressureArray(t)
+    return psyf.loadSaturationBackend(backend).vaporPressureArray(t)
+
+
+# satTemperatureValues() returns saturated temperatures in C of vapor pressures in mHg
+# by the given saturation backend (None: the current backend); NaN out of range
+def satTemperatureValues(p, backend=None):
+    if backend is None: backend=psyf.getSaturationBackend()
+    if backend=='antoine': return antoineTemperatureArray(p)
+    return psyf.loadSaturationBackend(backend).temperatureArray(p)
+
+
+# satVaporPressureArray() calculates saturated water vapor pressure in Pa of an
+# array of temperatures between 0 and 150 C; array version of satVaporPressure()
+# returns (pressure array in Pa, validity mask)
+# backend selects the saturation backend of this call (None: the current backend)
+# Array Function No:01
+def satVaporPressureArray(temperature=None, unit='C', backend=None):
+    t=celciusArray(temperature,unit)
+    p=133322.368421*(satPressureValues(t,backend)*0.001) # mmHg -> mHg -> Pa as Pressure class
+    if errp.getErrorPolicy()=='raise': errp.checkErrorCodes(np.where(np.isnan(t),1,np.where(np.isnan(p),2,0)))
+    return (p,~np.isnan(p))
+
+
+# satTemperatureArray() calculates saturated water vapor temperature in C of an
+# array of vapor pressures; array version of satTemperature()
+# Pressure range: 608 - 476934.84 Pa
+# returns (temperature array in C, validity mask)
+# backend selects the saturation backend of this call (None: the current backend)
+# Array Function No:02
+def satTemperatureArray(vapPressure=None, unit='Pa', backend=None):
+    p=pascalArray(vapPressure,unit)*7.500616827e-6 # Pa -> mHg as Pressure.tomHg()
+    t=satTemperatureValues(p,backend)
+    if errp.getErrorPolicy()=='raise': errp.checkErrorCodes(np.where(np.isnan(p),1,np.where(np.isnan(t),5,0)))
+    return (t,~np.isnan(t))
+
+
+# humidityArrays() returns the common (celcius, relative humidity, pascal) arrays 
+# of the humid air functions broadcast to one shape with the mask of valid inputs
+def humidityArrays(temperature=None, relHumidity=None, pressure=None, tempUnit='C', pressureUnit='Pa'):
+    t=celciusArray(temperature,tempUnit); rh=toArray(relHumidity); p=pascalArray(pressure,pressureUnit)
+    (t,rh,p)=np.broadcast_arrays(t,rh,p)
+    valid=(t>=0)&(t<=150)&(rh>=0)&(rh<=100)&(p>0)
+    if errp.getErrorPolicy()=='raise': errp.checkErrorCodes(errorCodes(t,rh,p))
+    return (t.astype(np.float64),rh.astype(np.float64),p.astype(np.float64),valid)
+
+
+# errorCodes() returns the error code array of celcius, relative humidity and pascal arrays
+# (see error_codes of error_policy); 0 is valid, NaN inputs come before the ranges
+def errorCodes(t, rh, p):
+    (t,rh,p)=np.broadcast_arrays(t,rh,p); codes=np.zeros(t.shape,dtype=np.int8)
+    codes[~(p>0)]=4; codes[~((rh>=0)&(rh<=100))]=3; codes[~((t>=0)&(t<=150))]=2
+    codes[np.isnan(t)|np.isnan(rh)|np.isnan(p)]=1
+    return codes
+
+
+# humidityErrorCodes() returns the error code array of arrays of temperature, relative 
+# humidity(%) and pressure; 0 is valid (see error_codes of error_policy)
+# Array Function No:07
+def humidityErrorCodes(temperature=None, relHumidity=None, pressure=None, tempUnit='C', pressureUnit='Pa'):
+    t=celciusArray(temperature,tempUnit); rh=toArray(relHumidity); p=pascalArray(pressure,pressureUnit)
+    return errorCodes(t,rh,p)
+
+
+# moleFractionArray() calculates the mole fraction of water vapor in humid air 
+# (moles of vapor/moles of wet air); array version of moleFraction()
+# Array Function No:03
+def moleFractionArray(temperature=None, relHumidity=None, pressure=None, tempUnit='C', pressureUnit='Pa'):
+    (t,rh,p,valid)=humidityArrays(temperature,relHumidity,pressure,tempUnit,pressureUnit)
+    satp=133322.368421*(satPressureValues(t)*0.001)
+    y=np.where(valid,rh*satp/(100*p),np.nan)
+    return (y,valid)
+
+
+# absoluteHumidityArray() calculates mass of vapor / mass of dry air (kgV/kgDA);
+# array version of absoluteHumidity()
+# Array Function No:04
+def absoluteHumidityArray(temperature=None, relHumidity=None, pressure=None, tempUnit='C', pressureUnit='Pa'):
+    (y,valid)=moleFractionArray(temperature,relHumidity,pressure,tempUnit,pressureUnit)
+    return (0.6218*y/(1-y),valid) # 0.6218=18/28.947
+
+
+# massFractionArray() calculates mass of vapor / mass of humid air (kgV/kgHA);
+# array version of massFraction()
+# Array Function No:05
+def massFractionArray(temperature=None, relHumidity=None, pressure=None, tempUnit='C', pressureUnit='Pa'):
+    (x,valid)=absoluteHumidityArray(temperature,relHumidity,pressure,tempUnit,pressureUnit)
+    return (x/(1+x),valid)
+
+
+# wetBulbResidual() returns the residual of the constant wet bulb temperature line
+# (partial pressure on the line - saturated vapor pressure at the wet bulb) in Pa
+# x=x0-0.00041667(twb-t), y=x/(0.6218+x), residual=y*P-Psat(twb) as wetBulbTemperature()
+# The residual decreases monotonically with the wet bulb temperature
+def wetBulbResidual(twb, t, x0, p):
+    x=x0-0.00041667*(twb-t)
+    return x*p/(0.6218+x) - 133322.368421*(satPressureValues(twb)*0.001)
+
+
+# wetBulbTemperatureArray() calculates wet bulb temperature (C) of arrays of dry bulb 
+# temperature, relative humidity(%) and pressure; array version of wetBulbTemperature()
+# Method: Illinois (bracketed secant) iteration on the constant wet bulb temperature
+#     line between 0 C and the dry bulb temperature; all elements are solved at once
+# tol is the final bracket width in C; maxIter limits the iterations of each element
+# start (array of C, optional) warm starts the elements from a close wet bulb temperature
+#     (e.g. of the previous sample of a time series) with the bracket start-step..start+step;
+#     NaN elements of start are started from 0 C..dry bulb as usual
+# returns (wet bulb temperature array in C, iteration count array, validity mask)
+# Elements whose wet bulb temperature is below 0 C or which have not converged 
+# within maxIter iterations are invalid
+# Array Function No:06
+def wetBulbTemperatureArray(temperature=None, relHumidity=None, pressure=None, tempUnit='C', \
+    pressureUnit='Pa', tol=1e-6, maxIter=100, start=None, step=1.0):
+    (t,rh,p,valid)=humidityArrays(temperature,relHumidity,pressure,tempUnit,pressureUnit)
+    (x0,_)=massFractionArray(t,rh,p)
+    if start is not None: start=np.broadcast_to(toArray(start),t.shape)
+    (twb,iterations,solved)=wetBulbSolve(t,rh,p,x0,valid,tol,maxIter,start,step)
+    if errp.getErrorPolicy()=='raise': errp.checkErrorCodes(np.where(valid&~solved,6,0))
+    return (twb,iterations,solved)
+
+
+# wetBulbSeries() calculates wet bulb temperature (C) of time series of dry bulb temperature,
+# relative humidity(%) and pressure; axis 0 is the time (samples) and the other axes are the
+# channels (e.g. sensors); all channels of a sample are solved at once and every sample is
+# warm started from the wet bulb temperature of the previous sample (see wetBulbTemperatureArray())
+# start (optional) is the wet bulb temperature before the first sample
+# returns (wet bulb temperature array in C, iteration count array, validity mask)
+# Array Function No:10
+def wetBulbSeries(temperature=None, relHumidity=None, pressure=None, tempUnit='C', pressureUnit='Pa', \
+    tol=1e-6, maxIter=100, start=None, step=1.0):
+    (t,rh,p,valid)=[np.atleast_1d(a) for a in humidityArrays(temperature,relHumidity,pressure,tempUnit,pressureUnit)]
+    (x0,_)=massFractionArray(t,rh,p)
+    twb=np.full(t.shape,np.nan); iterations=np.zeros(t.shape,dtype=np.int64); solved=np.zeros(t.shape,dtype=bool)
+    previous=None if start is None else np.broadcast_to(toArray(start),t.shape[1:])
+    for k in range(t.shape[0]):
+        (twb[k],iterations[k],solved[k])=wetBulbSolve(t[k],rh[k],p[k],x0[k],valid[k],tol,maxIter,previous,step)
+        previous=twb[k]
+    if errp.getErrorPolicy()=='raise': errp.checkErrorCodes(np.where(valid&~solved,6,0))
+    return (twb,iterations,solved)
+
+
+# wetBulbBracket() returns the brackets (a, b, residual at a, residual at b, evaluations) of the
+# wet bulb temperatures warm started from start: start-step..start+step inside 0 C..dry bulb;
+# when the root is out of it, the bracket is the rest of 0 C..dry bulb (one more evaluation)
+def wetBulbBracket(t, x0, p, start, step):
+    a=np.clip(start-step,0,t); b=np.clip(start+step,0,t); b=np.where(b>a,b,t); a=np.where(b>a,a,0)
+    fa=wetBulbResidual(a,t,x0,p); fb=wetBulbResidual(b,t,x0,p)
+    evaluations=np.zeros(t.shape,dtype=np.int64)
+    # the residual decreases with the wet bulb temperature: root above b or below a
+    above=fb>0; below=~above&(fa<0)
+    if above.any():
+        a[above]=b[above]; fa[above]=fb[above]; b[above]=t[above]
+        fb[above]=wetBulbResidual(b[above],t[above],x0[above],p[above]); evaluations[above]=1
+    if below.any():
+        b[below]=a[below]; fb[below]=fa[below]; a[below]=0
+        fa[below]=wetBulbResidual(a[below],t[below],x0[below],p[below]); evaluations[below]=1
+    return (a,b,fa,fb,evaluations)
+
+
+# wetBulbSolve() solves the wet bulb temperature of celcius, relative humidity, pascal 
+# and mass fraction arrays of the same shape; valid is the mask of valid inputs
+# start (optional array of C) warm starts the elements which are not NaN (see wetBulbBracket())
+# returns (wet bulb temperature array in C, iteration count array, validity mask)
+def wetBulbSolve(t, rh, p, x0, valid, tol=1e-6, maxIter=100, start=None, step=1.0):
+    twb=np.full(t.shape,np.nan); iterations=np.zeros(t.shape,dtype=np.int64); valid=valid.copy()
+    # saturated air: wet bulb = dry bulb as wetBulbTemperature()
+    saturated=valid&(rh==100); twb[saturated]=t[saturated]
+    idx=np.flatnonzero(valid&~saturated)
+    if idx.size:
+        (tt,xx,pp)=(t.flat[idx],x0.flat[idx],p.flat[idx])
+        count=np.zeros(idx.size,dtype=np.int64)
+        if start is None:
+            a=np.zeros(idx.size); b=tt.copy()
+            fa=wetBulbResidual(a,tt,xx,pp); fb=wetBulbResidual(b,tt,xx,pp)
+        else:
+            (a,b,fa,fb)=(np.zeros(idx.size),tt.copy(),np.zeros(idx.size),np.zeros(idx.size))
+            warm=~np.isnan(start.flat[idx]); cold=~warm
+            fa[cold]=wetBulbResidual(a[cold],tt[cold],xx[cold],pp[cold]); fb[cold]=wetBulbResidual(b[cold],tt[cold],xx[cold],pp[cold])
+            if warm.any():
+                (a[warm],b[warm],fa[warm],fb[warm],count[warm])=wetBulbBracket(tt[warm],xx[warm],pp[warm],\
+                    start.flat[idx[warm]],step)
+        # wet bulb below 0 C cannot be bracketed
+        bracketed=fa>=0; b[fa==0]=a[fa==0]
+        done=~bracketed|(fa==0)|(fb==0)|(np.abs(b-a)<=tol)
+        for k in range(maxIter):
+            act=np.flatnonzero(~done)
+            if act.size==0: break
+            (aa,ba,fa_,fb_)=(a[act],b[act],fa[act],fb[act])
+            c=ba-fb_*(ba-aa)/(fb_-fa_)
+            fc=wetBulbResidual(c,tt[act],xx[act],pp[act])
+            count[act]+=1
+            # keep the root bracketed; halve the retained end value (Illinois)
+            flip=fc*fb_<0
+            a[act]=np.where(flip,ba,aa); fa[act]=np.where(flip,fb_,fa_*0.5)
+            b[act]=c; fb[act]=fc
+            done[act]=(fc==0)|(np.abs(c-a[act])<=tol)
+        converged=bracketed&done
+        twb.flat[idx]=np.where(converged,b,np.nan)
+        iterations.flat[idx]=count
+        valid.flat[idx]=converged
+        prof.addIterations(count.sum())
+    return (twb,iterations,valid)
+
+
+# directEnthalpyArray() calculates enthalpy of humid air in kJ/kgDA directly from the
+# humidity ratio without the wet bulb iteration; array version of directEnthalpy()
+# h=cp_a*t+W*(h_fg+cp_v*t) (Ref. Temp. = 0 C); returns (enthalpy array, validity mask)
+# Array Function No:08
+def directEnthalpyArray(temperature=None, relHumidity=None, pressure=None, tempUnit='C', pressureUnit='Pa'):
+    (t,rh,p,valid)=humidityArrays(temperature,relHumidity,pressure,tempUnit,pressureUnit)
+    (x,_)=absoluteHumidityArray(t,rh,p)
+    return (directEnthalpyValues(t,x),valid)
+
+
+# directEnthalpyValues() returns h=cp_a*t+W*(h_fg+cp_v*t) in kJ/kgDA of celcius and
+# humidity ratio values (floats or arrays)
+def directEnthalpyValues(t, x):
+    return psyf.cp_dry_air*t+x*(psyf.h_evaporation+psyf.cp_water_vapor*t)
+
+
+# Fused enthalpy kernel
+# ================================
+# The enthalpy functions evaluate the same chain as humidSaturationEnthalpy() (mole
+# fraction, molar mass, mass fraction, component enthalpies of psychro_functions) once
+# per element over whole arrays; the results are equal to the scalar functions bit for
+# bit. Therefore T(K) and P(bar) are quantized by Python round() as the enthalpy cache,
+# and the powers of the residual enthalpy and of Antoine equation are taken by C pow()
+# as the scalar functions (numpy power may differ in the last bit).
+
+# exactRound() returns round(x, digits) of every element as Python round(); numpy round
+# (rint(x*10**digits)/10**digits) is the same unless x*10**digits is close to a half, so
+# only those elements are rounded by Python round()
+def exactRound(x, digits):
+    scaled=x*10.0**digits
+    r=np.round(x,digits)
+    near=np.flatnonzero(np.abs(scaled-np.floor(scaled)-0.5)<1e-3)
+    r.flat[near]=[round(v,digits) for v in x.flat[near].tolist()]
+    return r
+
+
+# exactSatPascal() returns saturated vapor pressures in Pa of celcius values by the scalar
+# satPressureValue() of every element as the scalar functions; NaN outside 0-150 C
+def exactSatPascal(t):
+    p=np.fromiter((psyf.satPressureValue(v) if v>=0 else None for v in t.ravel().tolist()),np.float64,t.size)
+    return 133322.368421*(p.reshape(t.shape)*0.001)
+
+
+# exactPower() returns x**e of every element by C pow(); NaN for x <= 0
+def exactPower(x, e):
+    x=np.where(x>0,x,np.nan)
+    return np.fromiter(map(math.pow,x.ravel().tolist(),itertools.repeat(e)),np.float64,x.size).reshape(x.shape)
+
+
+# componentEnthalpyValues() returns componentEnthalpy() (J/mol) of a component of humid
+# air at the quantized arrays T(K) and P(bar); ref is the reference residual enthalpy array
+def componentEnthalpyValues(component, T, P, ref):
+    (Tc,Pc,w)=psyf.critical_data[component]
+    delH=psyf.cp_integrals[component](T)*(T-298.15)*8.314
+    if component=='H2O': delH=psyf.water_reference_enthalpy+delH
+    R=8.314; Tr = T/Tc; Pr = P/Pc
+    residual=((0.083-1.097/exactPower(Tr,1.6))+w*(0.139-0.894/exactPower(Tr,4.2)))*Pr*R*Tc
+    return delH+residual-ref
+
+
+# componentEnthalpies() returns the dict of componentEnthalpyValues() of the components
+# named in components at the kelvin and bar arrays T, P (quantized once for all of them)
+def componentEnthalpies(T, P, components=('O2','N2','Ar','CO2','H2O')):
+    digits=psyf.enthalpy_cache_digits
+    (T,P)=(exactRound(T,digits),exactRound(P,digits))
+    values={}
+    for c in components:
+        (Tc,Pc,w)=psyf.critical_data[c]
+        # referenceResidualEnthalpy(); the powers of the scalar reference temperature are floats
+        ref=psyf.residualEnthalpyValue(psyf.reference_temperature,P,Tc,Pc,w)
+        values[c]=componentEnthalpyValues(c,T,P,ref)
+    return values
+
+
+# dryAirEnthalpyValues() returns delHDryAirValue() (J/mol) of component enthalpies
+def dryAirEnthalpyValues(values):
+    return values['O2']*0.2095+values['N2']*0.7809+values['Ar']*0.0092+values['CO2']*0.0004
+
+
+# saturationEnthalpyValues() returns saturation enthalpy of humid air in kJ/kgDA of the
+# arrays of celcius temperature t, saturated vapor pressure satp(Pa) and pressure p(Pa);
+# array version of saturationEnthalpy() of PsychroState; NaN for invalid elements
+def saturationEnthalpyValues(t, satp, p):
+    (t,satp,p)=np.broadcast_arrays(t,satp,p)
+    h=np.full(t.shape,np.nan)
+    ok=np.isfinite(t)&np.isfinite(satp)&(p>0)
+    (t,satp,p)=(t[ok],satp[ok],p[ok])
+    y=100*satp/(100*p)                   # moleFraction() at 100% RH
+    molarmassha=(1-y)*28.947+y*18        # humidMolarMass()
+    x=0.6218*y/(1-y); x=x/(1+x)          # massFraction()
+    T=t+273.15; P=p/100000
+    values=componentEnthalpies(T,P)
+    delH=(1-y)*dryAirEnthalpyValues(values) + y*values['H2O']
+    zero_correction=26.35339042
+    h[ok]=zero_correction + delH/(molarmassha*(1-x))
+    return h
+
+
+# humidSaturationEnthalpyArray() calculates saturation enthalpy of humid air in kJ/kgDA
+# of arrays of temperature and pressure by the fused kernel; array version of
+# humidSaturationEnthalpy(); returns (enthalpy array, validity mask)
+# Array Function No:09
+def humidSaturationEnthalpyArray(temperature=None, pressure=None, tempUnit='C', pressureUnit='Pa'):
+    (t,_,p,valid)=humidityArrays(temperature,100,pressure,tempUnit,pressureUnit)
+    t=np.where(valid,t,np.nan)
+    h=saturationEnthalpyValues(t,exactSatPascal(t),p)
+    return (h,valid)
+
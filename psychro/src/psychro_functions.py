@@ -17,7 +17,12 @@ Assumption: Open system and constant atmospheric pressure of 1 atm
 from __future__ import division
 from psychro.src.Pressure import Pressure
 from psychro.src.Temperature import Temperature
+from psychro.src.error_policy import reportError
+import psychro.src.profiler as prof
 import math
+import contextlib
+import contextvars
+import functools
 
 __version__='1.0.0.2023.02.10'
 version='1.0.0.2023.02.10'
@@ -31,24 +36,120 @@ version='1.0.0.2023.02.10'
 # For 0-60C: A=8.10765, B=1750.286, C=235.0; Source: page:235, Elementary Principles of Chemical Processes
 # For 60-150C: A=7.96681, B=1668.21, C=228.0 
 
+# antoineVaporPressure() returns saturated water vapor pressure in mmHg of a plain 
+# celcius value (float) by Antoine equation; no Temperature/Pressure object is created
+# returns None outside 0-150 C
+def antoineVaporPressure(t):
+    if t>=0 and t<60: return 10**(8.10765-(1750.286/(t+235)))
+    elif t>=60 and t<=150: return 10**(7.96681-(1668.21/(t+228.0)))
+    return None
+
+
+# antoineTemperature() returns saturated water temperature in C of a plain vapor 
+# pressure value in mHg (float) by Antoine equation; returns None out of range
+def antoineTemperature(p):
+    if p>0 and p<0.149444: return (1750.286/(8.10765-math.log10(p*1000)))-235.0
+    elif p>=0.149444 and p<=3.577306: return (1668.21/(7.96681-math.log10(p*1000)))-228.0
+    return None
+
+
+# Saturation backend of the saturated vapor pressure and saturated temperature
+# 'antoine': Antoine equation (default)
+# 'table': monotone cubic interpolation of the dense saturation table (0-150 C at 0.01 C 
+#     steps) of saturation_table module; relative error < 2e-11, temperature error < 1e-9 C
+# 'magnus', 'hyland-wexler', 'iapws': Magnus, Hyland-Wexler (ASHRAE) and IAPWS-IF97 region 4
+#     correlations of saturation_correlations module
+# 'antoine-blended': Antoine equation with the branches blended over 55-65 C, so the vapor
+#     pressure and its slope are continuous at 60 C (saturation_correlations module)
+saturation_backends=['antoine','table','magnus','hyland-wexler','iapws','antoine-blended']
+# saturation_backend is the backend of all threads (setSaturationBackend()); the backend of
+# a with statement (saturationBackend()) is held by the context variable of the thread or task
+saturation_backend='antoine'
+saturation_context=contextvars.ContextVar('saturation_backend',default=None)
+saturation_table=None
+# loaded backends other than 'antoine': name -> module or SaturationCorrelation with the
+# functions vaporPressure(), temperature(), vaporPressureArray() and temperatureArray()
+saturation_modules={}
+
+
+# loadSaturationBackend() returns the functions of a saturation backend other than 'antoine'
+# and imports its module on first use
+def loadSaturationBackend(backend='table'):
+    global saturation_table
+    module=saturation_modules.get(backend)
+    if module is not None: return module
+    if backend not in saturation_backends: 
+        raise ValueError("Unknown saturation backend: "+str(backend))
+    if backend=='table':
+        import psychro.src.saturation_table as table
+        saturation_table=module=table
+    else:
+        import psychro.src.saturation_correlations as correlations
+        module=correlations.correlations[backend]
+    saturation_modules[backend]=module
+    return module
+
+
+# setSaturationBackend() selects the saturation backend of all psychrometric functions in
+# all threads; a with statement of saturationBackend() still overrides it in its context
+def setSaturationBackend(backend='antoine'):
+    global saturation_backend
+    if backend not in saturation_backends: 
+        raise ValueError("Unknown saturation backend: "+str(backend))
+    if backend!='antoine': loadSaturationBackend(backend)
+    saturation_backend=backend
+
+
+# getSaturationBackend() returns the name of the current saturation backend of the caller
+def getSaturationBackend():
+    backend=saturation_context.get()
+    return saturation_backend if backend is None else backend
+
+
+# saturationBackend() selects the saturation backend inside a with statement; only the
+# current thread (or asyncio task) uses it, the other threads keep their backend
+#     with saturationBackend('table'): ...
+@contextlib.contextmanager
+def saturationBackend(backend='antoine'):
+    if backend not in saturation_backends: 
+        raise ValueError("Unknown saturation backend: "+str(backend))
+    if backend!='antoine': loadSaturationBackend(backend)
+    token=saturation_context.set(backend)
+    try: yield backend
+    finally: saturation_context.reset(token)
+
+
+# satPressureValue() returns saturated vapor pressure in mmHg of a plain celcius value
+# by the given saturation backend (None: the current backend); returns None outside 0-150 C
+def satPressureValue(t, backend=None):
+    if backend is None: backend=getSaturationBackend()
+    if backend=='antoine': return antoineVaporPressure(t)
+    return loadSaturationBackend(backend).vaporPressure(t)
+
+
+# satTemperatureValue() returns saturated temperature in C of a plain vapor pressure
+# value in mHg by the given saturation backend (None: the current backend); returns None out of range
+def satTemperatureValue(p, backend=None):
+    if backend is None: backend=getSaturationBackend()
+    if backend=='antoine': return antoineTemperature(p)
+    return loadSaturationBackend(backend).temperature(p)
+
+
 # satVaporPressure() calculates saturated water vapor pressure in mmHg 
 # at the given temperature between 0 and 150 deg celcius using Antoine Equation  
 # Argument temperature is a temperature object
 # 0 <= Temperature <=150 C
+# backend selects the saturation backend of this call (None: the current backend)
 # Function No:01
-def satVaporPressure(temperature=None):
+def satVaporPressure(temperature=None, backend=None):
     try: 
         if temperature==None: 
             raise ValueError("Temperature arguement of vaporPressure() is missing")
-        temperature.toC() 
-        if temperature.getValue()<0:raise ValueError("Temperature is out of valid range (0-150C)")
-        elif temperature.getValue()>=0 and temperature.getValue()<60: 
-            p=10**(8.10765-(1750.286/(temperature.getValue()+235))) 
-        elif temperature.getValue()>=60 and temperature.getValue()<=150: 
-            p=10**(7.96681-(1668.21/(temperature.getValue()+228.0)))
-        else: raise ValueError("Invalid Temperature Value for Antoine equation.") 
-    except Exception as e:
-	    print(e)
+        t=temperature.getCelcius()
+        if t<0:raise ValueError("Temperature is out of valid range (0-150C)")
+        p=satPressureValue(t,backend)
+        if p==None: raise ValueError("Invalid Temperature Value for Antoine equation.") 
+    except Exception as e: return reportError(e)
     else:
         return Pressure(p,unit='mmHg',is_absolute=True) 
 	
@@ -57,18 +158,17 @@ def satVaporPressure(temperature=None):
 # satTemperature() calculates saturated water vapor temperature in degree celcius 
 # at the given water vapor pressure (in mmHg) using Antoine Equation 
 # T = B/(A - lg(P)) - A
+# backend selects the saturation backend of this call (None: the current backend)
 # Function No:02
-def satTemperature(vapPressure=None): 
+def satTemperature(vapPressure=None, backend=None): 
     try:
         if vapPressure==None: 
             raise ValueError("Saturated vapor pressure arguement of satTemperature() is missing") 
-        vapPressure.tomHg() 
-        if vapPressure.getValue()<0.149444: 
-            t=(1750.286/(8.10765-math.log10(vapPressure.getValue()*1000)))-235.0 
-        elif (vapPressure.getValue()>=0.149444 and vapPressure.getValue()<=3.577306): 
-            t=(1668.21/(7.96681-math.log10(vapPressure.getValue()*1000)))-228.0 
-        else: raise ValueError("Saturated vapor pressure value is out of range for Antoine equation.")
-    except Exception as e: print(e)
+        p=vapPressure.getmHg()
+        if p<=0: raise ValueError("math domain error")
+        t=satTemperatureValue(p,backend)
+        if t==None: raise ValueError("Saturated vapor pressure value is out of range for Antoine equation.")
+    except Exception as e: return reportError(e)
     else:	
         return Temperature(t,'C')
 
@@ -84,14 +184,13 @@ def dryAirPressure(temperature=None):
     try:
         if temperature==None: 
             raise ValueError("Temperature is not set in the argument of dryAirPressure()") 
-        temperature.toC()
-        if temperature.getValue()<0:raise ValueError("Temperature is out of valid range (0-150C)")
-        temp15C=Temperature(15,'C'); temperature.toK()
-        satp_at15=satVaporPressure(temp15C); satp_at15.toPa()
-        airp_at15=Pressure(101325-satp_at15.getValue(),'Pa')
-    except Exception as e: print(e)
+        if temperature.getCelcius()<0:raise ValueError("Temperature is out of valid range (0-150C)")
+        T=temperature.getKelvin()
+        satp_at15=satVaporPressure(Temperature(15,'C'))
+        airp_at15=Pressure(101325-satp_at15.getPascal(),'Pa')
+    except Exception as e: return reportError(e)
     else:
-        return Pressure(airp_at15.getValue()*temperature.getValue()/288.15,'Pa',is_absolute=True)
+        return Pressure(airp_at15.getValue()*T/288.15,'Pa',is_absolute=True)
 
 
 
@@ -106,12 +205,11 @@ def humidAirPressure(temperature = None, relHumidity = None):
             raise ValueError("Relative humidity is not set in the arguement of humidAirPressure()") 
         elif relHumidity < 0 or relHumidity > 100: 
             raise ValueError("Relative humidity is out of range") 
-        temperature.toC()
-        if temperature.getValue()<0:raise ValueError("Temperature is out of valid range (0-150C)")
+        if temperature.getCelcius()<0:raise ValueError("Temperature is out of valid range (0-150C)")
         dryairpressure=dryAirPressure(temperature)
-        watervaporpressure=satVaporPressure(temperature); watervaporpressure.toPa()
-        totalpressure=watervaporpressure.getValue()+dryairpressure.getValue()
-    except Exception as e: print(e)
+        watervaporpressure=satVaporPressure(temperature)
+        totalpressure=watervaporpressure.getPascal()+dryairpressure.getValue()
+    except Exception as e: return reportError(e)
     else:
         return Pressure(totalpressure,'Pa',is_absolute=True)
 
@@ -129,15 +227,13 @@ def dewPoint(temperature = None, relHumidity = None):
         elif relHumidity < 0 or relHumidity > 100: 
             raise ValueError("Relative humidity is out of range") 
         if relHumidity==0: return None 
-        elif relHumidity==100: return temperature 
-        temperature.toC()
-        if temperature.getValue()<0:raise ValueError("Temperature is out of valid range (0-150C)")
+        elif relHumidity==100: return temperature.copy()
+        if temperature.getCelcius()<0:raise ValueError("Temperature is out of valid range (0-150C)")
         #satPressure=Saturated vapor pressure at the given temperature 
-        satPressure=satVaporPressure(temperature);  
-        satPressure.toPa();
-        partialPressure=relHumidity*satPressure.getValue()/100;
+        satPressure=satVaporPressure(temperature)
+        partialPressure=relHumidity*satPressure.getPascal()/100;
         vapPressure=Pressure(partialPressure,'Pa')
-    except Exception as e: print(e)
+    except Exception as e: return reportError(e)
     else:
         return satTemperature(vapPressure) 
 
@@ -153,15 +249,13 @@ def saturatedTemperature(temperature = None, relHumidity = None):
         elif relHumidity < 0 or relHumidity > 100: 
             raise ValueError("Relative humidity is out of range") 
         if relHumidity==0: return None 
-        elif relHumidity==100: return temperature 
-        temperature.toC() 
-        if temperature.getValue()<0:raise ValueError("Temperature is out of valid range (0-150C)")
+        elif relHumidity==100: return temperature.copy()
+        if temperature.getCelcius()<0:raise ValueError("Temperature is out of valid range (0-150C)")
         #satPressure=Saturated vapor pressure at the given temperature 
-        satPressure=satVaporPressure(temperature);  
-        satPressure.toPa();
-        partialPressure=relHumidity*satPressure.getValue()/100;
+        satPressure=satVaporPressure(temperature)
+        partialPressure=relHumidity*satPressure.getPascal()/100;
         vapPressure=Pressure(partialPressure,'Pa')
-    except Exception as e: print(e)
+    except Exception as e: return reportError(e)
     else:
         return satTemperature(vapPressure) 
 
@@ -177,13 +271,12 @@ def partialPressure(temperature=None, relHumidity=None):
             raise ValueError("Relative humidity is not set in the arguement of partialPressure()")
         elif relHumidity < 0 or relHumidity > 100: 
             raise ValueError("Relative humidity is out of range") 
-        temperature.toC() 
-        if temperature.getValue()<0:raise ValueError("Temperature is out of valid range (0-150C)")
+        if temperature.getCelcius()<0:raise ValueError("Temperature is out of valid range (0-150C)")
         # satpressure=Saturated vapor pressure at the given temperature 
-        satpressure=satVaporPressure(temperature); satpressure.toPa()
-    except Exception as e: print(e)
+        satpressure=satVaporPressure(temperature).getPascal()
+    except Exception as e: return reportError(e)
     else:	
-        return Pressure(relHumidity*satpressure.getValue()/100,'Pa')
+        return Pressure(relHumidity*satpressure/100,'Pa')
 	
 	
 		
@@ -196,32 +289,32 @@ def relativeHumidity(temperature=None, dewpoint=None):
             raise ValueError("Temperature is not set in the arguement of relativeHumidity()") 
         elif dewpoint==None: 
             raise ValueError("Dew point is not set in the arguement of relativeHumidity()") 
-        temperature.toC(); dewpoint.toC()
-        if temperature.getValue()<0:raise ValueError("Temperature is out of valid range (0-150C)")
-        if temperature.getValue() < dewpoint.getValue(): 
+        (t,td)=(temperature.getCelcius(),dewpoint.getCelcius())
+        if t<0:raise ValueError("Temperature is out of valid range (0-150C)")
+        if t < td: 
             raise ValueError("Dew point cannot be greater than the air temperature.")
 
-        if abs(temperature.getValue() - dewpoint.getValue()) < 10:
+        if abs(t - td) < 10:
             # satpressure=Saturated vapor pressure at the given temperature 
             # satpressureDewPoint=Saturated vapor pressure at the dewpoint 
-            dryairp = dryAirPressure(dewpoint); dryairp.toPa()		
-            satpressureDewPoint=satVaporPressure(dewpoint); satpressureDewPoint.toPa()
+            dryairp = dryAirPressure(dewpoint).getPascal()
+            satpressureDewPoint=satVaporPressure(dewpoint).getPascal()
             # mole fraction at dewpoint
-            y=satpressureDewPoint.getValue()/(dryairp.getValue()+satpressureDewPoint.getValue())
+            y=satpressureDewPoint/(dryairp+satpressureDewPoint)
             # considering same mole fraction at the given temperature obtained by heating
             # y = Pw/(Pw+Pair)
-            dryairp = dryAirPressure(temperature); dryairp.toPa()
-            watervaporpp = dryairp.getValue()*y/(1-y)
-            satpressure=satVaporPressure(temperature); satpressure.toPa()
-            RH=100*watervaporpp/satpressure.getValue()
+            dryairp = dryAirPressure(temperature).getPascal()
+            watervaporpp = dryairp*y/(1-y)
+            satpressure=satVaporPressure(temperature).getPascal()
+            RH=100*watervaporpp/satpressure
         else: 
             # satpressure=Saturated vapor pressure at the given temperature 
             # satpressureDewPoint=Saturated vapor pressure at the dewpoint 
-            satpressure=satVaporPressure(temperature); satpressure.toPa()	
-            satpressureDewPoint=satVaporPressure(dewpoint); satpressureDewPoint.toPa()            
-            RH=100*satpressureDewPoint.getValue()/satpressure.getValue() 
+            satpressure=satVaporPressure(temperature).getPascal()
+            satpressureDewPoint=satVaporPressure(dewpoint).getPascal()
+            RH=100*satpressureDewPoint/satpressure
  
-    except Exception as e: print(e)
+    except Exception as e: return reportError(e)
     else: return RH
 
 
@@ -238,16 +331,15 @@ def moleFraction(temperature=None, relHumidity=None, pressure=None):
             raise ValueError("Pressure arguement value is not set in moleFraction()") 
         elif relHumidity==None: 
             raise ValueError("Relative humidity is not set in the arguement of moleFraction()") 
-        temperature.toC()
-        if temperature.getValue()<0:raise ValueError("Temperature is out of valid range (0-150C)")
+        if temperature.getCelcius()<0:raise ValueError("Temperature is out of valid range (0-150C)")
         elif relHumidity < 0 or relHumidity > 100: 
             raise ValueError("Relative humidity is out of range") 
-        temperature.toC(); pressure.toPa()
+        p=pressure.getPascal()
         # satpressure=Saturated vapor pressure at the given temperature 
-        satpressure=satVaporPressure(temperature); satpressure.toPa()
-    except Exception as e: print(e)
+        satpressure=satVaporPressure(temperature).getPascal()
+    except Exception as e: return reportError(e)
     else:
-        return relHumidity*satpressure.getValue()/(100*pressure.getValue())
+        return relHumidity*satpressure/(100*p)
 
 
 
@@ -263,12 +355,11 @@ def absoluteHumidity(temperature=None, relHumidity=None, pressure=None):
             raise ValueError("Pressure arguement value is not set in absoluteHumidity()") 
         elif relHumidity < 0 or relHumidity > 100: 
             raise ValueError("Relative humidity is out of range") 
-        temperature.toC(); pressure.toPa()
-        if temperature.getValue()<0:raise ValueError("Temperature is out of valid range (0-150C)")
+        if temperature.getCelcius()<0:raise ValueError("Temperature is out of valid range (0-150C)")
         # satpressure=Saturated vapor pressure at the given temperature 
-        satpressure=satVaporPressure(temperature); satpressure.toPa()    
-        y=relHumidity*satpressure.getValue()/(100*pressure.getValue())
-    except Exception as e: print(e)
+        satpressure=satVaporPressure(temperature)
+        y=relHumidity*satpressure.getPascal()/(100*pressure.getPascal())
+    except Exception as e: return reportError(e)
     else:
         return (0.6218*y/(1-y),'kg/kgDA') # 0.6218=18/28.947 
 
@@ -286,12 +377,11 @@ def moistureContent(temperature=None, relHumidity=None, pressure=None):
             raise ValueError("Pressure arguement value is not set in moistureContent()") 
         elif relHumidity < 0 or relHumidity > 100: 
             raise ValueError("Relative humidity is out of range") 
-        temperature.toC(); pressure.toPa()
-        if temperature.getValue()<0:raise ValueError("Temperature is out of valid range (0-150C)")
+        if temperature.getCelcius()<0:raise ValueError("Temperature is out of valid range (0-150C)")
         # satpressure=Saturated vapor pressure at the given temperature 
-        satpressure=satVaporPressure(temperature); satpressure.toPa()    
-        y=relHumidity*satpressure.getValue()/(100*pressure.getValue())
-    except Exception as e: print(e)
+        satpressure=satVaporPressure(temperature)
+        y=relHumidity*satpressure.getPascal()/(100*pressure.getPascal())
+    except Exception as e: return reportError(e)
     else:
         return (0.6218*y/(1-y),'kg/kgDA') # 0.6218=18/28.947
 
@@ -309,10 +399,9 @@ def massFraction(temperature=None, relHumidity=None, pressure=None):
             raise ValueError("Pressure arguement value is not set in massFraction()") 
         elif relHumidity < 0 or relHumidity > 100: 
             raise ValueError("Relative humidity is out of range") 
-        temperature.toC()
-        if temperature.getValue()<0:raise ValueError("Temperature is out of valid range (0-150C)")
+        if temperature.getCelcius()<0:raise ValueError("Temperature is out of valid range (0-150C)")
         x=absoluteHumidity(temperature, relHumidity, pressure)[0]
-    except Exception as e: print(e)
+    except Exception as e: return reportError(e)
     else:
         return (x/(1+x),'kg/kgHA')
 
@@ -330,15 +419,14 @@ def volumetricHumidity(temperature=None, relHumidity=None, pressure=None):
             raise ValueError("Air pressure is not set in the arguement of volumetricHumidity()") 
         elif relHumidity < 0 or relHumidity > 100: 
             raise ValueError("Relative humidity is out of range")
-        temperature.toC(); pressure.toPa()
-        if temperature.getValue()<0:raise ValueError("Temperature is out of valid range (0-150C)")
+        if temperature.getCelcius()<0:raise ValueError("Temperature is out of valid range (0-150C)")
         # satpressure=Saturated vapor pressure at the given temperature 
-        satpressure=satVaporPressure(temperature); satpressure.toPa() 
-        pp=Pressure(relHumidity*satpressure.getValue()/100,'Pa');
-        temperature.toK(); pp.toPa() 
-    except Exception as e: print(e)
+        satpressure=satVaporPressure(temperature)
+        pp=relHumidity*satpressure.getPascal()/100
+        T=temperature.getKelvin()
+    except Exception as e: return reportError(e)
     else:
-        return (0.002165*pp.getValue()/temperature.getValue(),'kg/m3') #0.002165=18/(8.314*1000) 
+        return (0.002165*pp/T,'kg/m3') #0.002165=18/(8.314*1000) 
 
 # vaporDensity() calculates the mass of water vapor per unit volume (kg/m3) 
 # of humid air when dry bulb temperature(C), relative humidity and pressure are given 
@@ -354,15 +442,14 @@ def vaporDensity(temperature=None, relHumidity=None, pressure=None):
             raise ValueError("Air pressure is not set in the arguement of vaporDensity()") 
         elif relHumidity < 0 or relHumidity > 100: 
             raise ValueError("Relative humidity is out of range")
-        temperature.toC(); pressure.toPa() 
-        if temperature.getValue()<0:raise ValueError("Temperature is out of valid range (0-150C)")
+        if temperature.getCelcius()<0:raise ValueError("Temperature is out of valid range (0-150C)")
         # satpressure=Saturated vapor pressure at the given temperature 
-        satpressure=satVaporPressure(temperature); satpressure.toPa() 
-        pp=Pressure(relHumidity*satpressure.getValue()/100,'Pa');
-        temperature.toK(); pp.toPa() 
-    except Exception as e: print(e)
+        satpressure=satVaporPressure(temperature)
+        pp=relHumidity*satpressure.getPascal()/100
+        T=temperature.getKelvin()
+    except Exception as e: return reportError(e)
     else:
-        return (0.002165*pp.getValue()/temperature.getValue(),'kg/m3') #0.002165=18/(8.314*1000) 
+        return (0.002165*pp/T,'kg/m3') #0.002165=18/(8.314*1000) 
 
 
  
@@ -380,15 +467,14 @@ def humidVolume(temperature=None, relHumidity=None, pressure=None):
             raise ValueError("Air pressure is not set in the arguement of humidVolume()") 
         elif relHumidity < 0 or relHumidity > 100: 
             raise ValueError("Relative humidity is out of range")
-        temperature.toC(); pressure.toPa() 
-        if temperature.getValue()<0:raise ValueError("Temperature is out of valid range (0-150C)")
+        if temperature.getCelcius()<0:raise ValueError("Temperature is out of valid range (0-150C)")
         # satpressure=Saturated vapor pressure at the given temperature 
-        satpressure=satVaporPressure(temperature); satpressure.toPa() 
-        y=relHumidity*satpressure.getValue()/(100*pressure.getValue())	
-        temperature.toK(); pressure.toPa()
-    except Exception as e: print(e)
+        satpressure=satVaporPressure(temperature); p=pressure.getPascal()
+        y=relHumidity*satpressure.getPascal()/(100*p)
+        T=temperature.getKelvin()
+    except Exception as e: return reportError(e)
     else:		
-        return (287.2*temperature.getValue()/(pressure.getValue()*(1-y)),'m3/kgDA') #287.2=8.314*1000/28.947 
+        return (287.2*T/(p*(1-y)),'m3/kgDA') #287.2=8.314*1000/28.947 
 
 
 
@@ -406,15 +492,14 @@ def humidDensity(temperature=None, relHumidity=None, pressure=None):
             raise ValueError("Air pressure is not set in the arguement of humidDensity()") 
         elif relHumidity < 0 or relHumidity > 100: 
             raise ValueError("Relative humidity is out of range")
-        temperature.toC(); pressure.toPa() 
-        if temperature.getValue()<0:raise ValueError("Temperature is out of valid range (0-150C)")
+        if temperature.getCelcius()<0:raise ValueError("Temperature is out of valid range (0-150C)")
         # satpressure=Saturated vapor pressure at the given temperature 
-        satpressure=satVaporPressure(temperature); satpressure.toPa() 
-        y=relHumidity*satpressure.getValue()/(100*pressure.getValue()) 
-        temperature.toK();pressure.toPa()
-    except Exception as e: print(e)
+        satpressure=satVaporPressure(temperature); p=pressure.getPascal()
+        y=relHumidity*satpressure.getPascal()/(100*p) 
+        T=temperature.getKelvin()
+    except Exception as e: return reportError(e)
     else:
-        return ((1-0.37817*y)*0.0034817*pressure.getValue()/temperature.getValue(),'kgHA/m3') 
+        return ((1-0.37817*y)*0.0034817*p/T,'kgHA/m3') 
         #0.37817=(29.847-18)/28.947; 0.0034847=28.947/8.314*1000 
 
 
@@ -432,20 +517,73 @@ def humidMolarMass(temperature=None, relHumidity=None, pressure=None):
             raise ValueError("Pressure arguement value is not set in humidMolarMass()") 
         elif relHumidity < 0 or relHumidity > 100: 
             raise ValueError("Relative humidity is out of range")
-        temperature.toC()
-        if temperature.getValue()<0:raise ValueError("Temperature is out of valid range (0-150C)")
+        if temperature.getCelcius()<0:raise ValueError("Temperature is out of valid range (0-150C)")
         y=moleFraction(temperature, relHumidity, pressure) 
-    except Exception as e: print(e)
+    except Exception as e: return reportError(e)
     else:
         return ((1-y)*28.947+y*18, 'g/mol')
 
 
 	
+# most iterations of calculateWetBulbTemperature(); a state which does not converge by
+# then is reported as an error instead of iterating for ever (99.6% of the states of wet
+# bulb temperature above 0 C at 1 atm converge in 1000 iterations)
+wet_bulb_max_iterations=1000
+
+
+# wetBulbResidualValue() returns partial pressure (Pa) on the constant wet bulb temperature
+# line minus saturated vapor pressure (Pa) at twb(C); t(C), mass fraction x0 and p(Pa) of the air
+# gradient of wet bulb temperature line=-0.00041667 (kg moisture/kg DA)/degC 
+# x,x0=mass fraction; x=x0-0.00041667(twb-t)
+def wetBulbResidualValue(twb, t, x0, p):
+    x=x0-0.00041667*(twb-t)
+    return x*p/(0.6218+x)-133322.368421*(satPressureValue(twb)*0.001)
+
+
+# wetBulbValue() solves wet bulb temperature in C of plain values: dry bulb temperature t(C),
+# mass fraction x0 and pressure p(Pa); the same steps as wetBulbSolve() of psychro_arrays
+# Method: Illinois (bracketed secant) iteration on the constant wet bulb temperature line
+#     between 0 C and t; tol is the final bracket width in C
+# start (C, optional) warm starts from the bracket start-step..start+step; when the root is
+#     out of it, the bracket is the rest of 0 C..t (one more iteration)
+# returns (wet bulb temperature in C, iterations); NaN when the wet bulb temperature is below
+# 0 C or does not converge in maxIter iterations
+def wetBulbValue(t, x0, p, tol=1e-6, maxIter=100, start=None, step=1.0):
+    iterations=0
+    if start is None or start!=start: (a,b)=(0.0,t)
+    else:
+        a=min(max(start-step,0.0),t); b=min(max(start+step,0.0),t)
+        if not b>a: (a,b)=(0.0,t)
+    fa=wetBulbResidualValue(a,t,x0,p); fb=wetBulbResidualValue(b,t,x0,p)
+    if start is not None and start==start:
+        # the residual decreases with the wet bulb temperature: root above b or below a
+        if fb>0: (a,fa)=(b,fb); b=t; fb=wetBulbResidualValue(b,t,x0,p); iterations=1
+        elif fa<0: (b,fb)=(a,fa); a=0.0; fa=wetBulbResidualValue(a,t,x0,p); iterations=1
+    # wet bulb below 0 C cannot be bracketed
+    if fa<0: return (float('nan'),iterations)
+    if fa==0: return (a,iterations)
+    if fb==0 or abs(b-a)<=tol: return (b,iterations)
+    for k in range(maxIter):
+        iterations+=1
+        c=b-fb*(b-a)/(fb-fa)
+        fc=wetBulbResidualValue(c,t,x0,p)
+        # keep the root bracketed; halve the retained end value (Illinois)
+        if fc*fb<0: (a,fa)=(b,fb)
+        else: fa=fa*0.5
+        (b,fb)=(c,fc)
+        if fc==0 or abs(c-a)<=tol: return (c,iterations)
+    return (float('nan'),iterations)
+
+
 # wetBulbTemperature() calculates wet bulb temperature when dry bulb temperature(C), 
 # atmospheric pressure(Pa) and relative humidity(%) are given 
-# Method:Following constant wet bulb temperature line 
+# Method: Following constant wet bulb temperature line by Illinois (bracketed secant)
+#     iteration between 0 C and the dry bulb temperature (wetBulbValue()); the same solver
+#     as wetBulbTemperatureArray(), PsychroState and psychro.fast
+# start (Temperature, optional) warm starts the solve, e.g. from the wet bulb temperature
+# of the previous sample of a time series
 # Function No:15
-def wetBulbTemperature(temperature=None, relHumidity=None, pressure=None): 
+def wetBulbTemperature(temperature=None, relHumidity=None, pressure=None, start=None): 
     try:
         if temperature==None: 
 	        raise ValueError("Temperature is not set in the argument of wetBulbTemperature()") 
@@ -456,45 +594,24 @@ def wetBulbTemperature(temperature=None, relHumidity=None, pressure=None):
         elif relHumidity<0 or relHumidity>100: 
             raise ValueError("Incorrect value of Relative humidity") 
 		
-        if relHumidity==100: return temperature 
-        temperature.toC(); pressure.toPa()
-        if temperature.getValue()<0:raise ValueError("Temperature is out of valid range (0-150C)")
-        # gradient of wet bulb temperature line=-0.00041667 (kg moisture/kg DA)/degC 
-        # pp=partial pressure; x,x0=mass fraction;x=x0-0.00041667(t-temperature) 
+        if relHumidity==100: return temperature.copy()
+        (t,p)=(temperature.getCelcius(),pressure.getPascal())
+        if t<0:raise ValueError("Temperature is out of valid range (0-150C)")
         x0=massFraction(temperature, relHumidity, pressure)[0] 
-        new_temp = Temperature(0.8*temperature.getValue(),'C')
-
-        dewpoint=dewPoint(temperature,relHumidity); new_dewpoint=Temperature(dewpoint.getValue(),'C') 
-        while True: 
-            x=x0-0.00041667*(new_temp.getValue()-temperature.getValue()) 
-            y=x/(0.6218+x) 
-            pp=y*pressure.getValue() 
-            satpressure=satVaporPressure(new_temp); satpressure.toPa() 
-            new_RH=pp*100/satpressure.getValue() 
-            if new_RH>99.5 and new_RH<100.5:break 
-            elif new_RH>100: 
-                new_temp=Temperature(new_temp.getValue()*1.1,'C') 
-                continue 
-            new_dewpoint=dewPoint(new_temp,new_RH) 
-            new_temp=Temperature(0.9*new_temp.getValue(),'C') 
-            if new_temp.getValue()>new_dewpoint.getValue(): 
-                diff=new_temp.getValue()-new_dewpoint.getValue() 
-                new_temp=Temperature(0.9*new_temp.getValue(),'C') 
-            elif new_temp.getValue()==new_dewpoint.getValue(): break 
-            else: 
-                diff = new_dewpoint.getValue() - new_temp.getValue()
-                new_temp=Temperature(new_temp.getValue()*1.1,'C') 
-            if diff < 0.00001: break 
-    except Exception as e: print(e)
-    else: return new_temp 
+        (twb,iterations)=wetBulbValue(t,x0,p,start=None if start is None else start.getCelcius())
+        prof.addIterations(iterations)
+        if twb!=twb: raise ValueError("Wet bulb temperature is below 0 C or does not converge")
+    except Exception as e: return reportError(e)
+    else: return Temperature(twb,'C')
 
 
 # calculateWetBulbTemp() calculates wet bulb temperature when dry bulb temperature(C), 
 # atmospheric pressure(Pa) and relative humidity(%) are given 
 # Method: Ferrel Equation
 #     Pw=Psat,wb - A*P*(T-Twb) where A=0.0006666667(1+0.00115*Twb) 
+# start (Temperature, optional) is the first guess instead of 0.7*temperature
 # Function No:16
-def calculateWetBulbTemperature(temperature=None, relHumidity=None, pressure=None):
+def calculateWetBulbTemperature(temperature=None, relHumidity=None, pressure=None, start=None):
     try: 
         if temperature==None: 
 	        raise ValueError("Temperature is not set in the argument of calculateWetBulbTemp()") 
@@ -504,22 +621,38 @@ def calculateWetBulbTemperature(temperature=None, relHumidity=None, pressure=Non
             raise ValueError("Air pressure is not set in the argument of calculateWetBulbTemp()") 
         elif relHumidity<0 or relHumidity>100: 
             raise ValueError("Incorrect value of Relative humidity")		
-        if relHumidity==100: return temperature
+        if relHumidity==100: return temperature.copy()
 		
-        temperature.toC(); pressure.toPa()
-        if temperature.getValue()<0:raise ValueError("Temperature is out of valid range (0-150C)")
-        sat_pressue=satVaporPressure(temperature); sat_pressue.toPa()
-        Twb_old = Temperature(0,'C')	# in C
-        Twb_new = Temperature(0.7*temperature.getValue(),'C') # in C
-        while abs(Twb_old.getValue()-Twb_new.getValue()) > 0.000001:
-            A=0.0006666667*(1+0.00115*Twb_new.getValue())
-            drybulb_pp=Pressure(relHumidity*sat_pressue.getValue()/100,'Pa',True)
-            wetbulbsatp_value=drybulb_pp.getValue() + A*pressure.getValue()*(temperature.getValue()-Twb_new.getValue())
-            wetbulbsatp=Pressure(wetbulbsatp_value,'Pa',True)
-            Twb_old=Twb_new;
-            Twb_new=satTemperature(wetbulbsatp)
-    except Exception as e: print(e) 
-    else: return Twb_new
+        (t,p)=(temperature.getCelcius(),pressure.getPascal())
+        if t<0:raise ValueError("Temperature is out of valid range (0-150C)")
+        sat_pressure=satPressureValue(t)
+        if sat_pressure==None: raise ValueError("Invalid Temperature Value for Antoine equation.")
+        drybulb_pp=relHumidity*(133322.368421*(sat_pressure*0.001))/100 # Pa
+        # the wet bulb temperature is below 0 C when the pressure of Ferrel equation at 0 C
+        # is below the saturated vapor pressure at 0 C
+        if drybulb_pp + 0.0006666667*p*t < 133322.368421*(satPressureValue(0)*0.001):
+            raise ValueError("Wet bulb temperature is below 0 C")
+        twb=0.7*t if start is None else start.getCelcius() # in C
+        iterations=0
+        # at least one step from the first guess; converged when a step is below 1e-6 C; the
+        # iteration diverges where the saturation curve is flatter than A*P (wet bulb
+        # temperature below about 7 C at 1 atm) and stops when it leaves the curve
+        while True:
+            iterations+=1
+            if iterations>wet_bulb_max_iterations:
+                prof.addIterations(iterations-1)
+                raise ValueError("Wet bulb temperature does not converge in "+str(wet_bulb_max_iterations)+" iterations")
+            A=0.0006666667*(1+0.00115*twb)
+            wetbulbsatp=drybulb_pp + A*p*(t-twb) # Pa
+            twb_old=twb
+            twb=satTemperatureValue(wetbulbsatp*7.500616827e-6) if wetbulbsatp>0 else None
+            if twb==None:
+                prof.addIterations(iterations)
+                raise ValueError("Wet bulb temperature does not converge")
+            if abs(twb_old-twb) <= 0.000001: break
+        prof.addIterations(iterations)
+    except Exception as e: return reportError(e)
+    else: return Temperature(twb,'C')
 
 
 
@@ -544,91 +677,140 @@ def calculateWetBulbTemperature(temperature=None, relHumidity=None, pressure=Non
 # and pressure using the critical thermodynamic data
 # Function No:17
 def resudualEnthalpy(T,P,Tc,Pc,w): 
-    T.toK(); Tc.toK(); P.toBar(); Pc.toBar() 
-    R=8.314; Tr = T.getValue()/Tc.getValue(); Pr = P.getValue()/Pc.getValue() 
-    return (((0.083-1.097/Tr**1.6)+w*(0.139-0.894/Tr**4.2))*Pr*R*Tc.getValue(),'J/mol') 
+    return (residualEnthalpyValue(T.getKelvin(),P.getBar(),Tc.getKelvin(),Pc.getBar(),w),'J/mol') 
+
+
+# residualEnthalpyValue() is resudualEnthalpy() of plain values; T, Tc in K; P, Pc in bar
+def residualEnthalpyValue(T,P,Tc,Pc,w):
+    R=8.314; Tr = T/Tc; Pr = P/Pc
+    return ((0.083-1.097/Tr**1.6)+w*(0.139-0.894/Tr**4.2))*Pr*R*Tc
+
+
+# Critical data of the components of humid air: (Tc in K, Pc in bar, w)
+# Kelvin values pass through C as Temperature.toK() does
+def kelvinValue(t): return (t-273.15)+273.15
+
+critical_data={'H2O':(kelvinValue(647.3),220.5,0.344), 'O2':(kelvinValue(154.6),50.5,0.021),\
+    'N2':(kelvinValue(126.2),33.9,0.04), 'Ar':(kelvinValue(150.8),48.7,0), 'CO2':(kelvinValue(304.2),73.8,0.225)}
+reference_temperature=kelvinValue(298.15)
+
+# Cp integral (<Cp>/R between 298.15 K and T) of the components
+cp_integrals={'H2O':lambda T: 3.47+0.000725*(T+298.15)-12100/(298.15*T),\
+    'O2':lambda T: 3.639 + 0.000506*(T+298.15)-22700/(298.15*T),\
+    'N2':lambda T: 3.280+0.000593*(T+298.15)+4000/(298.15*T),\
+    'Ar':lambda T: 2.5001,\
+    'CO2':lambda T: 5.457*0.001045*(T+298.15)-115700/(298.15*T)}
+
+# Enthalpy of water vapor at 298.15 K with respect to liquid water at 273.15 K (J/mol)
+CpIntegralWater=8.712+0.00125*(273.15+298.15)/2-0.00000018*(298.15*298.15+273.15*273.15+298.15*273.15) 
+water_reference_enthalpy=CpIntegralWater*25*8.314+43965
+
+
+# Enthalpy cache
+# ================================
+# The component enthalpies are kept in a bounded LRU cache keyed on (component, T, P);
+# T(K) and P(bar) are rounded to enthalpy_cache_digits decimals before the look up.
+# The residual enthalpy at the reference temperature (298.15 K) depends on the pressure
+# only and is kept in its own cache. enthalpyCacheInfo() returns the hit/miss counters.
+enthalpy_cache_size=4096
+enthalpy_cache_digits=9
+
+
+# referenceResidualEnthalpy() returns residual enthalpy (J/mol) of a component at 298.15 K
+# and the pressure P in bar
+@functools.lru_cache(maxsize=256)
+def referenceResidualEnthalpy(component,P):
+    (Tc,Pc,w)=critical_data[component]
+    return residualEnthalpyValue(reference_temperature,P,Tc,Pc,w)
+
+
+# componentEnthalpy() returns enthalpy change (J/mol) of a component of humid air at T(K)
+# and P(bar) with respect to 298.15 K; water vapor is referred to liquid water at 273.15 K
+@functools.lru_cache(maxsize=enthalpy_cache_size)
+def componentEnthalpy(component,T,P):
+    (Tc,Pc,w)=critical_data[component]
+    delH=cp_integrals[component](T)*(T-298.15)*8.314
+    if component=='H2O': delH=water_reference_enthalpy+delH
+    return delH+residualEnthalpyValue(T,P,Tc,Pc,w)-referenceResidualEnthalpy(component,P)
+
+
+# cachedEnthalpy() returns componentEnthalpy() at the quantized T(K) and P(bar)
+def cachedEnthalpy(component,T,P):
+    return componentEnthalpy(component,round(T,enthalpy_cache_digits),round(P,enthalpy_cache_digits))
+
+
+# enthalpyCacheInfo() returns the hit/miss counters of the enthalpy caches
+def enthalpyCacheInfo():
+    return {'component':componentEnthalpy.cache_info(),'reference':referenceResidualEnthalpy.cache_info()}
+
+
+# clearEnthalpyCache() empties the enthalpy caches and resets their counters
+def clearEnthalpyCache():
+    componentEnthalpy.cache_clear(); referenceResidualEnthalpy.cache_clear()
 
 
 # delHH2O() calculates enthalpy change of water vapor in J/mol 
 # at the given temperature with respect to the room temperature (298.15 K) 
 # Function No:18
 def delHH2O(temperature,pressure): 
-    temperature.toK(); pressure.tobar() 
-    T=temperature.getValue();
-    CpIntegralWater=8.712+0.00125*(273.15+298.15)/2-0.00000018*(298.15*298.15+273.15*273.15+298.15*273.15) 
-    HO = CpIntegralWater*25*8.314+43965 # J/mol 
-    if T==298.15: return (HO,'J/mol')
-    CpIntegral = 3.47+0.000725*(T+298.15)-12100/(298.15*T) 
-    Tc=Temperature(647.3,'K'); Pc=Pressure(220.5,'bar'); w=0.344 
-    H2=resudualEnthalpy(temperature,pressure,Tc,Pc,w)[0] 
-    H1=resudualEnthalpy(Temperature(298.15,'K'),pressure,Tc,Pc,w)[0] 
-    return (HO+CpIntegral*(T-298.15)*8.314 + H2-H1,'J/mol')
+    return (delHH2OValue(temperature.getKelvin(),pressure.getBar()),'J/mol')
 
 	
 # de1HO2() calculates enthalpy change of oxygen gas in )/mol 
 # at the given temperature with respect to the room temperature (298.15 K) 
 # Function No:19
 def de1HO2(temperature,pressure): 
-    temperature.toK(); pressure.tobar() 
-    T=temperature.getValue();
+    T=temperature.getKelvin()
     if T==298.15: return (0,'J/mol')
-    CpIntegral = 3.639 + 0.000506*(T+298.15)-22700/(298.15*T) 
-    Tc = Temperature(154.6,'K'); Pc=Pressure(50.5,'bar'); w=0.021 
-    H2=resudualEnthalpy(temperature,pressure,Tc,Pc,w)[0] 
-    H1=resudualEnthalpy(Temperature(298.15,'K'),pressure,Tc,Pc,w)[0] 
-    return (CpIntegral*(T-298.15)*8.314+H2-H1,'J/mol')
+    return (cachedEnthalpy('O2',T,pressure.getBar()),'J/mol')
 
 
 # delHN2() calculates enthalpy change of nitrogen gas in J/mol 
 # at the given temperature with respect to the room temperature (298.15 K) 
 # Function No:20
 def delHN2(temperature,pressure): 
-    temperature.toK(); pressure.tobar() 
-    T=temperature.getValue();
-    if T==298.15: return (0,'J/mol')	
-    CpIntegral=3.280+0.000593*(T+298.15)+4000/(298.15*T) 
-    Tc=Temperature(126.2,'K'); Pc=Pressure(33.9,'bar'); w=0.04 
-    H2=resudualEnthalpy(temperature,pressure,Tc,Pc,w)[0] 
-    H1=resudualEnthalpy(Temperature(298.15,'K'),pressure,Tc,Pc,w)[0] 
-    return (CpIntegral*(T-298.15)*8.314+H2-H1,'J/mol') 
+    T=temperature.getKelvin()
+    if T==298.15: return (0,'J/mol')
+    return (cachedEnthalpy('N2',T,pressure.getBar()),'J/mol') 
 
 
 # delHCO2() calculates enthalpy change of carbon dioxide gas in J/mol 
 # at the given temperature with respect to the room temperature (298.15 K) 
 # Function No:21
 def delHCO2(temperature,pressure): 
-    temperature.toK(); pressure.tobar() 
-    T=temperature.getValue();
-    if T==298.15: return (0,'J/mol')	
-    CpIntegral=5.457*0.001045*(T+298.15)-115700/(298.15*T) 
-    Tc=Temperature(304.2,'K'); Pc=Pressure(73.8,'bar'); w=0.225 
-    H2=resudualEnthalpy(temperature,pressure,Tc,Pc,w)[0] 
-    H1=resudualEnthalpy(Temperature(298.15,'K'), pressure, Tc, Pc, w)[0] 
-    return (CpIntegral*(T-298.15)*8.314+H2-H1,'J/mol') 
+    T=temperature.getKelvin()
+    if T==298.15: return (0,'J/mol')
+    return (cachedEnthalpy('CO2',T,pressure.getBar()),'J/mol') 
 
 
 # delHAr() calculates enthalpy change of argon gas in J/mol 
 # at the given temperature with respect to the room temperature (298.15 K) 
 # Function No:22
 def delHAr(temperature,pressure): 
-    temperature.toK(); pressure.tobar() 
-    T=temperature.getValue();
+    T=temperature.getKelvin()
     if T==298.15: return (0,'J/mol')
-    CpIntegral=2.5001 
-    Tc=Temperature(150.8,'K'); Pc=Pressure(48.7,'bar'); w=0 
-    H2=resudualEnthalpy(temperature,pressure,Tc,Pc,w)[0] 
-    H1=resudualEnthalpy(Temperature(298.15,'K'),pressure,Tc,Pc,w)[0] 
-    return (CpIntegral*(T-298.15)*8.314+H2-H1,'J/mol') 
+    return (cachedEnthalpy('Ar',T,pressure.getBar()),'J/mol') 
 	
 	
 # delHDryAir() calculates enthalpy change of dry air in J/mol 
 # at the given temperature with respect to the standard temperature (298.15 K) 
 # Function No:23
 def delHDryAir(temperature,pressure): 
-    temperature.toK(); pressure.tobar() 
-    T=temperature; P=pressure 
-    delH=de1HO2(T,P)[0]*0.2095+delHN2(T,P)[0]*0.7809+delHAr(T,P)[0]*0.0092+delHCO2(T,P)[0]*0.0004 
-    return (delH,'J/mol')
+    return (delHDryAirValue(temperature.getKelvin(),pressure.getBar()),'J/mol')
+
+
+# delHDryAirValue() is delHDryAir() of plain values; T in K, P in bar
+# Dry Air=(20.95% 02, 78.09% N2, 0.92% Ar, 0.04% CO2)
+def delHDryAirValue(T,P):
+    if T==298.15: return 0.0
+    return cachedEnthalpy('O2',T,P)*0.2095+cachedEnthalpy('N2',T,P)*0.7809+\
+        cachedEnthalpy('Ar',T,P)*0.0092+cachedEnthalpy('CO2',T,P)*0.0004
+
+
+# delHH2OValue() is delHH2O() of plain values; T in K, P in bar
+def delHH2OValue(T,P):
+    if T==298.15: return water_reference_enthalpy
+    return cachedEnthalpy('H2O',T,P)
 	
 	
 # delHHumidAir() calculates enthalpy change of humid air in J/mol 
@@ -643,34 +825,34 @@ def delHHumidAir(temperature=None, relHumidity=None, pressure=None):
         raise ValueError("Air pressure is not set in the argument of delHHumidAir()") 
     elif relHumidity<0 or relHumidity>100: 
         raise ValueError("Incorrect value of Relative humidity") 
-    temperature.toC()
-    if temperature.getValue()<0:raise ValueError("Temperature is out of valid range (0-150C)")
+    if temperature.getCelcius()<0:raise ValueError("Temperature is out of valid range (0-150C)")
     y=moleFraction(temperature, relHumidity, pressure) 
-    temperature.toK(); 
     delH=(1-y)*delHDryAir(temperature,pressure)[0] + y*delHH2O(temperature,pressure)[0] 
     return (delH,'J/mol') 
 
 
 
+# Default pressure of humidSaturationEnthalpy(); shared by all calls, so it is never changed
+standard_pressure=Pressure(1,'atm')
+
+
 # humidSaturationEnthalpy() calculates saturation enthalpy of humid air in kJ/kgDA 
 # at the given saturated temperature at which relative humidity is 100% 
 # (Ref. Temp.=273.15K)
 # Function No:25
-def humidSaturationEnthalpy(temperature=None,pressure=Pressure(1,'atm')):
+def humidSaturationEnthalpy(temperature=None,pressure=standard_pressure):
     try:
         if temperature==None: 
             raise ValueError("Temperature is not set in the argument of humidSaturationEnthalpy()") 
         elif pressure==None: 
             raise ValueError("Air pressure is not set in the argument of humidSaturationEnthalpy()") 
         relHumidity=100;
-        temperature.toC()
-        if temperature.getValue()<0:raise ValueError("Temperature is out of valid range (0-150C)")
+        if temperature.getCelcius()<0:raise ValueError("Temperature is out of valid range (0-150C)")
         y=moleFraction(temperature, relHumidity, pressure)
         molarmassha=humidMolarMass(temperature, relHumidity, pressure)[0]
         x=massFraction(temperature, relHumidity, pressure)[0]
-        temperature.toK(); 
         delH=(1-y)*delHDryAir(temperature,pressure)[0] + y*delHH2O(temperature,pressure)[0]
-    except Exception as e:print(e)
+    except Exception as e: return reportError(e)
     else:	
         # Enthalpy correction (Reference Temperature Correction)
 	    # At 273.15 (0C), enthalpy=9.47 kJ/kgDA, humid air enthalpy = -16.883390422273617 kJ/kgDA
@@ -693,10 +875,9 @@ def humidAirEnthalpy(temperature=None, relHumidity=None, pressure=None):
             raise ValueError("Air pressure is not set in the argument of humidAirEnthalpy()") 
         elif relHumidity<0 or relHumidity>100: 
             raise ValueError("Incorrect value of Relative humidity")
-        temperature.toC()
-        if temperature.getValue()<0:raise ValueError("Temperature is out of valid range (0-150C)")
+        if temperature.getCelcius()<0:raise ValueError("Temperature is out of valid range (0-150C)")
         wetbulbtemp=wetBulbTemperature(temperature, relHumidity, pressure)
-    except Exception as e:print(e)
+    except Exception as e: return reportError(e)
     else:
         return humidSaturationEnthalpy(wetbulbtemp,pressure)
 
@@ -710,12 +891,10 @@ def dryAirEnthalpy(temperature=None,pressure=None):
             raise ValueError("Temperature argument of dryAirEnthalpy() is not set") 
         elif pressure==None: 
             raise ValueError("Air pressure argument of dryAirEnthalpy() is not set") 
-        temperature.toK(); pressure.tobar() 
-        T=temperature; P=pressure 
-        delH=de1HO2(T,P)[0]*0.2095+delHN2(T,P)[0]*0.7809+delHAr(T,P)[0]*0.0092+delHCO2(T,P)[0]*0.0004 
+        delH=delHDryAirValue(temperature.getKelvin(),pressure.getBar())
         # Current Reference Level = 25C, Change it to 0C; 
         zero_correction= 26.273618984842212
-    except Exception as e:print(e)
+    except Exception as e: return reportError(e)
     else: return (zero_correction + delH/28.947,'kJ/kgDA')	
 
 
@@ -733,10 +912,37 @@ def waterVaporEnthalpy(temperature=None,relHumidity=None,pressure=None):
             raise ValueError("Air pressure is not set in the argument of waterVaporEnthalpy()") 
         elif relHumidity<0 or relHumidity>100: 
             raise ValueError("Incorrect value of Relative humidity") 
-        temperature.toC()
-        if temperature.getValue()<0:raise ValueError("Temperature is out of valid range (0-150C)")
-        temperature.toK(); pressure.tobar() 
+        if temperature.getCelcius()<0:raise ValueError("Temperature is out of valid range (0-150C)")
         T=temperature; P=pressure
-    except Exception as e:print(e)
+    except Exception as e: return reportError(e)
     else: return (absoluteHumidity(T, relHumidity,P)[0]*delHH2O(T,P)[0]/18,'kJ/kgDA')
-	
\ No newline at end of file
+
+
+
+# Specific heats (kJ/kg.K) and enthalpy of evaporation at 0 C (kJ/kg) of directEnthalpy()
+cp_dry_air=1.006; cp_water_vapor=1.86; h_evaporation=2501.0
+
+
+# directEnthalpy() calculates enthalpy of humid air in kJ/kgDA directly from the humidity
+# ratio W at the given dry bulb temperature, relative humidity and pressure without the
+# wet bulb iteration: h=cp_a*t+W*(h_fg+cp_v*t), t in C (Ref. Temp. = 273.15K = 0C)
+# It differs from humidAirEnthalpy() by -1.5 to +0.4 kJ/kgDA at 0-30 C and -2.0 to
+# +3.8 kJ/kgDA at 0-40 C (1 atm); the difference grows at higher temperature and humidity
+# Function No:29
+def directEnthalpy(temperature=None, relHumidity=None, pressure=None):
+    try:
+        if temperature==None: 
+            raise ValueError("Temperature is not set in the argument of directEnthalpy()") 
+        elif relHumidity==None: 
+            raise ValueError("Relative humidity is not set in the argument of directEnthalpy()") 
+        elif pressure==None: 
+            raise ValueError("Air pressure is not set in the argument of directEnthalpy()") 
+        elif relHumidity < 0 or relHumidity > 100: 
+            raise ValueError("Relative humidity is out of range")
+        t=temperature.getCelcius()
+        if t<0:raise ValueError("Temperature is out of valid range (0-150C)")
+        satpressure=satVaporPressure(temperature)
+        y=relHumidity*satpressure.getPascal()/(100*pressure.getPascal())
+        x=0.6218*y/(1-y) # absoluteHumidity()
+    except Exception as e: return reportError(e)
+    else: return (cp_dry_air*t+x*(h_evaporation+cp_water_vapor*t),'kJ/kgDA')
@@ -0,0 +1,288 @@
+'''
+Module Name:'saturation_correlations'
+Path:'<package_root>/src/saturation_correlations.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, saturation_correlations.py has the saturation correlations of \
+    pure water which can be selected as saturation backends besides Antoine equation \
+    and the saturation table (see setSaturationBackend() in psychro_functions): \
+    Magnus (Alduchov-Eskridge), Hyland-Wexler (ASHRAE Handbook, over liquid water) and \
+    IAPWS-IF97 region 4 (saturation line). Every correlation has a scalar and an array \
+    forward function (C -> mmHg) and inverse function (mHg -> C) with the same units \
+    and range as antoineVaporPressure() and antoineTemperature(): the forward functions \
+    are valid for 0-150 C; the inverse functions take any positive vapor pressure up to \
+    the vapor pressure at 150 C, so the dew points below 0 C are extrapolations of the \
+    fit of every correlation (the blended Antoine equation is the lower branch of \
+    Antoine equation there); solveState() inverts these extrapolations below 0 C.'
+Inverse Functions:
+    Magnus, IAPWS-IF97: closed form (IF97 backward equation)
+    Hyland-Wexler: Newton iteration on ln(p) with the analytic derivative, started from
+        Magnus inverse; it stops after a step below 1e-5 C (2-3 iterations), when the
+        error is below 1e-12 C as the iteration converges quadratically
+Dependency: math, numpy
+'''
+from __future__ import division
+import math
+import numpy as np
+
+__version__='1.0.0.2026.10.18'
+version='1.0.0.2026.10.18'
+
+# Pa in 1 mmHg (as mHg of Pressure class) and hPa in 1 mmHg
+mmHg_pascal=133.322368421
+mmHg_hpa=1.33322368421
+
+
+# Magnus equation (Alduchov and Eskridge, 1996)
+# ================================
+# es = 6.1094*exp(17.625*t/(t+243.04)); es in hPa, t in C
+magnus_a=6.1094; magnus_b=17.625; magnus_c=243.04
+
+# magnusVaporPressure() returns saturated vapor pressure in mmHg at t(C) by Magnus equation;
+# returns None outside 0-150 C
+def magnusVaporPressure(t):
+    if not (t>=0 and t<=150): return None
+    return magnus_a*math.exp(magnus_b*t/(t+magnus_c))/mmHg_hpa
+
+
+# magnusTemperature() returns saturated temperature in C at the vapor pressure p(mHg) by
+# the inverse of Magnus equation; returns None out of range
+def magnusTemperature(p):
+    if not (p>0 and p<=magnus_p_high): return None
+    x=math.log(p*1000*mmHg_hpa/magnus_a)
+    return magnus_c*x/(magnus_b-x)
+
+
+# magnusVaporPressureArray() is the array version of magnusVaporPressure(); NaN out of range
+def magnusVaporPressureArray(t):
+    t=np.where((t>=0)&(t<=150),t,np.nan)
+    return magnus_a*np.exp(magnus_b*t/(t+magnus_c))/mmHg_hpa
+
+
+# magnusTemperatureArray() is the array version of magnusTemperature(); NaN out of range
+def magnusTemperatureArray(p):
+    p=np.where((p>0)&(p<=magnus_p_high),p,np.nan)
+    x=np.log(p*1000*mmHg_hpa/magnus_a)
+    return magnus_c*x/(magnus_b-x)
+
+
+# Hyland-Wexler equation over liquid water (ASHRAE Handbook Fundamentals, chapter 1)
+# ================================
+# ln(pws) = C8/T + C9 + C10*T + C11*T^2 + C12*T^3 + C13*ln(T); pws in Pa, T in K
+hw_c=(-5.8002206e3,1.3914993,-4.8640239e-2,4.1764768e-5,-1.4452093e-8,6.5459673)
+# Newton iterations: the error after a step below hw_tolerance (C) is below 1e-12 C
+hw_iterations=20
+hw_tolerance=1e-5
+
+# hylandWexlerLog() returns ln(pws in Pa) at T(K)
+def hylandWexlerLog(T):
+    (c8,c9,c10,c11,c12,c13)=hw_c
+    return c8/T+c9+T*(c10+T*(c11+T*c12))+c13*math.log(T)
+
+
+# hylandWexlerVaporPressure() returns saturated vapor pressure in mmHg at t(C) by
+# Hyland-Wexler equation; returns None outside 0-150 C
+def hylandWexlerVaporPressure(t):
+    if not (t>=0 and t<=150): return None
+    return math.exp(hylandWexlerLog(t+273.15))/mmHg_pascal
+
+
+# hylandWexlerTemperature() returns saturated temperature in C at the vapor pressure p(mHg)
+# by Newton iteration of Hyland-Wexler equation with its derivative
+# d(ln pws)/dT = -C8/T^2 + C10 + 2*C11*T + 3*C12*T^2 + C13/T; returns None out of range
+def hylandWexlerTemperature(p):
+    if not (p>0 and p<=hw_p_high): return None
+    y=math.log(p*1000*mmHg_pascal)
+    x=math.log(p*1000*mmHg_hpa/magnus_a)
+    T=magnus_c*x/(magnus_b-x)+273.15
+    (c8,c9,c10,c11,c12,c13)=hw_c; log=math.log
+    for k in range(hw_iterations):
+        dT=(c8/T+c9+T*(c10+T*(c11+T*c12))+c13*log(T)-y)/(-c8/(T*T)+c10+T*(2*c11+3*c12*T)+c13/T)
+        T-=dT
+        if abs(dT)<hw_tolerance: break
+    return T-273.15
+
+
+# hylandWexlerVaporPressureArray() is the array version of hylandWexlerVaporPressure()
+def hylandWexlerVaporPressureArray(t):
+    (c8,c9,c10,c11,c12,c13)=hw_c
+    T=np.where((t>=0)&(t<=150),t,np.nan)+273.15
+    return np.exp(c8/T+c9+T*(c10+T*(c11+T*c12))+c13*np.log(T))/mmHg_pascal
+
+
+# hylandWexlerTemperatureArray() is the array version of hylandWexlerTemperature(); all
+# values are iterated together until the largest step is below hw_tolerance
+def hylandWexlerTemperatureArray(p):
+    (c8,c9,c10,c11,c12,c13)=hw_c
+    p=np.where((p>0)&(p<=hw_p_high),p,np.nan)
+    y=np.log(p*1000*mmHg_pascal)
+    x=np.log(p*1000*mmHg_hpa/magnus_a)
+    T=magnus_c*x/(magnus_b-x)+273.15
+    for k in range(hw_iterations):
+        dT=(c8/T+c9+T*(c10+T*(c11+T*c12))+c13*np.log(T)-y)/(-c8/(T*T)+c10+T*(2*c11+3*c12*T)+c13/T)
+        T=T-dT
+        if not np.nanmax(np.abs(dT),initial=0)>=hw_tolerance: break
+    return T-273.15
+
+
+# IAPWS-IF97 region 4 (saturation line of the industrial formulation 1997)
+# ================================
+# saturation equation: beta^2*theta^2 + n1*beta^2*theta + n2*beta^2 + n3*beta*theta^2 + n4*beta*theta
+#     + n5*beta + n6*theta^2 + n7*theta + n8 = 0; beta=(p/1 MPa)^0.25, theta=T/1 K + n9/(T/1 K - n10)
+if97_n=(0.11670521452767e4,-0.72421316703206e6,-0.17073846940092e2,0.12020824702470e5,\
+    -0.32325550322333e7,0.14915108613530e2,-0.48232657361591e4,0.40511340542057e6,\
+    -0.23855557567849,0.65017534844798e3)
+
+# iapwsPressure() returns saturated pressure in MPa at T(K) (IF97 equation 30); T and the
+# result may be floats or arrays
+def iapwsPressure(T):
+    (n1,n2,n3,n4,n5,n6,n7,n8,n9,n10)=if97_n
+    theta=T+n9/(T-n10)
+    A=theta*theta+n1*theta+n2; B=n3*theta*theta+n4*theta+n5; C=n6*theta*theta+n7*theta+n8
+    return (2*C/(-B+(B*B-4*A*C)**0.5))**4
+
+
+# iapwsTemperature() returns saturated temperature in K at p(MPa) (IF97 equation 31); p and
+# the result may be floats or arrays
+def iapwsTemperature(p):
+    (n1,n2,n3,n4,n5,n6,n7,n8,n9,n10)=if97_n
+    beta=p**0.25
+    E=beta*beta+n3*beta+n6; F=n1*beta*beta+n4*beta+n7; G=n2*beta*beta+n5*beta+n8
+    D=2*G/(-F-(F*F-4*E*G)**0.5)
+    return (n10+D-((n10+D)**2-4*(n9+n10*D))**0.5)/2
+
+
+# iapwsVaporPressure() returns saturated vapor pressure in mmHg at t(C) by IAPWS-IF97;
+# returns None outside 0-150 C
+def iapwsVaporPressure(t):
+    if not (t>=0 and t<=150): return None
+    return iapwsPressure(t+273.15)*1e6/mmHg_pascal
+
+
+# iapwsSatTemperature() returns saturated temperature in C at the vapor pressure p(mHg)
+# by IAPWS-IF97 backward equation; returns None out of range
+def iapwsSatTemperature(p):
+    if not (p>0 and p<=iapws_p_high): return None
+    return iapwsTemperature(p*1000*mmHg_pascal*1e-6)-273.15
+
+
+# iapwsVaporPressureArray() is the array version of iapwsVaporPressure(); NaN out of range
+def iapwsVaporPressureArray(t):
+    return iapwsPressure(np.where((t>=0)&(t<=150),t,np.nan)+273.15)*1e6/mmHg_pascal
+
+
+# iapwsSatTemperatureArray() is the array version of iapwsSatTemperature(); NaN out of range
+def iapwsSatTemperatureArray(p):
+    return iapwsTemperature(np.where((p>0)&(p<=iapws_p_high),p,np.nan)*1000*mmHg_pascal*1e-6)-273.15
+
+
+# Blended Antoine equation
+# ================================
+# The two branches of Antoine equation (see antoineVaporPressure() in psychro_functions) do
+# not meet at 60 C: the vapor pressure steps down by 0.0145% (0.022 mmHg). In the blended
+# mode lg(P) of the branches is mixed by the smoothstep s(x)=3x^2-2x^3 over 55-65 C:
+#     lg(P) = (1-s)*lg(P lower) + s*lg(P upper), x=(t-55)/10
+# so lg(P) and its slope are continuous (C1); outside 55-65 C it is Antoine equation
+blend_low=55.0; blend_high=65.0
+blend_iterations=20
+blend_tolerance=1e-5
+
+# blendedLog() returns (lg(P in mmHg), d lg(P)/dt) of the blended Antoine equation at t(C)
+# in the blending interval; t may be a float or an array
+def blendedLog(t):
+    x=(t-blend_low)/(blend_high-blend_low)
+    s=x*x*(3-2*x); ds=6*x*(1-x)/(blend_high-blend_low)
+    lower=8.10765-(1750.286/(t+235)); upper=7.96681-(1668.21/(t+228.0))
+    dlower=1750.286/((t+235)*(t+235)); dupper=1668.21/((t+228.0)*(t+228.0))
+    return (lower+s*(upper-lower),dlower+s*(dupper-dlower)+ds*(upper-lower))
+
+
+# blendedVaporPressure() returns saturated vapor pressure in mmHg at t(C) by the blended
+# Antoine equation; returns None outside 0-150 C
+def blendedVaporPressure(t):
+    if t>=0 and t<blend_low: return 10**(8.10765-(1750.286/(t+235)))
+    elif t>=blend_low and t<=blend_high: return 10**blendedLog(t)[0]
+    elif t>blend_high and t<=150: return 10**(7.96681-(1668.21/(t+228.0)))
+    return None
+
+
+# blendedTemperature() returns saturated temperature in C at the vapor pressure p(mHg) by the
+# blended Antoine equation; in the blending interval by Newton iteration started from the
+# lower branch; returns None out of range
+def blendedTemperature(p):
+    if p>0 and p<blend_p_low: return (1750.286/(8.10765-math.log10(p*1000)))-235.0
+    elif p>=blend_p_low and p<=blend_p_high:
+        y=math.log10(p*1000)
+        t=(1750.286/(8.10765-y))-235.0
+        for k in range(blend_iterations):
+            (f,df)=blendedLog(t); dt=(f-y)/df
+            t-=dt
+            if abs(dt)<blend_tolerance: break
+        return t
+    elif p>blend_p_high and p<=3.577306: return (1668.21/(7.96681-math.log10(p*1000)))-228.0
+    return None
+
+
+# blendedVaporPressureArray() is the array version of blendedVaporPressure(); NaN out of range
+def blendedVaporPressureArray(t):
+    p=np.full(t.shape,np.nan)
+    lower=(t>=0)&(t<blend_low); middle=(t>=blend_low)&(t<=blend_high); upper=(t>blend_high)&(t<=150)
+    p[lower]=10**(8.10765-(1750.286/(t[lower]+235)))
+    p[middle]=10**blendedLog(t[middle])[0]
+    p[upper]=10**(7.96681-(1668.21/(t[upper]+228.0)))
+    return p
+
+
+# blendedTemperatureArray() is the array version of blendedTemperature(); the values in the
+# blending interval are iterated together; NaN out of range
+def blendedTemperatureArray(p):
+    t=np.full(p.shape,np.nan)
+    lower=(p>0)&(p<blend_p_low); middle=(p>=blend_p_low)&(p<=blend_p_high); upper=(p>blend_p_high)&(p<=3.577306)
+    t[lower]=(1750.286/(8.10765-np.log10(p[lower]*1000)))-235.0
+    t[upper]=(1668.21/(7.96681-np.log10(p[upper]*1000)))-228.0
+    if middle.any():
+        y=np.log10(p[middle]*1000)
+        tm=(1750.286/(8.10765-y))-235.0
+        for k in range(blend_iterations):
+            (f,df)=blendedLog(tm); dt=(f-y)/df
+            tm=tm-dt
+            if not np.max(np.abs(dt))>=blend_tolerance: break
+        t[middle]=tm
+    return t
+
+
+# upper limits in mHg of the inverse functions: vapor pressure at 150 C
+magnus_p_high=magnusVaporPressure(150)*0.001
+hw_p_high=hylandWexlerVaporPressure(150)*0.001
+iapws_p_high=iapwsVaporPressure(150)*0.001
+# vapor pressures in mHg at the ends of the blending interval of the blended Antoine equation
+blend_p_low=blendedVaporPressure(blend_low)*0.001
+blend_p_high=blendedVaporPressure(blend_high)*0.001
+
+
+# This SaturationCorrelation class holds the four functions of one correlation with
+# the names of saturation_table module, so both are used as saturation backends alike:
+# vaporPressure(t C) -> mmHg, temperature(p mHg) -> C and their array versions
+class SaturationCorrelation:
+
+    def __init__(self,name='',vaporPressure=None,temperature=None,vaporPressureArray=None,temperatureArray=None):
+        self.name=name
+        self.vaporPressure=vaporPressure; self.temperature=temperature
+        self.vaporPressureArray=vaporPressureArray; self.temperatureArray=temperatureArray
+
+    def __repr__(self):
+        return 'SaturationCorrelation('+self.name+')'
+
+
+correlations={
+    'magnus':SaturationCorrelation('magnus',magnusVaporPressure,magnusTemperature,\
+        magnusVaporPressureArray,magnusTemperatureArray),
+    'hyland-wexler':SaturationCorrelation('hyland-wexler',hylandWexlerVaporPressure,hylandWexlerTemperature,\
+        hylandWexlerVaporPressureArray,hylandWexlerTemperatureArray),
+    'iapws':SaturationCorrelation('iapws',iapwsVaporPressure,iapwsSatTemperature,\
+        iapwsVaporPressureArray,iapwsSatTemperatureArray),
+    'antoine-blended':SaturationCorrelation('antoine-blended',blendedVaporPressure,blendedTemperature,\
+        blendedVaporPressureArray,blendedTemperatureArray)}
@@ -0,0 +1,187 @@
+'''
+Module Name:'saturation_table'
+Path:'<package_root>/src/saturation_table.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, saturation_table.py builds the dense saturation table of \
+    pure water (0-150 C at 0.01 C steps) from Antoine equation once and interpolates \
+    it by monotone cubic (Fritsch-Carlson, PCHIP) interpolation. It is the table \
+    backend of satVaporPressure() and satTemperature(); see setSaturationBackend() \
+    in psychro_functions. Each Antoine branch (0-60 C and 60-150 C) has its own \
+    table, so the step of Antoine equation at 60 C is kept as it is. The interval of \
+    a temperature is found by its 0.01 C step and the interval of a pressure by a \
+    uniform grid of ln(p), without a search. The look up still costs more than \
+    Antoine equation itself (one power or logarithm), so the table is no speedup; \
+    benchmarks/saturation_backends.py measures both.'
+Maximum Error: (against Antoine equation; checked by maxError() at 0.0001 C steps)
+    Saturated vapor pressure: relative error < 2e-11
+    Saturated temperature: absolute error < 1e-9 C
+Dependency: numpy, math, psychro.src.psychro_functions, psychro.src.psychro_arrays
+'''
+from __future__ import division
+import math
+import numpy as np
+import psychro.src.psychro_functions as psyf
+import psychro.src.psychro_arrays as psya
+
+__version__='1.0.0.2026.10.18'
+version='1.0.0.2026.10.18'
+
+# table step in degree C
+step=0.01
+
+
+# pchipSlopes() returns the monotone (Fritsch-Carlson) derivatives of the table y(x)
+def pchipSlopes(x, y):
+    h=np.diff(x); delta=np.diff(y)/h
+    d=np.zeros(x.size)
+    # weighted harmonic mean of the neighbouring secants; zero at a local extremum
+    w1=2*h[1:]+h[:-1]; w2=h[1:]+2*h[:-1]
+    same=delta[:-1]*delta[1:]>0
+    d[1:-1][same]=(w1[same]+w2[same])/(w1[same]/delta[:-1][same]+w2[same]/delta[1:][same])
+    # one-sided three point end slopes, limited to keep the ends monotone
+    for (k,h0,h1,d0,d1) in ((0,h[0],h[1],delta[0],delta[1]),(-1,h[-1],h[-2],delta[-1],delta[-2])):
+        s=((2*h0+h1)*d0-h0*d1)/(h0+h1)
+        if s*d0<=0: s=0
+        elif d0*d1<=0 and abs(s)>abs(3*d0): s=3*d0
+        d[k]=s
+    return d
+
+
+# This SaturationBranch class holds the forward (T -> P) and inverse (P -> T) tables of
+# one Antoine branch between the celcius temperatures t_low and t_high; P is in mHg
+# Every interval keeps the coefficients of its cubic in s=(x-x0)/h:
+#     y = c0 + s*(c1 + s*(c2 + s*c3))
+class SaturationBranch:
+
+    def __init__(self,t_low=0,t_high=60,pressure_fn=None):
+        n=int(round((t_high-t_low)/step))+1
+        self.t_low=t_low; self.t_high=t_high; self.n=n
+        self.t=t_low+step*np.arange(n); self.t[-1]=t_high
+        self.p=pressure_fn(self.t)*0.001
+        self.p_low=float(self.p[0]); self.p_high=float(self.p[-1])
+        self.forward=coefficients(self.t,self.p,pchipSlopes(self.t,self.p))
+        self.inverse=coefficients(self.p,self.t,pchipSlopes(self.p,self.t))
+        # python lists are faster than numpy arrays for scalar look up
+        self.forward_list=np.column_stack(self.forward).tolist()
+        self.inverse_list=np.column_stack(self.inverse).tolist()
+        self.p_list=self.p.tolist()
+        self.makePressureCells()
+
+    # pressureIndex() returns the table intervals of pressures (mHg) in the branch by the
+    # uniform cells of ln(p), half as wide as the narrowest interval, so that the interval
+    # is the interval at the lower cell edge or the next one (same as bisect_right()-1)
+    def pressureIndex(self,p):
+        j=np.clip(((np.log(p)-self.u_low)*self.u_scale).astype(np.int64),0,self.cell_index.size-1)
+        i=self.cell_index[j]
+        i+=p>=self.p[i+1]
+        return np.minimum(i,self.n-2)
+
+    # makePressureCells() builds the cells of pressureIndex()
+    def makePressureCells(self):
+        u=np.log(self.p)
+        self.u_low=float(u[0]); self.u_scale=float(2/np.min(np.diff(u)))
+        edges=self.u_low+(np.arange(int((u[-1]-self.u_low)*self.u_scale)+2)-0.5)/self.u_scale
+        self.cell_index=np.clip(np.searchsorted(self.p,np.exp(edges),side='right')-1,0,self.n-2)
+        self.cell_list=self.cell_index.tolist()
+
+
+# coefficients() returns (x0, 1/h, c0, c1, c2, c3) arrays of the cubic Hermite polynomials
+# of the intervals of the table y(x) with the derivatives d
+def coefficients(x, y, d):
+    h=np.diff(x); dy=np.diff(y); d0=h*d[:-1]; d1=h*d[1:]
+    return (x[:-1],1/h,y[:-1],d0,3*dy-2*d0-d1,d0+d1-2*dy)
+
+
+# Antoine branches in mmHg; same equations as antoineVaporPressure()
+def lowerBranch(t): return 10**(8.10765-(1750.286/(t+235)))
+
+def upperBranch(t): return 10**(7.96681-(1668.21/(t+228.0)))
+
+lower=SaturationBranch(0,60,lowerBranch)
+upper=SaturationBranch(60,150,upperBranch)
+
+
+# the scalar functions look up the interval lists of the branches directly (no method
+# call); the array functions gather the coefficients of both branches from one table
+(lower_forward,upper_forward)=(lower.forward_list,upper.forward_list)
+forward_table=np.vstack([np.column_stack(lower.forward),np.column_stack(upper.forward)]).T.copy()
+inverse_table=np.vstack([np.column_stack(lower.inverse),np.column_stack(upper.inverse)]).T.copy()
+
+
+# vaporPressure() returns saturated vapor pressure in mmHg of a celcius value from the
+# table; returns None outside 0-150 C as antoineVaporPressure()
+def vaporPressure(t):
+    if t>=0 and t<60:
+        i=int(t*100)
+        if i>5999: i=5999
+        (x0,r,c0,c1,c2,c3)=lower_forward[i]
+    elif t>=60 and t<=150:
+        i=int((t-60)*100)
+        if i>8999: i=8999
+        (x0,r,c0,c1,c2,c3)=upper_forward[i]
+    else: return None
+    s=(t-x0)*r
+    return (c0+s*(c1+s*(c2+s*c3)))*1000
+
+
+# temperature() returns saturated temperature in C of a vapor pressure in mHg from the
+# table; pressures of the branches outside the table (below 0 C) use Antoine equation
+def temperature(p):
+    if p>0 and p<0.149444: branch=lower
+    elif p>=0.149444 and p<=3.577306: branch=upper
+    else: return None
+    if p<branch.p_low or p>branch.p_high: return psyf.antoineTemperature(p)
+    # interval by the cell of ln(p) as pressureIndex()
+    i=branch.cell_list[int((math.log(p)-branch.u_low)*branch.u_scale)]
+    if p>=branch.p_list[i+1] and i<branch.n-2: i+=1
+    (x0,r,c0,c1,c2,c3)=branch.inverse_list[i]; s=(p-x0)*r
+    return c0+s*(c1+s*(c2+s*c3))
+
+
+# polynomial() evaluates the interval polynomials of the rows i of a coefficient table at x
+def polynomial(x, i, table):
+    (x0,r,c0,c1,c2,c3)=[np.take(c,i) for c in table]; s=(x-x0)*r
+    return c0+s*(c1+s*(c2+s*c3))
+
+
+# vaporPressureArray() returns saturated vapor pressures in mmHg of celcius values;
+# NaN outside 0-150 C as antoineVaporPressureArray()
+def vaporPressureArray(t):
+    up=t>=60
+    with np.errstate(invalid='ignore'):
+        i=(np.where(up,t-60,t)*100).astype(np.int64)
+    i=np.where(up,np.clip(i,0,upper.n-2)+(lower.n-1),np.clip(i,0,lower.n-2))
+    p=polynomial(t,i,forward_table)*1000
+    return np.where((t>=0)&(t<=150),p,np.nan)
+
+
+# temperatureArray() returns saturated temperatures in C of vapor pressures in mHg;
+# NaN out of range as antoineTemperatureArray()
+def temperatureArray(p):
+    up=p>=0.149444
+    low=(p>=lower.p_low)&(p<=lower.p_high)&~up
+    high=(p>=upper.p_low)&(p<=upper.p_high)&up
+    inTable=low|high
+    i=np.zeros(p.shape,np.int64)
+    i[low]=lower.pressureIndex(p[low]); i[high]=upper.pressureIndex(p[high])+(lower.n-1)
+    t=polynomial(p,i,inverse_table)
+    if inTable.all(): return t
+    rest=~inTable
+    t[rest]=psya.antoineTemperatureArray(p[rest])
+    return t
+
+
+# maxError() returns the maximum (relative pressure error, absolute temperature error in C)
+# of the table against Antoine equation at n temperatures between 0 and 150 C
+def maxError(n=1500001):
+    t=np.linspace(0,150,n)
+    exact=psya.antoineVaporPressureArray(t); table=vaporPressureArray(t)
+    pressure_error=np.max(np.abs(table-exact)/exact)
+    p=exact*0.001
+    exact_t=psya.antoineTemperatureArray(p); table_t=temperatureArray(p)
+    temperature_error=np.max(np.abs(table_t-exact_t))
+    return (float(pressure_error),float(temperature_error))
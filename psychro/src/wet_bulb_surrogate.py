@@ -0,0 +1,229 @@
+'''
+Module Name:'wet_bulb_surrogate'
+Path:'<package_root>/src/wet_bulb_surrogate.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, wet_bulb_surrogate.py fits the wet bulb temperature of one site \
+    pressure as a piecewise two dimensional Chebyshev polynomial of dry bulb temperature \
+    and relative humidity, so a wet bulb temperature costs a polynomial evaluation instead \
+    of the iterative solve of wetBulbTemperatureArray(). The domain is split in a grid of \
+    patches; each patch interpolates the exact wet bulb temperature (solved to 1e-12 C) at \
+    the tensor Chebyshev nodes and is checked against the exact solution on a finer grid \
+    with its edges. A patch whose error is above the tolerance or which has invalid \
+    states (wet bulb temperature below 0 C) is not used: its states, the states outside \
+    the domain, saturated air (rh=100) and every state while another saturation backend \
+    is selected are solved by the exact solver. The step of Antoine equation at 60 C gives \
+    the exact wet bulb temperature a step of about 0.003 C, so the patches crossed by the \
+    60 C wet bulb line are solved exactly as well. A surrogate is saved to and loaded \
+    from a NumPy .npz file.'
+Dependency: numpy, psychro.src.psychro_functions, psychro.src.psychro_arrays, psychro.src.fast_functions
+'''
+from __future__ import division
+import numpy as np
+from numpy.polynomial import chebyshev
+import psychro.src.psychro_functions as psyf
+import psychro.src.psychro_arrays as psya
+import psychro.src.fast_functions as fastf
+
+__version__='1.0.0.2026.10.18'
+version='1.0.0.2026.10.18'
+
+# bracket width (C) of the exact wet bulb temperatures of the fit and of the check
+fit_tolerance=1e-12
+
+
+# exactWetBulb() returns the wet bulb temperatures (C) of the celcius and relative humidity
+# arrays at pressure p(Pa) by the constant wet bulb temperature line of wetBulbSolve(); the
+# line is also solved at rh=100, so the surface is smooth up to the edge of the domain
+def exactWetBulb(t, rh, p):
+    pa=np.full(t.shape,float(p))
+    (x0,valid)=psya.massFractionArray(t,rh,pa)
+    return psya.wetBulbSolve(t,np.zeros(t.shape),pa,x0,valid,fit_tolerance,200)[0]
+
+
+# chebyshevNodes() returns the n Chebyshev nodes (first kind) in -1..1 in increasing order
+def chebyshevNodes(n):
+    return np.cos(np.pi*(np.arange(n)+0.5)/n)[::-1]
+
+
+# powerMatrix() returns the matrix which changes Chebyshev coefficients to power coefficients
+def powerMatrix(n):
+    return np.column_stack([chebyshev.cheb2poly(np.eye(n)[k]).tolist()+[0.0]*(n-k-1) for k in range(n)])
+
+
+# This WetBulbSurrogate class holds the patches of the wet bulb temperature of one pressure
+# pressure: Pa; temperature, relHumidity: (low, high) of the domain in C and %;
+# patches: (patches of temperature, patches of relative humidity); degree: of each variable;
+# tol: largest error (C) of a used patch against the exact solution
+class WetBulbSurrogate:
+
+    def __init__(self,pressure=101325,temperature=(0.0,100.0),relHumidity=(0.0,100.0),patches=(80,40),degree=5,tol=1e-5):
+        self.pressure=float(pressure); self.temperature=(float(temperature[0]),float(temperature[1]))
+        self.relHumidity=(float(relHumidity[0]),float(relHumidity[1]))
+        self.patches=(int(patches[0]),int(patches[1])); self.degree=int(degree); self.tol=float(tol)
+        self.backend=psyf.getSaturationBackend()
+        if not (self.pressure>0 and self.temperature[0]<self.temperature[1] and self.relHumidity[0]<self.relHumidity[1]):
+            raise ValueError("Invalid pressure or domain of the wet bulb surrogate")
+        if self.temperature[0]<0 or self.temperature[1]>150 or self.relHumidity[0]<0 or self.relHumidity[1]>100:
+            raise ValueError("Domain of the wet bulb surrogate is out of range (0-150 C, 0-100 %)")
+        self.fit()
+
+    # fit() interpolates every patch at the Chebyshev nodes and checks it on a grid of
+    # 2*degree+2 points of each variable with the edges of the patch
+    def fit(self):
+        (nt,nr)=self.patches; n=self.degree+1
+        (tEdges,rEdges)=self.edges()
+        x=chebyshevNodes(n)
+        (T,R)=self.patchGrid(tEdges,rEdges,x)
+        Z=exactWetBulb(T,R,self.pressure)
+        inverse=np.linalg.inv(chebyshev.chebvander(x,n-1))
+        # coefficients (nt, nr, n, n): inverse @ values @ inverse.T of every patch
+        self.coefficients=np.einsum('ai,pibj,cj->pbac',inverse,Z,inverse)
+        xc=np.linspace(-1,1,2*n)
+        (T,R)=self.patchGrid(tEdges,rEdges,xc)
+        Z=exactWetBulb(T,R,self.pressure)
+        U=chebyshev.chebvander(xc,n-1)
+        approximation=np.einsum('ia,pbac,jc->pibj',U,self.coefficients,U)
+        error=np.abs(approximation-Z).max(axis=(1,3))
+        self.error=np.where(np.isnan(error),np.inf,error)
+        self.setup()
+
+    # setup() makes the evaluation tables of the coefficients and of the used patches
+    def setup(self):
+        M=powerMatrix(self.degree+1)
+        self.used=self.error<=self.tol
+        self.power=np.einsum('ai,pbij,cj->pbac',M,self.coefficients,M)
+        self.__power=self.power.tolist(); self.__used=self.used.tolist()
+        # (patch, power of v, power of u) for the array evaluation
+        self.__flat=np.ascontiguousarray(self.power.transpose(0,1,3,2)).reshape(-1,self.degree+1,self.degree+1)
+        (t0,t1)=self.temperature; (r0,r1)=self.relHumidity
+        self.__steps=((t1-t0)/self.patches[0],(r1-r0)/self.patches[1])
+
+    # edges() returns the patch edges of temperature and of relative humidity
+    def edges(self):
+        return (np.linspace(self.temperature[0],self.temperature[1],self.patches[0]+1),\
+            np.linspace(self.relHumidity[0],self.relHumidity[1],self.patches[1]+1))
+
+    # patchGrid() returns the (temperature, relative humidity) arrays (nt, m, nr, m) of the
+    # local points x (-1..1) of every patch
+    def patchGrid(self, tEdges, rEdges, x):
+        t=tEdges[:-1,None]+(x[None,:]+1)/2*np.diff(tEdges)[:,None]
+        r=rEdges[:-1,None]+(x[None,:]+1)/2*np.diff(rEdges)[:,None]
+        return np.broadcast_arrays(t[:,:,None,None],r[None,None,:,:])
+
+    # maxError() returns the largest checked error (C) of the used patches
+    def maxError(self):
+        return float(self.error[self.used].max()) if self.used.any() else 0.0
+
+    # coverage() returns the fraction of the domain covered by the used patches
+    def coverage(self):
+        return float(self.used.mean())
+
+    # info() returns the settings and the fit summary as a dict
+    def info(self):
+        return {'pressure':self.pressure,'temperature':self.temperature,'relHumidity':self.relHumidity,\
+            'patches':self.patches,'degree':self.degree,'tol':self.tol,'backend':self.backend,\
+            'maxError':self.maxError(),'coverage':self.coverage()}
+
+    # wetBulbTemperature() returns wet bulb temperature in C at t(C) and rh(%); plain floats
+    # as psychro.fast; states not covered are solved by fast wetBulbTemperature()
+    def wetBulbTemperature(self, t, rh):
+        (t0,t1)=self.temperature; (r0,r1)=self.relHumidity
+        if t>=t0 and t<=t1 and rh>=r0 and rh<=r1 and rh<100 and psyf.getSaturationBackend()==self.backend:
+            (dt,dr)=self.__steps
+            i=min(int((t-t0)/dt),self.patches[0]-1); j=min(int((rh-r0)/dr),self.patches[1]-1)
+            if self.__used[i][j]:
+                u=2*(t-t0-i*dt)/dt-1; v=2*(rh-r0-j*dr)/dr-1
+                value=0.0
+                for row in reversed(self.__power[i][j]):
+                    s=0.0
+                    for c in reversed(row): s=s*v+c
+                    value=value*u+s
+                return value
+        return fastf.wetBulbTemperature(t,rh,self.pressure)
+
+    # wetBulbTemperatureArray() returns (wet bulb temperature array in C, validity mask) of
+    # arrays of dry bulb temperature(C) and relative humidity(%); the states not covered
+    # are solved by wetBulbTemperatureArray() of psychro_arrays
+    def wetBulbTemperatureArray(self, temperature=None, relHumidity=None):
+        (t,rh)=np.broadcast_arrays(np.asarray(temperature,dtype=float),np.asarray(relHumidity,dtype=float))
+        (t0,t1)=self.temperature; (r0,r1)=self.relHumidity; (dt,dr)=self.__steps
+        twb=np.full(t.shape,np.nan); valid=np.zeros(t.shape,dtype=bool)
+        inside=(t>=t0)&(t<=t1)&(rh>=r0)&(rh<=r1)&(rh<100)
+        if psyf.getSaturationBackend()!=self.backend: inside[...]=False
+        i=np.clip(np.nan_to_num((t-t0)/dt),0,self.patches[0]-1).astype(np.int64)
+        j=np.clip(np.nan_to_num((rh-r0)/dr),0,self.patches[1]-1).astype(np.int64)
+        inside&=self.used[i,j]
+        if inside.any():
+            (ii,jj)=(i[inside],j[inside])
+            u=2*(t[inside]-t0-ii*dt)/dt-1; v=2*(rh[inside]-r0-jj*dr)/dr-1
+            # Horner in v of the coefficients of every power of u, then in u
+            c=np.take(self.__flat,ii*self.patches[1]+jj,axis=0)
+            rows=c[:,-1].copy(); v=v[:,None]
+            for b in range(self.degree-1,-1,-1): rows*=v; rows+=c[:,b]
+            value=rows[:,-1].copy()
+            for a in range(self.degree-1,-1,-1): value*=u; value+=rows[:,a]
+            twb[inside]=value; valid[inside]=True
+        rest=~inside
+        if rest.any():
+            (values,iterations,solved)=psya.wetBulbTemperatureArray(t[rest],rh[rest],self.pressure)
+            twb[rest]=values; valid[rest]=solved
+        return (twb,valid)
+
+    # save() writes the surrogate to the .npz file path
+    def save(self, path):
+        np.savez(path,version=np.array(version),pressure=self.pressure,temperature=np.array(self.temperature),\
+            relHumidity=np.array(self.relHumidity),patches=np.array(self.patches),degree=self.degree,tol=self.tol,\
+            backend=np.array(self.backend),coefficients=self.coefficients,error=self.error)
+
+    def __repr__(self):
+        return 'WetBulbSurrogate(pressure={0:g} Pa, {1:d}x{2:d} patches, degree {3:d}, max error {4:.2e} C, coverage {5:.1%})'.format(\
+            self.pressure,self.patches[0],self.patches[1],self.degree,self.maxError(),self.coverage())
+
+
+# loadSurrogate() returns the WetBulbSurrogate saved in the .npz file path
+def loadSurrogate(path):
+    with np.load(path,allow_pickle=False) as data:
+        surrogate=WetBulbSurrogate.__new__(WetBulbSurrogate)
+        surrogate.pressure=float(data['pressure']); surrogate.temperature=tuple(float(v) for v in data['temperature'])
+        surrogate.relHumidity=tuple(float(v) for v in data['relHumidity'])
+        surrogate.patches=tuple(int(v) for v in data['patches']); surrogate.degree=int(data['degree'])
+        surrogate.tol=float(data['tol']); surrogate.backend=str(data['backend'])
+        surrogate.coefficients=data['coefficients']; surrogate.error=data['error']
+    surrogate.setup()
+    return surrogate
+
+
+# surrogates fitted or loaded by wetBulbSurrogate(): (pressure, backend, settings) -> surrogate
+surrogates={}
+
+
+# wetBulbSurrogate() returns the WetBulbSurrogate of the pressure(Pa) and settings of the
+# current saturation backend; it is fitted once and kept in memory. When path (.npz file)
+# is given, a saved surrogate of the same settings is loaded from it, otherwise the fitted
+# surrogate is saved to it
+def wetBulbSurrogate(pressure=101325, path=None, temperature=(0.0,100.0), relHumidity=(0.0,100.0), patches=(80,40), \
+    degree=5, tol=1e-5):
+    key=(float(pressure),psyf.getSaturationBackend(),tuple(float(v) for v in temperature),\
+        tuple(float(v) for v in relHumidity),tuple(int(v) for v in patches),int(degree),float(tol))
+    surrogate=surrogates.get(key)
+    if surrogate is not None: return surrogate
+    if path is not None:
+        try:
+            surrogate=loadSurrogate(path)
+            if (surrogate.pressure,surrogate.backend,surrogate.temperature,surrogate.relHumidity,\
+                surrogate.patches,surrogate.degree,surrogate.tol)!=key: surrogate=None
+        except (OSError,KeyError,ValueError): surrogate=None
+    if surrogate is None:
+        surrogate=WetBulbSurrogate(pressure,temperature,relHumidity,patches,degree,tol)
+        if path is not None: surrogate.save(path)
+    surrogates[key]=surrogate
+    return surrogate
+
+
+# clearSurrogates() empties the surrogates kept in memory
+def clearSurrogates():
+    surrogates.clear()
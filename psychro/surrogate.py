@@ -0,0 +1,48 @@
+'''
+Module Name:'surrogate'
+Path:'<package_root>/surrogate.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd'
+Last Update:2026/10/18
+Description:"This module, surrogate.py is the gateway module of the wet bulb temperature \
+    surrogates of the package 'psychro'. A surrogate is fitted once for a site pressure as \
+    piecewise Chebyshev polynomials of dry bulb temperature and relative humidity with a \
+    checked error bound, kept in memory and saved to disk; the states outside its domain \
+    are solved by the exact solver. "
+Usage:
+    >>> import psychro.surrogate as sur
+    >>> s=sur.wetBulbSurrogate(95000, path='site_95000.npz')
+    >>> s.wetBulbTemperature(25, 50)
+    >>> (twb, valid)=s.wetBulbTemperatureArray(t, rh)
+'''
+# import necessary modules
+from __future__ import division
+import psychro.src.wet_bulb_surrogate as wbs
+
+# Module version
+__version__='1.0.0.2026.10.18'
+version='1.0.0.2026.10.18'
+
+# WetBulbSurrogate(pressure=101325, temperature=(0,100), relHumidity=(0,100), patches=(80,40),
+# degree=5, tol=1e-5) fits the surrogate of the pressure(Pa) over the domain (C, %)
+WetBulbSurrogate=wbs.WetBulbSurrogate
+
+
+# wetBulbSurrogate() returns the surrogate of the pressure(Pa) of the current saturation
+# backend; it is fitted once and kept in memory. With path (.npz file) the surrogate is
+# loaded from the file when it has the same settings, otherwise it is fitted and saved
+def wetBulbSurrogate(pressure=101325, path=None, temperature=(0.0,100.0), relHumidity=(0.0,100.0), \
+    patches=(80,40), degree=5, tol=1e-5):
+    return wbs.wetBulbSurrogate(pressure, path, temperature, relHumidity, patches, degree, tol)
+
+
+# loadSurrogate() returns the surrogate saved in the .npz file path by WetBulbSurrogate.save()
+def loadSurrogate(path):
+    return wbs.loadSurrogate(path)
+
+
+# clearSurrogates() empties the surrogates kept in memory by wetBulbSurrogate()
+def clearSurrogates():
+    wbs.clearSurrogates()
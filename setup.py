@@ -24,7 +24,16 @@ setup(
   packages=find_packages(),
   include_package_data=True,
   py_modules=['psychro.__init__','psychro.lib','psychro.src.Prefix','psychro.src.Unit',\
-'psychro.src.Pressure', 'psychro.src.Temperature','psychro.src.psychro_functions'],
+'psychro.src.Pressure', 'psychro.src.Temperature','psychro.src.psychro_functions',\
+'psychro.src.psychro_arrays','psychro.src.PsychroState',\
+'psychro.src.saturation_table','psychro.src.saturation_correlations','psychro.fast','psychro.src.fast_functions',\
+'psychro.src.TemperatureArray','psychro.src.PressureArray','psychro.__main__',\
+'psychro.src.batch_csv','psychro.parallel','psychro.src.parallel_states',\
+'psychro.src.error_policy','psychro.chart','psychro.src.chart_curves','psychro.src.inverse_state',\
+'psychro.src.profiler','psychro.surrogate','psychro.src.wet_bulb_surrogate',\
+'psychro.dataframe','psychro.src.dataframe_accessor'],
+  install_requires=['numpy'],
+  extras_require={'pandas':['pandas']},
   data_files = [("", ["LICENSE"])],
   zip_safe=True
 )
@@ -0,0 +1,13 @@
+'''
+Module Name:'conftest'
+Path:'<package_root>/test/conftest.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, conftest.py configures pytest for the tests in test/: the transcript \
+    test_psychro_functions.txt of an interactive session of the first version (module \
+    names of that version) is kept as a record and not collected as a doctest.'
+'''
+collect_ignore=['test_psychro_functions.txt']
@@ -0,0 +1,58 @@
+'''
+Module Name:'test_antoine_blended'
+Path:'<package_root>/test/test_antoine_blended.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, test_antoine_blended.py checks the saturation backend \
+    antoine-blended: it equals Antoine equation outside 55 - 65 C, it has no step at \
+    the branch point 60 C, its inverse gives back the temperature in the blending \
+    interval, and the wet bulb solver does not take more iterations than with antoine.'
+Usage:
+    python -m pytest test
+Dependency: numpy, psychro.lib
+'''
+import numpy as np
+import psychro.lib as lib
+from psychro.lib import Temperature
+
+# temperatures of the blending interval (C)
+blending=np.linspace(55,65,2001)
+
+
+def testEqualAntoineOutside():
+    t=np.concatenate([np.linspace(0,54.99,500),np.linspace(65.01,150,500)])
+    with lib.saturationBackend('antoine'): expected=lib.satVaporPressureArray(t)[0]
+    with lib.saturationBackend('antoine-blended'): p=lib.satVaporPressureArray(t)[0]
+    assert np.array_equal(p,expected)
+
+
+def testNoStepAtBranchPoint():
+    for (backend,larger) in [('antoine',True),('antoine-blended',False)]:
+        with lib.saturationBackend(backend):
+            (below,above)=[lib.satVaporPressure(Temperature(t,'C')).getPascal() for t in (60-1e-7,60+1e-7)]
+        assert (abs(above-below)/below>1e-4)==larger # antoine steps by 0.0145%
+
+
+def testRoundTripOfBlendingInterval():
+    errors={}
+    for backend in ['antoine','antoine-blended']:
+        with lib.saturationBackend(backend), lib.errorPolicy('mask'):
+            (p,valid)=lib.satVaporPressureArray(blending)
+            (back,backValid)=lib.satTemperatureArray(p)
+        assert valid.all() and backValid.all()
+        errors[backend]=np.max(np.abs(back-blending))
+    assert errors['antoine']>1e-3 and errors['antoine-blended']<1e-9
+
+
+def testWetBulbIterationsNearBranchPoint():
+    (t,rh)=np.meshgrid(np.linspace(55,150,96),[10,30,50,70,90,100]); iterations={}
+    for backend in ['antoine','antoine-blended']:
+        with lib.saturationBackend(backend), lib.errorPolicy('mask'):
+            (twb,count,valid)=lib.wetBulbTemperatureArray(t,rh,101325)
+        near=valid&(np.abs(twb-60)<=5)
+        assert near.any()
+        iterations[backend]=count[near].max()
+    assert iterations['antoine-blended']<=iterations['antoine']
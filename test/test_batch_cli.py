@@ -0,0 +1,96 @@
+'''
+Module Name:'test_batch_cli'
+Path:'<package_root>/test/test_batch_cli.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, test_batch_cli.py runs the command python -m psychro batch on \
+    small CSV files and checks the property columns against PsychroState, the rows of \
+    invalid inputs, that the chunk size does not change the output and that every chunk \
+    is written before the next one is read.'
+Usage:
+    python -m pytest test
+Dependency: os, io, csv, math, subprocess, sys, pytest, psychro.lib, psychro.__main__, \
+    psychro.src.batch_csv
+'''
+import os
+import io
+import csv
+import math
+import subprocess
+import sys
+import pytest
+import psychro.lib as lib
+from psychro.__main__ import main
+from psychro.src.batch_csv import processCSV
+from psychro.lib import Temperature, Pressure
+
+package_root=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+rows=[(25.0,50.0,101325.0),(30.0,'abc',101325.0),(40.0,20.0,95000.0),(5.0,90.0,80000.0),(200.0,50.0,101325.0)]
+
+
+# writeInput() writes the rows with the header to path
+def writeInput(path):
+    with open(path,'w',newline='') as f:
+        f.write('temperature,relHumidity,pressure\n'+''.join('{0},{1},{2}\n'.format(*row) for row in rows))
+
+
+# readOutput() returns the rows of an output CSV file as dicts
+def readOutput(path):
+    with open(path,newline='') as f: return list(csv.DictReader(f))
+
+
+def testCommandLine(tmp_path):
+    (inputPath,outputPath)=(str(tmp_path/'in.csv'),str(tmp_path/'out.csv'))
+    writeInput(inputPath)
+    result=subprocess.run([sys.executable,'-m','psychro','batch',inputPath,outputPath,'-p',\
+        'dewPoint,wetBulbTemperature,humidVolume','-e'],cwd=package_root,capture_output=True,text=True)
+    assert result.returncode==0 and result.stderr=='5 rows, 2 invalid rows\n'
+    output=readOutput(outputPath)
+    assert [row['error']!='0' for row in output]==[False,True,False,False,True]
+    for (row,given) in zip(output,rows):
+        if row['error']!='0':
+            assert math.isnan(float(row['dewPoint'])) and math.isnan(float(row['humidVolume'])); continue
+        state=lib.PsychroState(Temperature(given[0],'C'),given[1],Pressure(given[2],'Pa'))
+        assert float(row['dewPoint'])==state.dewPoint().getCelcius()
+        assert float(row['wetBulbTemperature'])==pytest.approx(state.wetBulbTemperature().getCelcius(),abs=1e-9)
+        assert float(row['humidVolume'])==pytest.approx(state.humidVolume()[0],rel=1e-12)
+
+
+def testChunkSizeAndPressureValue(tmp_path):
+    inputPath=str(tmp_path/'in.csv'); writeInput(inputPath)
+    outputs=[]
+    for chunkSize in ['1','2','10000']:
+        outputPath=str(tmp_path/('out'+chunkSize+'.csv'))
+        main(['batch',inputPath,outputPath,'--chunk-size',chunkSize,'--pressure-value','1','--pressure-unit','atm','-q'])
+        with open(outputPath) as f: outputs.append(f.read())
+    assert outputs[0]==outputs[1]==outputs[2]
+    assert readOutput(str(tmp_path/'out1.csv'))[0]['pressure']=='101325.0' # the input column is kept
+
+
+def testUnknownProperty(tmp_path, capsys):
+    inputPath=str(tmp_path/'in.csv'); writeInput(inputPath)
+    with pytest.raises(SystemExit) as exit:
+        main(['batch',inputPath,str(tmp_path/'out.csv'),'-p','dewPoint,colour'])
+    assert exit.value.code==1 and 'colour' in capsys.readouterr().err
+
+
+# This LineSource class gives the lines of an input file and records how many output
+# rows were written when every line was read
+class LineSource:
+    def __init__(self, lines, output):
+        self.lines=lines; self.output=output; self.written=[]
+    def __iter__(self):
+        for line in self.lines:
+            self.written.append(self.output.getvalue().count('\n')); yield line
+
+
+def testChunksAreStreamed():
+    lines=['temperature,relHumidity,pressure\n']+['{0},50,101325\n'.format(10+k*0.1) for k in range(10)]
+    output=io.StringIO(); source=LineSource(lines,output)
+    (count,invalid)=processCSV(source,output,['dewPoint'],chunkSize=3)
+    assert (count,invalid)==(10,0)
+    # before the first row of a chunk is read, the header and the rows of the earlier chunks are written
+    assert [source.written[k] for k in [1,4,7,10]]==[1,4,7,10]
@@ -0,0 +1,88 @@
+'''
+Module Name:'test_chart'
+Path:'<package_root>/test/test_chart.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, test_chart.py checks the curves of chartCurves() against the \
+    scalar functions of psychro.lib: the points of a constant relative humidity, wet bulb \
+    temperature, enthalpy or specific volume curve have that property; and the cache of \
+    the curves per pressure and resolution.'
+Usage:
+    python -m pytest test
+Dependency: numpy, pytest, psychro.lib, psychro.chart
+'''
+import numpy as np
+import pytest
+import psychro.lib as lib
+import psychro.chart as chart
+from psychro.lib import Temperature, Pressure
+
+pressure=95000.0
+
+
+@pytest.fixture(scope='module')
+def curves():
+    return chart.chartCurves(pressure,0.5)
+
+
+# chartPoints() yields (temperature, relative humidity, curve index) of every 7th point of
+# the curves w (curve, temperature) inside the chart
+def chartPoints(t, w):
+    for k in range(w.shape[0]):
+        for j in range(0,len(t),7):
+            if np.isnan(w[k,j]): continue
+            y=w[k,j]/(0.6218+w[k,j])
+            rh=100*y*pressure/lib.satVaporPressure(Temperature(float(t[j]),'C')).getPascal()
+            if 0<rh<=100: yield (float(t[j]),float(rh),k)
+
+
+def testRelHumidity(curves):
+    (t,(rh,w))=(curves['temperature'],curves['relHumidity'])
+    assert w.shape==(len(rh),len(t)) and np.array_equal(w[-1],curves['saturation'])
+    for k in range(len(rh)):
+        expected=[lib.humidityRatio(Temperature(float(ti),'C'),float(rh[k]),Pressure(pressure,'Pa'))[0] for ti in t[::7]]
+        assert np.allclose(w[k,::7],expected,rtol=1e-12,atol=0)
+
+
+def testWetBulb(curves):
+    (twb,w)=curves['wetBulb']; points=0
+    for (t,rh,k) in chartPoints(curves['temperature'],w):
+        twbPoint=lib.wetBulbTemperature(Temperature(t,'C'),rh,Pressure(pressure,'Pa')).getCelcius()
+        assert abs(twbPoint-twb[k])<=1e-5; points+=1
+    assert points>20
+
+
+def testEnthalpy(curves):
+    (h,w,twb)=curves['enthalpy']
+    for k in range(len(h)):
+        assert lib.humidSaturationEnthalpy(Temperature(float(twb[k]),'C'),Pressure(pressure,'Pa'))[0]==pytest.approx(h[k],abs=1e-6)
+    for (t,rh,k) in chartPoints(curves['temperature'],w):
+        assert lib.humidAirEnthalpy(Temperature(t,'C'),rh,Pressure(pressure,'Pa'))[0]==pytest.approx(h[k],abs=1e-4)
+
+
+def testVolume(curves):
+    (v,w)=curves['volume']; points=0
+    for (t,rh,k) in chartPoints(curves['temperature'],w):
+        assert lib.humidVolume(Temperature(t,'C'),rh,Pressure(pressure,'Pa'))[0]==pytest.approx(v[k],rel=1e-12); points+=1
+    assert points>20
+
+
+def testCache():
+    chart.clearChartCache()
+    first=chart.chartCurves(101325,0.2)
+    second=chart.chartCurves(101325.0,0.2)
+    info=chart.chartCacheInfo()
+    assert (info.hits,info.misses)==(1,1) and second['relHumidity'][1] is first['relHumidity'][1]
+    assert not first['temperature'].flags.writeable
+    chart.chartCurves(101325,0.1)
+    assert chart.chartCacheInfo().misses==2
+    chart.clearChartCache()
+    assert chart.chartCacheInfo().currsize==0
+
+
+def testInvalidChart():
+    with pytest.raises(ValueError): chart.chartCurves(-1)
+    with pytest.raises(ValueError): chart.chartCurves(101325,0.1,40,20)
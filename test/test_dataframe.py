@@ -0,0 +1,64 @@
+'''
+Module Name:'test_dataframe'
+Path:'<package_root>/test/test_dataframe.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, test_dataframe.py checks the accessor df.psychro of pandas \
+    DataFrames: the property columns of add() and calculate() against PsychroStateArray, \
+    the units, the pressure of the site, the index, missing values and error codes, and \
+    that the float64 columns are read without copy. It is skipped without pandas.'
+Usage:
+    python -m pytest test
+Dependency: numpy, pytest, pandas, psychro.lib, psychro.dataframe
+'''
+import numpy as np
+import pytest
+import psychro.lib as lib
+pd=pytest.importorskip('pandas')
+import psychro.dataframe
+import psychro.src.dataframe_accessor as dfa
+
+
+# sensorFrame() returns a DataFrame of sensor readings in F and kPa with a missing value
+def sensorFrame():
+    return pd.DataFrame({'tdb':[77.0,86.0,104.0,np.nan,50.0],'rh':[50.0,80.0,20.0,50.0,120.0],\
+        'p':[101.325,95.0,101.325,101.325,101.325],'site':['a','b','c','d','e']},index=[10,20,30,40,50])
+
+
+def testAdd():
+    df=sensorFrame()
+    result=df.psychro.add(['dewPoint','humidAirEnthalpy'],T='tdb',rh='rh',p='p',units={'T':'F','p':'kPa'})
+    assert result is df and list(df.columns)==['tdb','rh','p','site','dewPoint','humidAirEnthalpy']
+    state=lib.PsychroStateArray(df['tdb'].to_numpy(),df['rh'].to_numpy(),df['p'].to_numpy(),'F','kPa')
+    for name in ['dewPoint','humidAirEnthalpy']:
+        expected=getattr(state,name)()[0]
+        assert np.array_equal(df[name].to_numpy(),expected,equal_nan=True)
+    assert df['dewPoint'].isna().tolist()==[False,False,False,True,True]
+
+
+def testCalculate():
+    df=sensorFrame()
+    result=df.psychro.calculate({'wetBulbTemperature':'twb'},T='tdb',rh='rh',p=101325,units={'T':'F'},errorColumn=True)
+    assert list(result.columns)==['twb','error'] and list(result.index)==list(df.index)
+    assert list(df.columns)==['tdb','rh','p','site'] # the frame is not changed
+    (twb,iterations,valid)=lib.wetBulbTemperatureArray(df['tdb'].to_numpy(),df['rh'].to_numpy(),101325,'F')
+    assert np.array_equal(result['twb'].to_numpy(),twb,equal_nan=True)
+    assert result['error'].tolist()==[0,0,0,1,3]
+
+
+def testColumnsWithoutCopy():
+    df=sensorFrame()
+    assert np.shares_memory(dfa.columnValues(df,'tdb'),df['tdb'].to_numpy(copy=False))
+    ints=pd.DataFrame({'t':[20,30],'rh':[50,60]})
+    assert dfa.columnValues(ints,'t').dtype==np.float64
+
+
+def testInvalidArguments():
+    df=sensorFrame()
+    with pytest.raises(ValueError): df.psychro.add(['colour'],T='tdb',rh='rh',p='p')
+    with pytest.raises(ValueError): df.psychro.add(['dewPoint'],T='missing',rh='rh',p='p')
+    with pytest.raises(ValueError): df.psychro.add(['dewPoint'],T='site',rh='rh',p='p')
+    with pytest.raises(ValueError): df.psychro.add(['dewPoint'],T='tdb',rh='rh',p='p',units={'rh':'%'})
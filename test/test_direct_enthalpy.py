@@ -0,0 +1,69 @@
+'''
+Module Name:'test_direct_enthalpy'
+Path:'<package_root>/test/test_direct_enthalpy.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, test_direct_enthalpy.py checks directEnthalpy(): the formula \
+    h = cp_a t + W (h_fg + cp_v t) of the humidity ratio, the equal results of its scalar, \
+    array, fast and PsychroState forms, and the deviation from humidAirEnthalpy() given \
+    in the README.'
+Usage:
+    python -m pytest test
+Dependency: numpy, pytest, psychro.lib, psychro.fast
+'''
+import numpy as np
+import pytest
+import psychro.lib as lib
+import psychro.fast as fast
+from psychro.lib import Temperature, Pressure
+
+atm=Pressure(101325,'Pa')
+# (t (C), RH (%), humidAirEnthalpy(), directEnthalpy()) of the table of the README at 1 atm
+readme_table=[(10,50,20.01,19.60),(25,50,51.13,50.30),(30,80,85.46,85.29),(40,20,65.38,63.90),\
+    (40,70,125.13,126.23),(50,50,152.61,154.86)]
+
+
+@pytest.mark.parametrize('state',[(0.5,10.0),(25.0,50.0),(60.0,30.0),(90.0,100.0)])
+def testFormula(state):
+    (t,rh)=state
+    w=lib.humidityRatio(Temperature(t,'C'),rh,atm)[0]
+    (h,unit)=lib.directEnthalpy(Temperature(t,'C'),rh,atm)
+    assert unit=='kJ/kgDA' and h==pytest.approx(1.006*t+w*(2501+1.86*t),rel=1e-12)
+
+
+def testEqualForms():
+    (t,rh)=([0.5,25.0,40.0,60.0,90.0],[10.0,50.0,70.0,30.0,100.0])
+    (h,valid)=lib.directEnthalpyArray(t,rh,101325)
+    assert valid.all()
+    for (k,(ti,rhi)) in enumerate(zip(t,rh)):
+        expected=lib.directEnthalpy(Temperature(ti,'C'),rhi,atm)[0]
+        assert h[k]==pytest.approx(expected,rel=1e-12)
+        assert fast.directEnthalpy(ti,rhi,101325.0)==pytest.approx(expected,rel=1e-12)
+        assert lib.PsychroState(Temperature(ti,'C'),rhi,atm).directEnthalpy()[0]==pytest.approx(expected,rel=1e-12)
+    assert np.allclose(lib.PsychroStateArray(t,rh,101325).directEnthalpy()[0],h,rtol=1e-12)
+
+
+@pytest.mark.parametrize('row',readme_table)
+def testReadmeDeviation(row):
+    (t,rh,humid,direct)=row
+    assert round(lib.humidAirEnthalpy(Temperature(t,'C'),rh,atm)[0],2)==humid
+    assert round(lib.directEnthalpy(Temperature(t,'C'),rh,atm)[0],2)==direct
+
+
+def testDeviationBound():
+    (t,rh)=np.meshgrid(np.arange(1.0,30.1,1.0),np.arange(5.0,100.1,5.0))
+    with lib.errorPolicy('mask'):
+        state=lib.PsychroStateArray(t,rh,101325)
+        (h,valid)=state.humidAirEnthalpy()
+    difference=(state.directEnthalpy()[0]-h)[valid]
+    assert difference.min()>=-1.5 and difference.max()<=0.4 # 0-30 C of the README
+
+
+def testWithoutWetBulb():
+    with lib.errorPolicy('mask'):
+        assert lib.humidAirEnthalpy(Temperature(5,'C'),5,atm) is None # wet bulb below 0 C
+    w=lib.humidityRatio(Temperature(5,'C'),5,atm)[0]
+    assert lib.directEnthalpy(Temperature(5,'C'),5,atm)[0]==pytest.approx(1.006*5+w*(2501+1.86*5),rel=1e-12)
@@ -0,0 +1,64 @@
+'''
+Module Name:'test_enthalpy_cache'
+Path:'<package_root>/test/test_enthalpy_cache.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, test_enthalpy_cache.py checks the enthalpy caches: a cached \
+    component enthalpy equals the calculated one, a repeated call is a hit, the reference \
+    residual enthalpy is calculated once per pressure, the caches are bounded and \
+    clearEnthalpyCache() resets them.'
+Usage:
+    python -m pytest test
+Dependency: pytest, psychro.lib, psychro.src.psychro_functions
+'''
+import pytest
+import psychro.lib as lib
+import psychro.src.psychro_functions as psyf
+from psychro.lib import Temperature, Pressure
+
+
+@pytest.fixture
+def emptyCache():
+    lib.clearEnthalpyCache()
+    yield
+    lib.clearEnthalpyCache()
+
+
+def testEqualUncached(emptyCache):
+    for component in ['H2O','O2','N2','Ar','CO2']:
+        for (T,P) in [(283.15,1.01325),(333.15,0.8),(400.0,1.2)]:
+            assert psyf.cachedEnthalpy(component,T,P)==psyf.componentEnthalpy.__wrapped__(component,T,P)
+
+
+def testRepeatedCallIsHit(emptyCache):
+    (t,p)=(Temperature(40,'C'),Pressure(101325,'Pa'))
+    first=lib.dryAirEnthalpy(t,p)
+    misses=lib.enthalpyCacheInfo()['component'].misses
+    assert misses==4 and lib.enthalpyCacheInfo()['component'].hits==0 # O2, N2, Ar, CO2
+    assert lib.dryAirEnthalpy(t,p)==first
+    info=lib.enthalpyCacheInfo()['component']
+    assert info.hits==4 and info.misses==misses
+
+
+def testReferencePerPressure(emptyCache):
+    p=Pressure(101325,'Pa')
+    for t in [10.0,20.0,30.0,40.0]: lib.dryAirEnthalpy(Temperature(t,'C'),p)
+    info=lib.enthalpyCacheInfo()['reference']
+    assert info.misses==4 and info.hits==12 # one residual enthalpy of every component at 298.15 K
+
+
+def testBoundedAndCleared(emptyCache):
+    p=Pressure(101325,'Pa'); size=psyf.enthalpy_cache_size
+    for k in range(size//4+10): lib.dryAirEnthalpy(Temperature(1+k*0.01,'C'),p)
+    assert lib.enthalpyCacheInfo()['component'].currsize==size
+    lib.clearEnthalpyCache()
+    info=lib.enthalpyCacheInfo()
+    assert info['component'].currsize==0 and info['component'].hits==0 and info['reference'].misses==0
+
+
+def testReferenceTemperature(emptyCache):
+    assert psyf.delHDryAir(Temperature(25,'C'),Pressure(101325,'Pa'))==(0.0,'J/mol')
+    assert lib.enthalpyCacheInfo()['component'].misses==0
@@ -0,0 +1,76 @@
+'''
+Module Name:'test_error_policy'
+Path:'<package_root>/test/test_error_policy.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, test_error_policy.py checks what the scalar functions, the \
+    constructors and the array functions do with an error under every error policy: \
+    print and return None, return None or NaN without printing, or raise ValueError; \
+    and the error code arrays of invalid elements.'
+Usage:
+    python -m pytest test
+Dependency: math, numpy, pytest, psychro.lib
+'''
+import math
+import numpy as np
+import pytest
+import psychro.lib as lib
+from psychro.lib import Temperature, Pressure
+
+# calls of scalar functions with an invalid input
+invalid_calls=[lambda: lib.moleFraction(Temperature(25,'C'),120,Pressure(101325,'Pa')),\
+    lambda: lib.satVaporPressure(Temperature(200,'C')),\
+    lambda: lib.dewPoint(Temperature(25,'C'),-3),\
+    lambda: lib.wetBulbTemperature(Temperature(25,'C'),50,None)]
+
+
+@pytest.mark.parametrize('call',invalid_calls)
+def testScalarPolicies(call, capsys):
+    with lib.errorPolicy('print'): assert call() is None
+    assert len(capsys.readouterr().out.splitlines())==1
+    with lib.errorPolicy('mask'): assert call() is None
+    with lib.errorPolicy('nan'): assert math.isnan(call())
+    assert capsys.readouterr().out==''
+    with lib.errorPolicy('raise'), pytest.raises(ValueError): call()
+
+
+def testConstructors(capsys):
+    with lib.errorPolicy('mask'):
+        Temperature(-500,'C'); Pressure(-1,'Pa'); Pressure(1,'parsec')
+    assert capsys.readouterr().out==''
+    for make in [lambda: Temperature(-500,'C'),lambda: Pressure(-1,'Pa'),lambda: Temperature('25','C')]:
+        with lib.errorPolicy('raise'), pytest.raises(ValueError): make()
+
+
+def testArraysWithoutOutput(capsys):
+    (t,rh,p)=([25.0,-5.0,30.0,40.0,float('nan')],[50.0,50.0,120.0,20.0,50.0],101325.0)
+    for policy in ['print','mask','nan']:
+        with lib.errorPolicy(policy):
+            (twb,iterations,valid)=lib.wetBulbTemperatureArray(t,rh,p)
+        assert valid.tolist()==[True,False,False,True,False] and np.isnan(twb[~valid]).all()
+    assert capsys.readouterr().out==''
+    assert lib.humidityErrorCodes(t,rh,p).tolist()==[0,2,3,0,1]
+    with lib.errorPolicy('raise'), pytest.raises(ValueError, match='element 1'):
+        lib.wetBulbTemperatureArray(t,rh,p)
+
+
+def testErrorCodesOfState():
+    with lib.errorPolicy('mask'):
+        state=lib.PsychroStateArray([25.0,-5.0,30.0,5.0],[50.0,50.0,120.0,5.0],101325.0)
+        assert state.errorCodes().tolist()==[0,2,3,0]
+        assert state.errorCodes('wetBulbTemperature').tolist()==[0,2,3,6] # wet bulb below 0 C
+    assert set(lib.error_codes)=={0,1,2,3,4,5,6}
+
+
+def testSetErrorPolicy():
+    policy=lib.getErrorPolicy()
+    try:
+        lib.setErrorPolicy('nan')
+        assert lib.getErrorPolicy()=='nan' and math.isnan(lib.satVaporPressure(Temperature(200,'C')))
+        with lib.errorPolicy('mask'): assert lib.getErrorPolicy()=='mask'
+        assert lib.getErrorPolicy()=='nan'
+    finally: lib.setErrorPolicy(policy)
+    with pytest.raises(ValueError): lib.setErrorPolicy('loud')
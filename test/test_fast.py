@@ -0,0 +1,66 @@
+'''
+Module Name:'test_fast'
+Path:'<package_root>/test/test_fast.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, test_fast.py checks that the plain float functions of \
+    psychro.fast give the results of the functions of psychro.lib on a grid of states \
+    around the branch point of Antoine equation, as floats, and NaN for invalid inputs.'
+Usage:
+    python -m pytest test
+Dependency: itertools, math, pytest, psychro.lib, psychro.fast
+'''
+import itertools
+import math
+import pytest
+import psychro.lib as lib
+import psychro.fast as fast
+from psychro.lib import Temperature, Pressure
+
+functions3=['moleFraction','absoluteHumidity','massFraction','volumetricHumidity','humidVolume',\
+    'humidDensity','humidMolarMass','wetBulbTemperature','humidAirEnthalpy','waterVaporEnthalpy',\
+    'directEnthalpy']
+functions2=['dewPoint','partialPressure','humidAirPressure']
+states=list(itertools.product([1.0,25.0,59.99,60.0,75.0,120.0],[5.0,50.0,100.0],[80000.0,101325.0]))
+
+
+# value() returns the float of a result of psychro.lib (None stays None)
+def value(r):
+    if isinstance(r,Temperature): return r.getCelcius()
+    if isinstance(r,Pressure): return r.getPascal()
+    return r[0] if isinstance(r,tuple) else r
+
+
+@pytest.mark.parametrize('name',functions3)
+def testEqualLib(name):
+    with lib.errorPolicy('mask'):
+        for (t,rh,p) in states:
+            expected=value(getattr(lib,name)(Temperature(t,'C'),rh,Pressure(p,'Pa')))
+            result=getattr(fast,name)(t,rh,p)
+            assert type(result) is float
+            if expected is None: assert math.isnan(result)
+            else: assert result==expected, (t,rh,p)
+
+
+@pytest.mark.parametrize('name',functions2)
+def testEqualLibOfTwo(name):
+    for (t,rh,p) in states:
+        assert getattr(fast,name)(t,rh)==value(getattr(lib,name)(Temperature(t,'C'),rh))
+
+
+def testSaturationAndDryAir():
+    for t in [0.0,25.0,60.0,150.0]:
+        p=fast.satVaporPressure(t)
+        assert p==lib.satVaporPressure(Temperature(t,'C')).getPascal()
+        assert fast.satTemperature(p)==lib.satTemperature(Pressure(p,'Pa')).getCelcius()
+        assert fast.dryAirEnthalpy(t,101325.0)==value(lib.dryAirEnthalpy(Temperature(t,'C'),Pressure(101325.0,'Pa')))
+    assert fast.satVaporPressure(25.0,'iapws')==lib.satVaporPressure(Temperature(25.0,'C'),'iapws').getPascal()
+
+
+def testInvalidIsNan():
+    assert math.isnan(fast.satVaporPressure(200.0))
+    assert math.isnan(fast.moleFraction(25.0,120.0,101325.0))
+    assert math.isnan(fast.wetBulbTemperature(-5.0,50.0,101325.0))
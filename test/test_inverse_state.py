@@ -0,0 +1,82 @@
+'''
+Module Name:'test_inverse_state'
+Path:'<package_root>/test/test_inverse_state.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, test_inverse_state.py checks that solveState() gives back the \
+    states of random dry bulb temperatures and relative humidities from every pair of \
+    state_pairs, and that the solved state gives back the given properties, with every \
+    saturation backend; dew points below 0 C included.'
+Usage:
+    python -m pytest test
+Dependency: numpy, pytest, psychro.lib, psychro.src.inverse_state
+'''
+import numpy as np
+import pytest
+import psychro.lib as lib
+from psychro.src.inverse_state import state_pairs
+
+backends=['antoine','table','magnus','hyland-wexler','iapws','antoine-blended']
+# tolerance (C) of the dry bulb temperature: the pairs of wet bulb temperature or enthalpy
+# inherit the tolerance 1e-6 C of the forward wet bulb solver
+temperature_tolerance={'relHumidity':1e-9,'dewPoint':1e-9,'humidityRatio':1e-9,\
+    'wetBulbTemperature':1e-5,'humidAirEnthalpy':1e-5}
+
+
+# randomStates() returns (temperature, relative humidity, pressure) arrays of random states;
+# the states of wet bulb temperature below 0 C (no forward enthalpy) are left out
+def randomStates(n=300, seed=1):
+    rng=np.random.default_rng(seed)
+    (t,rh,p)=(rng.uniform(1,90,n),rng.uniform(5,100,n),rng.uniform(80000,120000,n))
+    keep=np.isfinite(lib.wetBulbTemperatureArray(t,rh,p)[0])
+    return (t[keep],rh[keep],p[keep])
+
+
+# stateProperties() returns the properties of state_pairs of the states by the forward functions
+def stateProperties(t, rh, p):
+    state=lib.PsychroStateArray(t,rh,p)
+    return {'temperature':t,'relHumidity':rh,'dewPoint':state.dewPoint()[0],\
+        'wetBulbTemperature':state.wetBulbTemperature()[0],'humidityRatio':state.humidityRatio()[0],\
+        'humidAirEnthalpy':state.humidAirEnthalpy()[0]}
+
+
+@pytest.mark.parametrize('backend',backends)
+@pytest.mark.parametrize('pair',state_pairs)
+def testRoundTrip(backend, pair):
+    (t,rh,p)=randomStates()
+    with lib.saturationBackend(backend), lib.errorPolicy('mask'):
+        properties=stateProperties(t,rh,p)
+        state=lib.solveState({name:properties[name] for name in pair},p)
+        (solved,valid)=state.getTemperature()
+        assert valid.all()
+        name=pair[1] if pair[0]=='temperature' else pair[0]
+        assert np.max(np.abs(solved-t))<=temperature_tolerance[name]
+        if pair[0]=='temperature' and name in ['relHumidity','dewPoint','humidityRatio']:
+            given=properties[name]; back=stateProperties(solved,state.getRelHumidity()[0],p)[name]
+            assert np.allclose(back,given,rtol=1e-9,atol=1e-9)
+
+
+@pytest.mark.parametrize('backend',backends)
+def testDewPointBelowZero(backend):
+    t=np.array([40.0,40.0,25.0,5.0,0.5]); td=np.array([-20.0,-5.0,-0.5,-30.0,-0.01])
+    with lib.saturationBackend(backend), lib.errorPolicy('mask'):
+        state=lib.solveState({'temperature':t,'dewPoint':td},101325)
+        (dewPoint,valid)=state.dewPoint()
+        assert valid.all()
+        assert np.max(np.abs(dewPoint-td))<=1e-9
+
+
+def testUnitsAndShape():
+    t=np.array([[77.0,95.0],[104.0,50.0]]); rh=np.array([[50.0,20.0],[80.0,100.0]])
+    (properties,p)=(stateProperties((t-32)/1.8,rh,101325.0),np.full(t.shape,1.0))
+    state=lib.solveState({'temperature':t,'wetBulbTemperature':properties['wetBulbTemperature']*1.8+32},p,'F','atm')
+    assert state.getShape()==(2,2)
+    assert np.max(np.abs(state.getRelHumidity()[0]-rh))<=1e-4
+
+
+def testUnknownPair():
+    with pytest.raises(ValueError):
+        lib.solveState({'dewPoint':[10.0],'humidityRatio':[0.01]},101325)
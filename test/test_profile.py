@@ -0,0 +1,74 @@
+'''
+Module Name:'test_profile'
+Path:'<package_root>/test/test_profile.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, test_profile.py checks psychro.profile(): the nested call tree \
+    of the calls with their counts, times and solver iterations, the JSON export, that \
+    the original functions are put back, that only the thread of the profile is recorded \
+    and that profiles cannot be nested.'
+Usage:
+    python -m pytest test
+Dependency: json, threading, pytest, psychro, psychro.lib, psychro.src.psychro_functions
+'''
+import json
+import threading
+import pytest
+import psychro
+import psychro.lib as lib
+import psychro.src.psychro_functions as psyf
+from psychro.lib import Temperature, Pressure
+
+state=(Temperature(30,'C'),50,Pressure(101325,'Pa'))
+
+
+# child() returns the dict of the callee name of the node dict
+def child(node, name):
+    return next(c for c in node['children'] if c['name']==name)
+
+
+def testCallTree():
+    with psychro.profile() as p:
+        for k in range(3): lib.humidAirEnthalpy(*state)
+    tree=p.toDict()
+    enthalpy=child(tree,'humidAirEnthalpy'); wetBulb=child(enthalpy,'wetBulbTemperature')
+    assert enthalpy['calls']==3 and wetBulb['calls']==3 and enthalpy['module']=='psychro_functions'
+    (twb,iterations)=psyf.wetBulbValue(30.0,lib.massFraction(*state)[0],101325.0)
+    assert wetBulb['iterations']==3*iterations
+    assert tree['cumulative']>=enthalpy['cumulative']>=wetBulb['cumulative']>0
+    assert enthalpy['self']==pytest.approx(enthalpy['cumulative']-sum(c['cumulative'] for c in enthalpy['children']))
+    assert 'humidAirEnthalpy' in p.report(depth=1) and 'wetBulbTemperature' not in p.report(depth=1)
+
+
+def testArrayIterations():
+    with psychro.profile() as p:
+        (twb,iterations,valid)=lib.wetBulbTemperatureArray([20.0,30.0,40.0],[50.0,50.0,50.0],101325)
+    node=child(child(p.toDict(),'wetBulbTemperatureArray'),'wetBulbSolve')
+    assert node['iterations']==iterations.sum()
+
+
+def testJSON(tmp_path):
+    with psychro.profile() as p: lib.dewPoint(Temperature(25,'C'),50)
+    path=str(tmp_path/'profile.json')
+    text=p.toJSON(path)
+    with open(path) as f: assert json.load(f)==json.loads(text)==p.toDict()
+
+
+def testRestoredAndNotNested():
+    original=psyf.wetBulbTemperature
+    with psychro.profile():
+        assert psyf.wetBulbTemperature is not original
+        with pytest.raises(ValueError):
+            with psychro.profile(): pass
+    assert psyf.wetBulbTemperature is original
+
+
+def testOtherThreadNotRecorded():
+    with psychro.profile() as p:
+        thread=threading.Thread(target=lambda: lib.humidVolume(*state)); thread.start(); thread.join()
+        lib.dewPoint(Temperature(25,'C'),50)
+    names=[c['name'] for c in p.toDict()['children']]
+    assert 'dewPoint' in names and 'humidVolume' not in names
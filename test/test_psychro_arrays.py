@@ -0,0 +1,63 @@
+'''
+Module Name:'test_psychro_arrays'
+Path:'<package_root>/test/test_psychro_arrays.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, test_psychro_arrays.py checks that the fused saturation enthalpy \
+    kernel of the array functions gives the same bits as the scalar function \
+    humidSaturationEnthalpy() on a grid of temperatures and pressures, with every \
+    saturation backend, and that the component enthalpies of PsychroStateArray take \
+    2-D arrays.'
+Usage:
+    python -m pytest test
+Dependency: numpy, pytest, psychro.lib
+'''
+import numpy as np
+import pytest
+import psychro.lib as lib
+from psychro.lib import Temperature, Pressure
+
+# grid of the checks: 0-150 C and pressures around the site pressures
+temperatures=[k*0.5 for k in range(301)]+[0.01,25.0,59.99,60.0,60.01,99.97]
+pressures=[80000.0,95000.0,101325.0,120000.0]
+
+
+# scalarEnthalpies() returns the humidSaturationEnthalpy() values of the grid (NaN for None)
+def scalarEnthalpies(p):
+    values=[lib.humidSaturationEnthalpy(Temperature(t,'C'),Pressure(p,'Pa')) for t in temperatures]
+    return np.array([np.nan if v is None else v[0] for v in values])
+
+
+@pytest.mark.parametrize('backend',['antoine','table','magnus','hyland-wexler','iapws','antoine-blended'])
+def testSaturationEnthalpyKernel(backend):
+    with lib.saturationBackend(backend), lib.errorPolicy('mask'):
+        for p in pressures:
+            (h,valid)=lib.humidSaturationEnthalpyArray(temperatures,p)
+            expected=scalarEnthalpies(p)
+            assert np.array_equal(np.isnan(expected),~valid)
+            assert np.array_equal(h[valid],expected[valid]) # same bits, not only close
+
+
+def testSaturationEnthalpyUnits():
+    (h,valid)=lib.humidSaturationEnthalpyArray([77.0],[1.0],'F','atm')
+    assert h[0]==lib.humidSaturationEnthalpy(Temperature(77.0,'F'),Pressure(1.0,'atm'))[0]
+    (h,valid)=lib.humidSaturationEnthalpyArray([298.15],[101.325],'K','kPa')
+    assert h[0]==lib.humidSaturationEnthalpy(Temperature(298.15,'K'),Pressure(101.325,'kPa'))[0]
+
+
+# 2-D states of the component enthalpies (C, %)
+states2d=(np.array([[25.0,40.0,0.5],[60.0,80.0,120.0]]),np.array([[50.0,20.0,100.0],[80.0,100.0,5.0]]))
+
+
+@pytest.mark.parametrize('method',['dryAirEnthalpy','waterVaporEnthalpy'])
+def testComponentEnthalpy2D(method):
+    (t,rh)=states2d; p=101325.0
+    (h,valid)=getattr(lib.PsychroStateArray(t,rh,p),method)()
+    assert h.shape==t.shape and valid.all()
+    args=lambda ti,rhi: (Temperature(ti,'C'),Pressure(p,'Pa')) if method=='dryAirEnthalpy' \
+        else (Temperature(ti,'C'),rhi,Pressure(p,'Pa'))
+    expected=[getattr(lib,method)(*args(ti,rhi))[0] for (ti,rhi) in zip(t.ravel().tolist(),rh.ravel().tolist())]
+    assert np.allclose(h.ravel(),expected,rtol=1e-12,atol=0)
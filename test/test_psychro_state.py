@@ -0,0 +1,91 @@
+'''
+Module Name:'test_psychro_state'
+Path:'<package_root>/test/test_psychro_state.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, test_psychro_state.py checks that PsychroState gives the \
+    results of the functions of psychro.lib, evaluates the saturated vapor pressure once \
+    per state, calculates every property once, and that PsychroStateArray gives the \
+    results of PsychroState element by element.'
+Usage:
+    python -m pytest test
+Dependency: numpy, pytest, psychro.lib, psychro.src.psychro_functions
+'''
+import numpy as np
+import pytest
+import psychro.lib as lib
+import psychro.src.psychro_functions as psyf
+from psychro.lib import Temperature, Pressure
+
+# properties of (temperature, relative humidity, pressure); dewPoint of (temperature, relative humidity)
+properties3=['moleFraction','absoluteHumidity','massFraction','volumetricHumidity','humidVolume',\
+    'humidDensity','humidMolarMass','wetBulbTemperature','humidAirEnthalpy','directEnthalpy']
+states=[(25.0,50.0,101325.0),(5.0,90.0,95000.0),(40.0,20.0,120000.0),(80.0,30.0,101325.0)]
+
+
+# value() returns the float of a result of a function or a method
+def value(r):
+    if isinstance(r,(Temperature,Pressure)): return r.getValue()
+    return r[0] if isinstance(r,tuple) else r
+
+
+@pytest.mark.parametrize('state',states)
+def testEqualFunctions(state):
+    (t,rh,p)=(Temperature(state[0],'C'),state[1],Pressure(state[2],'Pa'))
+    psychroState=lib.PsychroState(t,rh,p)
+    assert psychroState.isValid()
+    for name in properties3:
+        expected=value(getattr(lib,name)(t,rh,p))
+        assert value(getattr(psychroState,name)())==pytest.approx(expected,rel=1e-9,abs=1e-9), name
+    assert value(psychroState.dewPoint())==pytest.approx(value(lib.dewPoint(t,rh)),abs=1e-9)
+    assert psychroState.satVaporPressure().getPascal()==pytest.approx(lib.satVaporPressure(t).getPascal(),rel=1e-12)
+
+
+# counting() replaces the function name of psychro_functions by a wrapper that counts its calls
+def counting(monkeypatch, name):
+    calls=[0]; fn=getattr(psyf,name)
+    def wrapper(*args):
+        calls[0]+=1; return fn(*args)
+    monkeypatch.setattr(psyf,name,wrapper)
+    return calls
+
+
+def testOneSaturationEvaluation(monkeypatch):
+    calls=counting(monkeypatch,'satPressureValue')
+    state=lib.PsychroState(Temperature(30,'C'),60,Pressure(101325,'Pa'))
+    for name in ['moleFraction','absoluteHumidity','massFraction','volumetricHumidity','humidVolume',\
+        'humidDensity','humidMolarMass','humidSaturationEnthalpy','directEnthalpy','partialPressure']:
+        getattr(state,name)()
+    assert calls[0]==1
+
+
+def testLazyCache(monkeypatch):
+    calls=counting(monkeypatch,'wetBulbValue')
+    state=lib.PsychroState(Temperature(30,'C'),60,Pressure(101325,'Pa'))
+    assert calls[0]==0 # nothing is solved before it is asked for
+    first=state.wetBulbTemperature().getCelcius()
+    assert state.wetBulbTemperature().getCelcius()==first and state.humidAirEnthalpy() is not None
+    assert calls[0]==1
+
+
+def testInvalidState():
+    with lib.errorPolicy('mask'):
+        state=lib.PsychroState(Temperature(25,'C'),120,Pressure(101325,'Pa'))
+        assert not state.isValid()
+        assert state.moleFraction() is None and state.wetBulbTemperature() is None
+    with lib.errorPolicy('raise'), pytest.raises(ValueError):
+        lib.PsychroState(Temperature(200,'C'),50,Pressure(101325,'Pa'))
+
+
+def testArrayEqualScalar():
+    (t,rh,p)=[np.array(column) for column in zip(*states)]
+    stateArray=lib.PsychroStateArray(t,rh,p)
+    assert stateArray.getShape()==t.shape and stateArray.getValidMask().all()
+    for name in properties3:
+        (values,valid)=getattr(stateArray,name)()
+        expected=[value(getattr(lib.PsychroState(Temperature(a,'C'),b,Pressure(c,'Pa')),name)()) \
+            for (a,b,c) in states]
+        assert valid.all() and np.allclose(values,expected,rtol=1e-9,atol=1e-6), name
@@ -0,0 +1,61 @@
+'''
+Module Name:'test_saturation_arrays'
+Path:'<package_root>/test/test_saturation_arrays.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, test_saturation_arrays.py checks that satVaporPressureArray() \
+    and satTemperatureArray() give the results of the scalar functions satVaporPressure() \
+    and satTemperature() on both branches of Antoine equation, in every unit and shape, \
+    and mask the elements out of 0 - 150 C.'
+Usage:
+    python -m pytest test
+Dependency: numpy, pytest, psychro.lib
+'''
+import numpy as np
+import pytest
+import psychro.lib as lib
+from psychro.lib import Temperature, Pressure
+
+# temperatures of both branches of Antoine equation (C)
+temperatures=[0.0,0.01,10.0,25.0,40.0,59.99,60.0,60.01,80.0,100.0,125.5,150.0]
+
+
+def testVaporPressureEqualScalar():
+    (p,valid)=lib.satVaporPressureArray(temperatures)
+    assert valid.all()
+    expected=[lib.satVaporPressure(Temperature(t,'C')).getPascal() for t in temperatures]
+    assert np.allclose(p,expected,rtol=1e-12,atol=0)
+
+
+def testTemperatureEqualScalar():
+    pressures=[lib.satVaporPressure(Temperature(t,'C')).getPascal() for t in temperatures]
+    (t,valid)=lib.satTemperatureArray(pressures)
+    assert valid.all()
+    expected=[lib.satTemperature(Pressure(p,'Pa')).getCelcius() for p in pressures]
+    assert np.allclose(t,expected,rtol=0,atol=1e-9)
+    assert np.allclose(t,temperatures,rtol=0,atol=1e-2) # the step of Antoine equation at 60 C
+
+
+@pytest.mark.parametrize('unit,values',[('F',[77.0,212.0]),('K',[298.15,373.15])])
+def testTemperatureUnits(unit, values):
+    (p,valid)=lib.satVaporPressureArray(values,unit)
+    expected=[lib.satVaporPressure(Temperature(v,unit)).getPascal() for v in values]
+    assert valid.all() and np.allclose(p,expected,rtol=1e-12,atol=0)
+
+
+def testPressureUnits():
+    (t,valid)=lib.satTemperatureArray([1.0,0.5],'atm')
+    expected=[lib.satTemperature(Pressure(v,'atm')).getCelcius() for v in [1.0,0.5]]
+    assert valid.all() and np.allclose(t,expected,rtol=0,atol=1e-9)
+
+
+def testShapeAndMask():
+    t=np.array([[-5.0,25.0],[150.0,151.0]])
+    with lib.errorPolicy('mask'):
+        (p,valid)=lib.satVaporPressureArray(t)
+        assert lib.satVaporPressure(Temperature(-5.0,'C')) is None
+    assert p.shape==t.shape and valid.tolist()==[[False,True],[True,False]]
+    assert np.isnan(p[~valid]).all()
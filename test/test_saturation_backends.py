@@ -0,0 +1,79 @@
+'''
+Module Name:'test_saturation_backends'
+Path:'<package_root>/test/test_saturation_backends.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, test_saturation_backends.py checks the saturation backends: \
+    the verification values of IAPWS-IF97 region 4, the errors of the other correlations \
+    against IAPWS-IF97 given in the README, the inverse of every backend, the equal \
+    scalar and array functions, and the selection of a backend per call, per with \
+    statement and for all threads.'
+Usage:
+    python -m pytest test
+Dependency: numpy, pytest, psychro.lib
+'''
+import numpy as np
+import pytest
+import psychro.lib as lib
+from psychro.lib import Temperature, Pressure
+
+backends=['antoine','table','magnus','hyland-wexler','iapws','antoine-blended']
+# maximum relative error of the vapor pressure against IAPWS-IF97 over 0 - 150 C (README)
+relative_errors={'antoine':3.8e-3,'table':3.8e-3,'magnus':7.0e-2,'hyland-wexler':2.0e-4,'antoine-blended':3.8e-3}
+temperatures=np.linspace(0,150,601)
+
+
+def testIAPWSVerificationValues():
+    # IAPWS-IF97, tables 35 and 36: ps(300 K)=3.53658941e-3 MPa, Ts(0.1 MPa)=372.755919 K
+    assert lib.satVaporPressure(Temperature(300,'K'),'iapws').getPascal()==pytest.approx(3536.58941,rel=1e-9)
+    assert lib.satTemperature(Pressure(0.1,'MPa'),'iapws').getKelvin()==pytest.approx(372.755919,abs=1e-6)
+
+
+@pytest.mark.parametrize('backend',sorted(relative_errors))
+def testErrorAgainstIAPWS(backend):
+    reference=lib.satVaporPressureArray(temperatures,'C','iapws')[0]
+    (p,valid)=lib.satVaporPressureArray(temperatures,'C',backend)
+    assert valid.all()
+    error=np.max(np.abs(p/reference-1))
+    assert relative_errors[backend]/2<error<=relative_errors[backend]*1.05
+
+
+@pytest.mark.parametrize('backend',backends)
+def testInverse(backend):
+    with lib.saturationBackend(backend):
+        p=lib.satVaporPressureArray(temperatures)[0]
+        (t,valid)=lib.satTemperatureArray(p)
+    assert valid.all()
+    # the two branches of Antoine equation do not meet at 60 C
+    tolerance=1e-2 if backend in ['antoine','table'] else 1e-9
+    assert np.max(np.abs(t-temperatures))<=tolerance
+
+
+@pytest.mark.parametrize('backend',backends)
+def testScalarEqualArray(backend):
+    (p,valid)=lib.satVaporPressureArray(temperatures[::20],'C',backend)
+    scalar=[lib.satVaporPressure(Temperature(float(t),'C'),backend).getPascal() for t in temperatures[::20]]
+    assert np.allclose(p,scalar,rtol=1e-12,atol=0)
+    (t,valid)=lib.satTemperatureArray(p,'Pa',backend)
+    scalar=[lib.satTemperature(Pressure(float(x),'Pa'),backend).getCelcius() for x in p]
+    assert np.allclose(t,scalar,rtol=0,atol=1e-9)
+
+
+def testSelection():
+    t=Temperature(25,'C')
+    antoine=lib.satVaporPressure(t).getPascal()
+    magnus=lib.satVaporPressure(t,'magnus').getPascal()
+    assert magnus!=antoine and lib.getSaturationBackend()=='antoine'
+    with lib.saturationBackend('magnus'):
+        assert lib.getSaturationBackend()=='magnus' and lib.satVaporPressure(t).getPascal()==magnus
+        assert lib.satVaporPressure(t,'antoine').getPascal()==antoine # the backend of one call
+        assert lib.moleFraction(t,100,Pressure(magnus,'Pa'))==pytest.approx(1.0,rel=1e-12)
+    assert lib.satVaporPressure(t).getPascal()==antoine
+    try:
+        lib.setSaturationBackend('iapws')
+        assert lib.satVaporPressure(t).getPascal()==lib.satVaporPressure(t,'iapws').getPascal()
+    finally: lib.setSaturationBackend('antoine')
+    with pytest.raises(ValueError): lib.setSaturationBackend('steam')
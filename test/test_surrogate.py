@@ -0,0 +1,83 @@
+'''
+Module Name:'test_surrogate'
+Path:'<package_root>/test/test_surrogate.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, test_surrogate.py checks the wet bulb surrogate of a small \
+    domain: its error against the exact solver within tol, the exact solver for the \
+    states outside the domain and for another saturation backend, the equal scalar and \
+    array results, and that a saved surrogate is loaded instead of fitted again.'
+Usage:
+    python -m pytest test
+Dependency: numpy, pytest, psychro.lib, psychro.fast, psychro.surrogate
+'''
+import numpy as np
+import pytest
+import psychro.lib as lib
+import psychro.fast as fast
+import psychro.surrogate as sur
+
+pressure=101325.0
+# small surrogate of the tests (fitted in a fraction of a second)
+settings={'temperature':(10.0,40.0),'relHumidity':(20.0,80.0),'patches':(6,4),'degree':5,'tol':1e-5}
+
+
+@pytest.fixture(scope='module')
+def surrogate():
+    return sur.WetBulbSurrogate(pressure,**settings)
+
+
+# randomStates() returns (temperature, relative humidity) arrays of random states in the box
+def randomStates(temperature, relHumidity, n=400, seed=3):
+    rng=np.random.default_rng(seed)
+    return (rng.uniform(*temperature,n),rng.uniform(*relHumidity,n))
+
+
+def testErrorBound(surrogate):
+    assert surrogate.coverage()==1.0 and surrogate.maxError()<=settings['tol']
+    (t,rh)=randomStates(settings['temperature'],settings['relHumidity'])
+    (twb,valid)=surrogate.wetBulbTemperatureArray(t,rh)
+    exact=lib.wetBulbTemperatureArray(t,rh,pressure,tol=1e-10)[0]
+    assert valid.all() and np.max(np.abs(twb-exact))<=settings['tol']
+
+
+def testScalarEqualArray(surrogate):
+    (t,rh)=randomStates(settings['temperature'],settings['relHumidity'],n=50)
+    twb=surrogate.wetBulbTemperatureArray(t,rh)[0]
+    scalar=[surrogate.wetBulbTemperature(a,b) for (a,b) in zip(t.tolist(),rh.tolist())]
+    assert np.allclose(twb,scalar,rtol=0,atol=1e-12)
+
+
+def testExactOutsideDomain(surrogate):
+    (t,rh)=(np.array([5.0,60.0,25.0,25.0]),np.array([50.0,50.0,10.0,100.0]))
+    (twb,valid)=surrogate.wetBulbTemperatureArray(t,rh)
+    (exact,iterations,exactValid)=lib.wetBulbTemperatureArray(t,rh,pressure)
+    assert np.array_equal(valid,exactValid) and np.array_equal(twb[valid],exact[valid])
+    assert surrogate.wetBulbTemperature(60.0,50.0)==fast.wetBulbTemperature(60.0,50.0,pressure)
+
+
+def testExactForOtherBackend(surrogate):
+    (t,rh)=(np.array([20.0,30.0]),np.array([40.0,60.0]))
+    with lib.saturationBackend('iapws'):
+        twb=surrogate.wetBulbTemperatureArray(t,rh)[0]
+        assert np.array_equal(twb,lib.wetBulbTemperatureArray(t,rh,pressure)[0])
+        assert surrogate.wetBulbTemperature(20.0,40.0)==fast.wetBulbTemperature(20.0,40.0,pressure)
+
+
+def testSaveAndLoad(surrogate, tmp_path, monkeypatch):
+    path=str(tmp_path/'site.npz')
+    surrogate.save(path)
+    loaded=sur.loadSurrogate(path)
+    (t,rh)=randomStates(settings['temperature'],settings['relHumidity'],n=50)
+    assert np.array_equal(loaded.wetBulbTemperatureArray(t,rh)[0],surrogate.wetBulbTemperatureArray(t,rh)[0])
+    # wetBulbSurrogate() loads the file of the same settings instead of fitting again
+    sur.clearSurrogates()
+    monkeypatch.setattr(sur.WetBulbSurrogate,'fit',lambda self: pytest.fail('fitted again'))
+    try:
+        first=sur.wetBulbSurrogate(pressure,path,**settings)
+        assert sur.wetBulbSurrogate(pressure,path,**settings) is first # kept in memory
+        assert np.array_equal(first.wetBulbTemperatureArray(t,rh)[0],surrogate.wetBulbTemperatureArray(t,rh)[0])
+    finally: sur.clearSurrogates()
@@ -0,0 +1,125 @@
+'''
+Module Name:'test_thread_safety'
+Path:'<package_root>/test/test_thread_safety.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, test_thread_safety.py calls the core functions of psychro.lib and \
+    the PsychroState methods from many threads at once on shared Temperature and Pressure \
+    objects of several units and checks that the results are the results of the serial \
+    calls and that the shared objects are not changed; the saturation backend and the \
+    error policy of a with statement must not reach the other threads.'
+Usage:
+    python -m pytest test
+Dependency: sys, itertools, threading, concurrent.futures, pytest, psychro.lib
+'''
+import sys
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import psychro.lib as lib
+from psychro.lib import Temperature, Pressure
+
+# functions of (temperature, relative humidity, pressure) and of (temperature, relative humidity)
+functions3=['moleFraction','absoluteHumidity','massFraction','volumetricHumidity','vaporDensity','humidVolume',\
+    'humidDensity','humidMolarMass','wetBulbTemperature','humidAirEnthalpy','waterVaporEnthalpy',\
+    'directEnthalpy']
+functions2=['humidAirPressure','dewPoint','saturatedTemperature','partialPressure']
+# methods of PsychroState
+state_methods=['dewPoint','wetBulbTemperature','humidAirEnthalpy','humidityRatio','humidVolume']
+
+
+# result() returns a comparable value of the result of a call
+def result(r):
+    if isinstance(r,(Temperature,Pressure)): return (r.getValue(),r.getUnit())
+    return r
+
+
+# call() returns the result of the task (function name, arguments); 'state.' names are
+# methods of a new PsychroState of the arguments
+def call(task):
+    (name,args)=task
+    if name.startswith('state.'): return result(getattr(lib.PsychroState(*args),name[6:])())
+    return result(getattr(lib,name)(*args))
+
+
+# sharedInputs() returns the shared temperatures and pressures in several units
+def sharedInputs():
+    temperatures=[Temperature(25,'C'),Temperature(308.15,'K'),Temperature(50,'F'),Temperature(60,'C'),Temperature(72.5,'C')]
+    pressures=[Pressure(101325,'Pa'),Pressure(1,'atm'),Pressure(0.9,'bar'),Pressure(95,'kPa'),Pressure(14.7,'psi')]
+    return (temperatures,pressures)
+
+
+# makeTasks() returns the tasks of every function, method and shared input
+def makeTasks(temperatures, pressures):
+    tasks=[]
+    for (t,rh) in itertools.product(temperatures,[10,45.5,80,100]):
+        tasks+=[(name,(t,rh)) for name in functions2]
+        tasks+=[(name,(t,rh,p)) for name in functions3 for p in pressures]
+        tasks+=[('state.'+name,(t,rh,p)) for name in state_methods for p in pressures[:2]]
+        tasks+=[('humidSaturationEnthalpy',(t,)),('satVaporPressure',(t,))]
+    tasks+=[('satTemperature',(p,)) for p in pressures]
+    return tasks
+
+
+@pytest.fixture
+def fastSwitching():
+    interval=sys.getswitchinterval(); sys.setswitchinterval(1e-6) # switch threads as often as possible
+    yield
+    sys.setswitchinterval(interval)
+
+
+def testThreadsEqualSerial(fastSwitching):
+    (temperatures,pressures)=sharedInputs()
+    before=[(x.getValue(),x.getUnit()) for x in temperatures+pressures]
+    tasks=makeTasks(temperatures,pressures)*3
+    with lib.errorPolicy('mask'):
+        serial=[call(task) for task in tasks]
+    # new threads start with the default error policy; set it for all threads
+    policy=lib.getErrorPolicy(); lib.setErrorPolicy('mask')
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool: concurrent=list(pool.map(call,tasks))
+    finally: lib.setErrorPolicy(policy)
+    mismatches=[task for (task,a,b) in zip(tasks,serial,concurrent) if a!=b and not (a!=a and b!=b)]
+    assert mismatches==[]
+    assert [(x.getValue(),x.getUnit()) for x in temperatures+pressures]==before
+
+
+def testArraysInThreads(fastSwitching):
+    t=[k*0.25 for k in range(400)]; rh=[(k*7)%101 for k in range(400)]
+    with lib.errorPolicy('mask'):
+        expected=lib.wetBulbTemperatureArray(t,rh,101325)[0]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results=list(pool.map(lambda k: lib.wetBulbTemperatureArray(t,rh,101325)[0],range(16)))
+    for r in results: assert ((r==expected)|((r!=r)&(expected!=expected))).all()
+
+
+# inOtherThread() returns what fn() returns in another thread while the calling thread is
+# inside the with statement of the context
+def inOtherThread(context, fn):
+    out={}; entered=threading.Event(); finished=threading.Event()
+    def other():
+        entered.wait(); out['value']=fn(); finished.set()
+    thread=threading.Thread(target=other); thread.start()
+    with context:
+        entered.set(); finished.wait(); inside=fn()
+    thread.join()
+    return (inside,out['value'])
+
+
+def testSaturationBackendOfThread():
+    satp=lambda: (lib.getSaturationBackend(),lib.satVaporPressure(Temperature(25,'C')).getPascal())
+    (inside,other)=inOtherThread(lib.saturationBackend('magnus'),satp)
+    assert inside[0]=='magnus' and other[0]=='antoine'
+    assert inside[1]!=other[1] and other[1]==satp()[1]
+
+
+def testErrorPolicyOfThread():
+    policy=lib.getErrorPolicy() # the policy of all threads
+    invalid=lambda: (lib.getErrorPolicy(),lib.satVaporPressure(Temperature(200,'C')))
+    (inside,other)=inOtherThread(lib.errorPolicy('nan'),invalid)
+    assert inside[0]=='nan' and inside[1]!=inside[1]
+    assert other[0]==policy and other[1] is None
@@ -0,0 +1,72 @@
+'''
+Module Name:'test_value_arrays'
+Path:'<package_root>/test/test_value_arrays.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, test_value_arrays.py checks that TemperatureArray and \
+    PressureArray convert their values in place in the buffer of float64, as Temperature \
+    and Pressure convert one value, and that the array functions take them directly \
+    without changing them.'
+Usage:
+    python -m pytest test
+Dependency: numpy, pytest, psychro.lib
+'''
+import numpy as np
+import pytest
+import psychro.lib as lib
+from psychro.lib import Temperature, Pressure, TemperatureArray, PressureArray
+
+temperatures=[0.0,25.0,60.0,100.0]
+pressures=[80000.0,101325.0,120000.0]
+
+
+@pytest.mark.parametrize('method',['toC','toF','toK'])
+def testTemperatureInPlace(method):
+    for unit in ['C','F','K']:
+        values=TemperatureArray(temperatures,'C'); getattr(values,'to'+unit)()
+        buffer=values.getValues(); getattr(values,method)()
+        assert values.getValues() is buffer and buffer.dtype==np.float64
+        expected=[]
+        for t in temperatures:
+            temperature=Temperature(t,'C'); getattr(temperature,'to'+unit)(); getattr(temperature,method)()
+            expected.append(temperature.getValue())
+        assert values.getUnit()==method[2:] and np.allclose(buffer,expected,rtol=1e-12,atol=1e-12)
+
+
+@pytest.mark.parametrize('method',['toPa','tobar','toatm','tomHg','topsi','totorr'])
+def testPressureInPlace(method):
+    values=PressureArray([p/1000 for p in pressures],'kPa')
+    buffer=values.getValues(); getattr(values,method)()
+    assert values.getValues() is buffer
+    expected=[]
+    for p in pressures:
+        pressure=Pressure(p,'Pa'); getattr(pressure,method)(); expected.append(pressure.getValue())
+    assert np.allclose(buffer,expected,rtol=1e-12,atol=0)
+
+
+def testItemsAndSlices():
+    values=TemperatureArray([[25.0,30.0],[35.0,40.0]],'F')
+    assert values.getShape()==(2,2) and len(values)==2
+    item=values[0,1]
+    assert isinstance(item,Temperature) and (item.getValue(),item.getUnit())==(30.0,'F')
+    assert isinstance(values[1],TemperatureArray) and values[1].getValues().tolist()==[35.0,40.0]
+    copy=values.copy(); copy.toC()
+    assert values.getUnit()=='F' and values.getValues()[0,0]==25.0
+
+
+def testArrayFunctionsTakeValueArrays():
+    t=TemperatureArray([t*1.8+32 for t in temperatures],'F'); p=PressureArray([1.0]*len(temperatures),'atm')
+    (expected,valid)=lib.satVaporPressureArray(temperatures)
+    assert np.allclose(lib.satVaporPressureArray(t)[0],expected,rtol=1e-12)
+    (twb,iterations,valid)=lib.wetBulbTemperatureArray(t,[50.0]*len(temperatures),p)
+    (expectedTwb,iterations,expectedValid)=lib.wetBulbTemperatureArray(temperatures,[50.0]*len(temperatures),101325.0)
+    assert np.array_equal(valid,expectedValid) and np.allclose(twb[valid],expectedTwb[valid],atol=1e-6)
+    assert t.getUnit()=='F' and p.getUnit()=='atm' and p.getValues().tolist()==[1.0]*len(temperatures)
+
+
+def testInvalidUnit():
+    with pytest.raises(ValueError): TemperatureArray([25.0],'Pa')
+    with pytest.raises(ValueError): PressureArray([1.0],'C')
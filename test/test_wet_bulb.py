@@ -0,0 +1,91 @@
+'''
+Module Name:'test_wet_bulb'
+Path:'<package_root>/test/test_wet_bulb.py'
+Version:'1.0.0.2026.10.18'
+Author:'A K M Aminul Islam'
+Author_Email:'aminul71bd@gmail.com'
+Company:'Newtonia Ltd.'
+Last Update:2026/10/18
+Description:'This module, test_wet_bulb.py checks the wet bulb temperature solvers: the \
+    array solver against the scalar function, its tolerance and iteration counts, the \
+    warm start of time series and the errors of the Ferrel iteration of \
+    calculateWetBulbTemperature() near 0 C.'
+Usage:
+    python -m pytest test
+Dependency: numpy, pytest, psychro.lib, psychro.src.psychro_functions
+'''
+import numpy as np
+import pytest
+import psychro.lib as lib
+import psychro.src.psychro_functions as psyf
+from psychro.lib import Temperature, Pressure
+
+
+# series() returns (temperature, relative humidity) arrays of an hourly day of two channels
+def series(hours=48):
+    k=np.arange(hours)[:,None]
+    t=np.hstack([20+8*np.sin(k*np.pi/12),45+5*np.sin(k*np.pi/12+1)])
+    rh=np.hstack([60-20*np.sin(k*np.pi/12),30+10*np.cos(k*np.pi/12)])
+    return (t,rh)
+
+
+# states of the array solver (C, %)
+states=(np.array([5.0,25.0,40.0,80.0,120.0]),np.array([90.0,50.0,20.0,30.0,10.0]))
+
+
+def testArrayEqualScalar():
+    (t,rh)=states
+    (twb,iterations,valid)=lib.wetBulbTemperatureArray(t,rh,101325)
+    expected=[lib.wetBulbTemperature(Temperature(a,'C'),b,Pressure(101325,'Pa')).getCelcius() \
+        for (a,b) in zip(t.tolist(),rh.tolist())]
+    assert valid.all() and np.max(np.abs(twb-expected))<=1e-6
+    assert iterations.shape==t.shape and (iterations>0).all()
+
+
+def testArrayToleranceAndIterationLimit():
+    (t,rh)=states
+    (coarse,coarseIterations,valid)=lib.wetBulbTemperatureArray(t,rh,101325,tol=1e-2)
+    (fine,fineIterations,fineValid)=lib.wetBulbTemperatureArray(t,rh,101325,tol=1e-9)
+    assert valid.all() and fineValid.all()
+    assert np.max(np.abs(coarse-fine))<=1e-2 and (coarseIterations<=fineIterations).all()
+    assert coarseIterations.sum()<fineIterations.sum()
+    with lib.errorPolicy('mask'):
+        (twb,iterations,valid)=lib.wetBulbTemperatureArray(t,rh,101325,maxIter=3)
+    assert not valid.any() and np.isnan(twb).all() and (iterations==3).all()
+
+
+def testSeriesEqualColdStart():
+    (t,rh)=series()
+    with lib.errorPolicy('mask'):
+        (twb,iterations,valid)=lib.wetBulbSeries(t,rh,101325)
+        (cold,coldIterations,coldValid)=lib.wetBulbTemperatureArray(t,rh,101325)
+    assert valid.all() and coldValid.all()
+    assert np.max(np.abs(twb-cold))<=1e-5
+    assert iterations.sum()<coldIterations.sum()
+
+
+def testWarmStartOfScalarFunctions():
+    (t,rh,p)=(Temperature(35,'C'),40,Pressure(101325,'Pa'))
+    for name in ['wetBulbTemperature','calculateWetBulbTemperature']:
+        cold=getattr(psyf,name)(t,rh,p).getCelcius()
+        warm=getattr(psyf,name)(t,rh,p,start=Temperature(cold+0.5,'C')).getCelcius()
+        assert abs(warm-cold)<=1e-5
+
+
+# the Ferrel iteration near 0 C: one error of the error policy, no chain of errors
+@pytest.mark.parametrize('state',[(0,50),(0.5,50),(5,5),(10,5)])
+def testFerrelErrorNearZero(state, capsys):
+    (t,rh)=state
+    with lib.errorPolicy('print'):
+        assert psyf.calculateWetBulbTemperature(Temperature(t,'C'),rh,Pressure(101325,'Pa')) is None
+    assert len(capsys.readouterr().out.splitlines())==1
+    with lib.errorPolicy('raise'), pytest.raises(ValueError, match='Wet bulb temperature'):
+        psyf.calculateWetBulbTemperature(Temperature(t,'C'),rh,Pressure(101325,'Pa'))
+
+
+def testFerrelIterationLimit():
+    with lib.errorPolicy('raise'):
+        twb=psyf.calculateWetBulbTemperature(Temperature(25,'C'),50,Pressure(101325,'Pa'))
+        assert 17.5<twb.getCelcius()<18.5
+        with pytest.raises(ValueError, match='does not converge'):
+            psyf.calculateWetBulbTemperature(Temperature(12,'C'),45,Pressure(101325,'Pa'))